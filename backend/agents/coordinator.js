@@ -100,7 +100,7 @@ class CoordinatorAgent {
     
     // Initialize OpenAI client for embeddings
     this.openaiClient = axios.create({
-      baseURL: 'https://api.openai.com/v1',
+      baseURL: process.env.OPENAI_BASE_URL || 'https://api.openai.com/v1',
       headers: {
         'Authorization': `Bearer ${process.env.OPENAI_API_KEY}`,
         'Content-Type': 'application/json'
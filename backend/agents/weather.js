@@ -302,7 +302,7 @@ End with "Sources: [list specific EPA documents, NFPA codes, NWS data, meteorolo
       }
       
       // Generate semantic embedding from REAL weather + AI analysis
-      const embeddingResponse = await axios.post('https://api.openai.com/v1/embeddings', {
+      const embeddingResponse = await axios.post(`${process.env.OPENAI_BASE_URL || 'https://api.openai.com/v1'}/embeddings`, {
         model: 'text-embedding-3-large',
         input: weatherDescription + '\n\nAI Safety Analysis: ' + aiAnalysis,
         dimensions: 128 // 128-dimensional weather vector
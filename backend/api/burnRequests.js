@@ -237,6 +237,15 @@ router.get('/:id', asyncHandler(async (req, res) => {
 router.post('/', asyncHandler(async (req, res) => {
   const startTime = Date.now();
   
+  // Per-agent wall time, so load tests can see which stage saturates first
+  const stageMs = {};
+  let stageStart = startTime;
+  const lap = (stage) => {
+    const now = Date.now();
+    stageMs[stage] = now - stageStart;
+    stageStart = now;
+  };
+  
   try {
     logger.info('Creating new burn request', { farmId: req.body.farm_id });
     
@@ -283,6 +292,7 @@ router.post('/', asyncHandler(async (req, res) => {
     }
     
     const burnRequestId = coordinatorResult.burnRequestId;
+    lap('coordinator');
     
     // Step 2: Weather Agent - Analyze weather conditions
     const farmLocation = await query(`
@@ -304,6 +314,7 @@ router.post('/', asyncHandler(async (req, res) => {
       location,
       transformedRequest.burn_date
     );
+    lap('weather');
     
     // Step 3: Predictor Agent - Calculate smoke dispersion
     // Weather agent returns 'currentWeather' not 'current'
@@ -312,6 +323,7 @@ router.post('/', asyncHandler(async (req, res) => {
       transformedRequest,
       weatherResult.currentWeather
     );
+    lap('predictor');
     
     // Step 4: Check if immediate scheduling is needed
     let optimizationResult = null;
@@ -333,6 +345,7 @@ router.post('/', asyncHandler(async (req, res) => {
         [predictionResult]
       );
     }
+    lap('optimizer');
     
     // Step 5: Alerts Agent - Send notifications
     const io = req.app.get('io');
@@ -379,6 +392,7 @@ router.post('/', asyncHandler(async (req, res) => {
       SET status = ?
       WHERE request_id = ?
     `, [predictionResult.conflicts && predictionResult.conflicts.length > 0 ? 'pending' : 'approved', burnRequestId]);
+    lap('alerts');
     
     const totalDuration = Date.now() - startTime;
     
@@ -416,6 +430,7 @@ router.post('/', asyncHandler(async (req, res) => {
       },
       workflow_performance: {
         total_duration_ms: totalDuration,
+        stage_ms: stageMs,
         agent_sequence: ['coordinator', 'weather', 'predictor', 'optimizer', 'alerts']
       }
     });
@@ -13,6 +13,9 @@ class QueryCache {
     this.ttlTimers = new Map();
     this.hits = 0;
     this.misses = 0;
+    this.evictions = 0; // LRU evictions - cache full
+    this.expirations = 0; // TTL expiries
+    this.invalidations = 0; // Entries dropped by writes
     this.maxSize = 2000; // Increased cache size
     this.defaultTTL = 120000; // 2 minute default TTL
     this.accessTimes = new Map(); // Track access patterns for smart eviction
@@ -71,6 +74,7 @@ class QueryCache {
       }
       if (lruKey) {
         this.delete(lruKey);
+        this.evictions++;
       }
     }
     
@@ -88,6 +92,7 @@ class QueryCache {
     // Set TTL timer
     const timer = setTimeout(() => {
       this.delete(key);
+      this.expirations++;
     }, ttl);
     
     this.ttlTimers.set(key, timer);
@@ -130,6 +135,9 @@ class QueryCache {
     this.accessTimes.clear();
     this.hits = 0;
     this.misses = 0;
+    this.evictions = 0;
+    this.expirations = 0;
+    this.invalidations = 0;
     
     logger.info('Query cache cleared');
   }
@@ -150,6 +158,7 @@ class QueryCache {
     for (const key of keysToDelete) {
       this.delete(key);
     }
+    this.invalidations += keysToDelete.length;
     
     logger.debug('Cache invalidated', { 
       pattern, 
@@ -169,6 +178,8 @@ class QueryCache {
       hits: this.hits,
       misses: this.misses,
       hitRate: `${hitRate}%`,
+      evictions: this.evictions,
+      expirations: this.expirations,
       size: this.cache.size,
       maxSize: this.maxSize
     });
@@ -196,8 +207,12 @@ class QueryCache {
       hitRate: this.hits + this.misses > 0 
         ? (this.hits / (this.hits + this.misses) * 100).toFixed(2) + '%'
         : '0%',
+      evictions: this.evictions,
+      expirations: this.expirations,
+      invalidations: this.invalidations,
       size: this.cache.size,
-      maxSize: this.maxSize
+      maxSize: this.maxSize,
+      defaultTTL: this.defaultTTL
     };
   }
 }
@@ -233,6 +248,7 @@ function invalidateRelatedCaches(tableName) {
 }
 
 module.exports = {
+  QueryCache,
   queryCache,
   invalidateRelatedCaches
 };
\ No newline at end of file
@@ -263,7 +263,7 @@ async function generateEmbedding(text, dimensions = 128) {
   }
   
   // Call OpenAI embeddings API with text-embedding-3-large for best quality
-  const response = await axios.post('https://api.openai.com/v1/embeddings', {
+  const response = await axios.post(`${process.env.OPENAI_BASE_URL || 'https://api.openai.com/v1'}/embeddings`, {
     model: 'text-embedding-3-large', // Best quality model (better than text-embedding-3-small)
     input: text,
     dimensions: dimensions // Custom dimensions supported
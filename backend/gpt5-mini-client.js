@@ -15,7 +15,7 @@ class GPT5MiniClient {
     }
     
     this.model = 'gpt-5-mini';
-    this.endpoint = 'https://api.openai.com/v1/responses';
+    this.endpoint = `${process.env.OPENAI_BASE_URL || 'https://api.openai.com/v1'}/responses`;
   }
   
   /**
@@ -0,0 +1,63 @@
+#!/usr/bin/env node
+
+/**
+ * Time the simulated-annealing schedule optimizer on one synthetic scenario
+ * Runs the optimizer's own phases in-process - no database, AI analysis or storage -
+ * so the numbers are the algorithm's cost alone
+ *
+ * Usage: node scripts/optimizer-bench.js scenario.json   (or the scenario on stdin)
+ * Scenario: { date, burnRequests, weatherData, predictionData }
+ * Prints one JSON line with per-phase timings and the annealing statistics
+ */
+
+const fs = require('fs');
+const { OptimizerAgent } = require('../agents/optimizer');
+
+function readScenario() {
+  const source = process.argv[2] ? fs.readFileSync(process.argv[2], 'utf8') : fs.readFileSync(0, 'utf8');
+  return JSON.parse(source);
+}
+
+async function timed(phases, name, fn) {
+  const start = process.hrtime.bigint();
+  const result = await fn();
+  phases[name] = Number(process.hrtime.bigint() - start) / 1e6;
+  return result;
+}
+
+async function main() {
+  const { date, burnRequests, weatherData, predictionData } = readScenario();
+  const optimizer = new OptimizerAgent();
+  const phases = {};
+
+  const requests = await timed(phases, 'preprocess_ms', () =>
+    optimizer.preprocessBurnRequests(burnRequests, weatherData));
+  const problem = await timed(phases, 'problem_ms', () =>
+    optimizer.initializeOptimizationProblem(requests, weatherData, predictionData));
+  const annealed = await timed(phases, 'anneal_ms', () =>
+    optimizer.runSimulatedAnnealing(problem));
+  const schedule = await timed(phases, 'postprocess_ms', () =>
+    optimizer.postProcessSolution(annealed, date));
+  const metrics = await timed(phases, 'metrics_ms', () =>
+    optimizer.calculateOptimizationMetrics(schedule, problem));
+
+  process.stdout.write(JSON.stringify({
+    requests: burnRequests.length,
+    validRequests: requests.length,
+    ...phases,
+    iterations: annealed.iterations,
+    reheats: annealed.reheats,
+    improvements: annealed.improvementHistory.length,
+    finalTemperature: annealed.finalTemperature,
+    score: annealed.score,
+    scheduled: metrics.scheduledRequests,
+    unscheduled: metrics.unscheduledRequests,
+    timeWindowCompliance: metrics.timeWindowCompliance,
+    heapUsedMb: process.memoryUsage().heapUsed / 1048576
+  }) + '\n');
+}
+
+main().then(() => process.exit(0)).catch((error) => {
+  console.error(error.stack || error.message);
+  process.exit(1);
+});
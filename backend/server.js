@@ -17,7 +17,7 @@ console.log('Logger initialized');
 
 const rateLimiter = require('./middleware/rateLimiter');
 const { errorHandler } = require('./middleware/errorHandler');
-const { initializeDatabase, query } = require('./db/connection');
+const { initializeDatabase, query, getCacheStats, clearCache } = require('./db/connection');
 const { smartCache, conditionalRequests } = require('./middleware/cacheHeaders');
 const { authenticateToken, optionalAuth } = require('./middleware/auth');
 // Simple middleware fallbacks
@@ -207,6 +207,33 @@ app.get('/health', (req, res) => {
   });
 });
 
+// Bench endpoints for frontend-tests; never exposed in production
+if (process.env.NODE_ENV !== 'production') {
+  // Socket.io load and process memory - polled by the socket fan-out bench
+  app.get('/health/sockets', (req, res) => {
+    res.status(200).json({
+      connections: io.engine.clientsCount,
+      rooms: io.sockets.adapter.rooms.size,
+      memory: process.memoryUsage(),
+      timestamp: new Date().toISOString()
+    });
+  });
+
+  // Query cache counters
+  app.get('/health/cache', (req, res) => {
+    res.status(200).json({
+      ...getCacheStats(),
+      timestamp: new Date().toISOString()
+    });
+  });
+
+  // Cold-cache measurements need an empty cache
+  app.post('/health/cache/clear', (req, res) => {
+    clearCache();
+    res.status(200).json(getCacheStats());
+  });
+}
+
 // API routes
 console.log('Setting up API routes...');
 
@@ -18,7 +18,7 @@ const getOpenAI = () => {
     }
     openai = new OpenAI({
       apiKey: process.env.OPENAI_API_KEY,
-      baseURL: 'https://api.openai.com/v1'
+      baseURL: process.env.OPENAI_BASE_URL || 'https://api.openai.com/v1'
     });
   }
   return openai;
@@ -0,0 +1,107 @@
+jest.mock('../../middleware/logger');
+
+const { QueryCache } = require('../../db/queryCache');
+
+/**
+ * QUERY CACHE COUNTER TESTS
+ * Evictions, expirations and invalidations as reported by getStats() and /health/cache
+ * The access sequence below is mirrored in frontend-tests/test_cache_probe.py so the
+ * Python QueryCacheModel is held to the same numbers
+ */
+
+describe('QueryCache counters', () => {
+  let cache;
+
+  // One cached query the way the routes use it: get, then set on a miss
+  const access = (key, ttl) => {
+    if (cache.get(key) === null) {
+      cache.set(key, [], { rows: key }, ttl);
+    }
+  };
+
+  beforeEach(() => {
+    jest.useFakeTimers({ now: 0 });
+    cache = new QueryCache();
+  });
+
+  afterEach(() => {
+    cache.clear();
+    jest.clearAllTimers();
+    jest.useRealTimers();
+  });
+
+  test('evicts the least recently used entry once maxSize is reached', () => {
+    cache.maxSize = 3;
+    access('a');
+    jest.advanceTimersByTime(10);
+    access('b');
+    jest.advanceTimersByTime(10);
+    access('c');
+    jest.advanceTimersByTime(10);
+    access('a'); // hit - b is now the least recently used
+    jest.advanceTimersByTime(10);
+    access('d');
+
+    expect(cache.getStats()).toMatchObject({ evictions: 1, size: 3 });
+    expect(cache.get('b')).toBeNull();
+    expect(cache.get('a')).toEqual({ rows: 'a' });
+  });
+
+  test('counts an expiration when the TTL timer fires', () => {
+    cache.set('a', [], 1, 1000);
+    cache.set('b', [], 2, 5000);
+
+    jest.advanceTimersByTime(999);
+    expect(cache.getStats().expirations).toBe(0);
+    jest.advanceTimersByTime(1);
+    expect(cache.getStats()).toMatchObject({ expirations: 1, size: 1, evictions: 0 });
+    expect(cache.get('a')).toBeNull();
+  });
+
+  test('re-setting a key restarts its TTL instead of expiring it twice', () => {
+    cache.set('a', [], 1, 1000);
+    jest.advanceTimersByTime(600);
+    cache.set('a', [], 2, 1000);
+    jest.advanceTimersByTime(600);
+    expect(cache.getStats().expirations).toBe(0);
+    jest.advanceTimersByTime(400);
+    expect(cache.getStats().expirations).toBe(1);
+  });
+
+  test('invalidatePattern counts every key it deletes', () => {
+    cache.set('SELECT * FROM farms WHERE id = ?', [1], {});
+    cache.set('SELECT * FROM farms WHERE id = ?', [2], {});
+    cache.set('SELECT * FROM weather_data', [], {});
+
+    cache.invalidatePattern('farms');
+    expect(cache.getStats()).toMatchObject({ invalidations: 2, size: 1, evictions: 0, expirations: 0 });
+
+    cache.invalidatePattern('farms');
+    expect(cache.getStats().invalidations).toBe(2);
+  });
+
+  test('evicted and invalidated keys never count as expirations later', () => {
+    cache.maxSize = 1;
+    cache.set('a', [], 1, 1000);
+    jest.advanceTimersByTime(10);
+    cache.set('b', [], 2, 1000);
+    cache.invalidatePattern('b');
+    jest.advanceTimersByTime(5000);
+
+    expect(cache.getStats()).toMatchObject({ evictions: 1, invalidations: 1, expirations: 0, size: 0 });
+  });
+
+  test('mixed sequence matches the cache_probe model', () => {
+    // [time ms, key] with a 1000ms TTL and maxSize 3 - see test_cache_probe.py
+    const sequence = [[0, 'a'], [10, 'b'], [20, 'c'], [30, 'a'], [40, 'd'], [50, 'b'], [1005, 'c'], [1100, 'a']];
+    cache.maxSize = 3;
+    let now = 0;
+    for (const [t, key] of sequence) {
+      jest.advanceTimersByTime(t - now);
+      now = t;
+      access(key, 1000);
+    }
+
+    expect(cache.getStats()).toMatchObject({ hits: 1, misses: 7, evictions: 2, expirations: 3 });
+  });
+});
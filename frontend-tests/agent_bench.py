@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Agent Latency Benchmark
+Concurrent chat, workflow and onboarding sessions against a backend wired to llm_stub.py
+Model time comes from the stub's own log, so what is left of each request is orchestration:
+routing, tool execution, DB/weather calls and the handoffs between agents
+
+  backend_dir$ OPENAI_BASE_URL=http://localhost:5199/v1 OPENAI_API_KEY=stub PORT=5101 node server.js
+  agent_bench.py --backend http://localhost:5101          (or --spawn-backend to do the above)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from bench_common import percentile
+from llm_stub import STUB_PORT, add_stub_arguments, build_stub
+from local_http import Request, fetch
+from results_store import record_report
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+DEFAULT_BACKEND = 'http://localhost:5101'
+
+CHAT_PROMPTS = [
+    'Is it safe to burn 40 acres of wheat stubble tomorrow morning?',
+    'Check for smoke conflicts with neighbouring farms this weekend',
+    'Optimize the burn schedule for next week',
+    'I want to request a burn for my north field on Friday',
+    'Start monitoring conditions for my scheduled burns',
+]
+
+ONBOARDING_ANSWERS = ['Bench Creek Farm', 'Davis, CA', '320', 'bench@example.com']
+
+
+@dataclass
+class Session:
+    id: str
+    kind: str
+    started: float
+    ended: float = 0.0
+    status: int = 0
+    error: Optional[str] = None
+    calls: List[Dict] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return (self.ended - self.started) * 1000
+
+    @property
+    def marker(self) -> str:
+        return f'[bench:{self.id}]'
+
+    def model_ms(self) -> float:
+        """Wall time covered by at least one model call - overlapping calls count once"""
+        spans = sorted((max(c['arrived'], self.started), min(c['arrived'] + c['total_ms'] / 1000, self.ended))
+                       for c in self.calls)
+        covered, cursor = 0.0, self.started
+        for start, end in spans:
+            start = max(start, cursor)
+            if end > start:
+                covered += end - start
+                cursor = end
+        return covered * 1000
+
+
+def burn_request(session: Session) -> Dict:
+    return {
+        'farm_id': 1,
+        'field_id': 1,
+        'field_name': 'North Field',
+        'acres': 40,
+        'crop_type': 'wheat',
+        'burn_date': time.strftime('%Y-%m-%d', time.localtime(time.time() + 86400)),
+        'time_window_start': '09:00',
+        'time_window_end': '13:00',
+        # The only free text every workflow stage prompt sees is the location
+        'location': f'38.544,-121.740 {session.marker}',
+    }
+
+
+class AgentBenchmark:
+    """Drive agent sessions concurrently; split each into model time (stub log) and everything else"""
+
+    def __init__(self, stub, backend: str = DEFAULT_BACKEND, chats: int = 10, workflows: int = 5,
+                 onboardings: int = 5, concurrency: int = 4, timeout: float = 120):
+        self.stub = stub
+        self.backend = backend
+        self.plan = {'chat': chats, 'workflow': workflows, 'onboarding': onboardings}
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.sessions: List[Session] = []
+        self.results = {}
+
+    async def _post(self, path: str, payload: Dict) -> Tuple[int, Dict]:
+        request = Request('POST', path, [('Content-Type', 'application/json')], json.dumps(payload).encode())
+        response = await fetch(self.backend, request, self.timeout)
+        try:
+            return response.status, json.loads(response.body or b'{}')
+        except ValueError:
+            return response.status, {}
+
+    async def chat(self, session: Session, n: int):
+        prompt = CHAT_PROMPTS[n % len(CHAT_PROMPTS)]
+        return await self._post('/api/agents/chat', {
+            'message': f'{prompt} {session.marker}', 'userId': 'bench', 'conversationId': session.id,
+        })
+
+    async def workflow(self, session: Session, n: int):
+        return await self._post('/api/agents/workflow', {'burnRequest': burn_request(session)})
+
+    async def onboarding(self, session: Session, n: int):
+        status, body = await self._post('/api/onboarding/start', {})
+        if status != 200:
+            return status, body
+        for answer in ONBOARDING_ANSWERS:
+            status, body = await self._post('/api/onboarding/message', {
+                'message': answer, 'sessionId': body.get('sessionId'),
+            })
+            if status != 200:
+                return status, body
+        # The only onboarding step that reaches the model
+        return await self._post('/api/onboarding/extract', {
+            'text': f'Bench Creek Farm, 320 acres of rice near Davis CA {session.marker}',
+        })
+
+    async def _run_session(self, kind: str, n: int, gate: asyncio.Semaphore):
+        async with gate:
+            session = Session(uuid.uuid4().hex[:10], kind, time.time())
+            try:
+                session.status, body = await getattr(self, kind)(session, n)
+                if session.status != 200 or body.get('success') is False:
+                    session.error = str(body.get('error') or f'HTTP {session.status}')
+            except (OSError, asyncio.TimeoutError) as e:
+                session.error = f'{type(e).__name__}: {e}'
+            session.ended = time.time()
+            self.sessions.append(session)
+
+    def attribute(self) -> int:
+        """Give each stub call to its session: by marker, else the only session of overlapping time"""
+        by_id = {s.id: s for s in self.sessions}
+        orphans = 0
+        for call in self.stub.calls:
+            owner = by_id.get(call['session'])
+            if owner is None:
+                live = [s for s in self.sessions if s.started <= call['arrived'] <= s.ended]
+                owner = live[0] if len(live) == 1 else None
+            if owner is None:
+                orphans += 1
+            else:
+                owner.calls.append(call)
+        return orphans
+
+    async def run(self) -> Dict:
+        print("🤖 BURNWISE AGENT LATENCY BENCHMARK")
+        print(f"   Backend {self.backend}, model stub {self.stub.base_url}, concurrency {self.concurrency}")
+
+        gate = asyncio.Semaphore(self.concurrency)
+        jobs = [self._run_session(kind, n, gate) for kind, count in self.plan.items() for n in range(count)]
+        self.stub.calls.clear()
+        wall_start = time.perf_counter()
+        await asyncio.gather(*jobs)
+        wall_s = time.perf_counter() - wall_start
+        orphans = self.attribute()
+
+        self.results = {
+            'wall_s': round(wall_s, 2),
+            'unattributed_calls': orphans,
+            'sessions': self.session_summary(wall_s),
+            'agents': self.agent_summary(),
+            'handoffs': self.handoff_summary(),
+        }
+        self.print_report()
+        self.save()
+        return self.results
+
+    def session_summary(self, wall_s: float) -> Dict:
+        summary = {}
+        for kind in self.plan:
+            done = [s for s in self.sessions if s.kind == kind]
+            if not done:
+                continue
+            ok = [s for s in done if not s.error]
+            totals = [s.total_ms for s in ok]
+            model = [s.model_ms() for s in ok]
+            overhead = [s.total_ms - m for s, m in zip(ok, model)]
+            summary[kind] = {
+                'sessions': len(done),
+                'errors': len(done) - len(ok),
+                'latency_ms_p50': round(percentile(totals, 50), 1),
+                'latency_ms_p95': round(percentile(totals, 95), 1),
+                'model_ms_p50': round(percentile(model, 50), 1),
+                'overhead_ms_p50': round(percentile(overhead, 50), 1),
+                'overhead_ms_p95': round(percentile(overhead, 95), 1),
+                'overhead_share': round(sum(overhead) / sum(totals), 3) if sum(totals) else None,
+                'model_calls_per_session': round(sum(len(s.calls) for s in ok) / len(ok), 2) if ok else 0,
+                'sessions_per_min': round(len(ok) / wall_s * 60, 2) if wall_s else 0,
+                'first_error': next((s.error for s in done if s.error), None),
+            }
+        return summary
+
+    def agent_summary(self) -> Dict:
+        summary = {}
+        for agent in sorted({c['agent'] for c in self.stub.calls}):
+            calls = [c for c in self.stub.calls if c['agent'] == agent]
+            decode = [c['output_tokens'] / ((c['total_ms'] - c['ttft_ms']) / 1000)
+                      for c in calls if c['total_ms'] > c['ttft_ms'] and c['output_tokens'] > 1]
+            summary[agent] = {
+                'calls': len(calls),
+                'tool_calls': sum(1 for c in calls if c['tool']),
+                'ttft_ms_p50': round(percentile([c['ttft_ms'] for c in calls], 50), 1),
+                'ttft_ms_p95': round(percentile([c['ttft_ms'] for c in calls], 95), 1),
+                'total_ms_p50': round(percentile([c['total_ms'] for c in calls], 50), 1),
+                'tokens_per_s_p50': round(percentile(decode, 50), 1),
+            }
+        return summary
+
+    def handoff_summary(self) -> Dict:
+        """Gap between one model call finishing and the next one arriving, per agent pair"""
+        gaps: Dict[str, List[float]] = {}
+        for session in self.sessions:
+            calls = sorted(session.calls, key=lambda c: c['arrived'])
+            for before, after in zip(calls, calls[1:]):
+                gap = (after['arrived'] - before['arrived']) * 1000 - before['total_ms']
+                gaps.setdefault(f"{before['agent']} -> {after['agent']}", []).append(max(0.0, gap))
+        return {pair: {'count': len(values), 'gap_ms_p50': round(percentile(values, 50), 1),
+                       'gap_ms_p95': round(percentile(values, 95), 1)}
+                for pair, values in sorted(gaps.items())}
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        print("📊 SESSIONS (latency = what the user waits, overhead = latency minus model time)")
+        for kind, s in self.results['sessions'].items():
+            print(f"   {kind:11} {s['sessions']:3d} runs {s['errors']:2d} errors  "
+                  f"p50 {s['latency_ms_p50']:8.0f}ms  p95 {s['latency_ms_p95']:8.0f}ms  "
+                  f"overhead p50 {s['overhead_ms_p50']:7.0f}ms  {s['sessions_per_min']:6.1f}/min")
+            if s['first_error']:
+                print(f"      ❌ {s['first_error']}")
+
+        print("\n🧠 MODEL CALLS PER AGENT")
+        for agent, a in self.results['agents'].items():
+            print(f"   {agent:22} {a['calls']:4d} calls  TTFT p50 {a['ttft_ms_p50']:6.0f}ms "
+                  f"p95 {a['ttft_ms_p95']:6.0f}ms  total p50 {a['total_ms_p50']:6.0f}ms  "
+                  f"{a['tokens_per_s_p50']:5.0f} tok/s")
+
+        if self.results['handoffs']:
+            print("\n🔀 HANDOFF GAPS (no model running)")
+            for pair, h in self.results['handoffs'].items():
+                print(f"   {pair:45} {h['count']:4d}x  p50 {h['gap_ms_p50']:7.0f}ms  p95 {h['gap_ms_p95']:7.0f}ms")
+
+        if self.results['unattributed_calls']:
+            print(f"\n⚠️ {self.results['unattributed_calls']} model call(s) could not be tied to a session "
+                  f"- run with --concurrency 1 for exact overhead")
+
+    def save(self):
+        for kind, s in self.results['sessions'].items():
+            metrics = {k: v for k, v in s.items() if isinstance(v, (int, float)) and v is not None}
+            warnings = [f"⚠️ {kind}: {s['errors']} of {s['sessions']} sessions failed"] if s['errors'] else []
+            record_report('agent-bench', metrics, warnings=warnings, route=f'/api/agents/{kind}',
+                          profile=f'c{self.concurrency}')
+        for agent, a in self.results['agents'].items():
+            record_report('agent-bench', a, route=f'llm:{agent}', profile=f'c{self.concurrency}')
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'backend': self.backend,
+            'concurrency': self.concurrency,
+            'stub': {'tokens_per_s': self.stub.tokens_per_s, 'output_tokens': self.stub.output_tokens},
+            **self.results,
+            'raw_sessions': [{**asdict(s), 'total_ms': round(s.total_ms, 1)} for s in self.sessions],
+        }
+        with open('agent-bench-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to agent-bench-report.json")
+
+
+async def wait_healthy(backend: str, process: subprocess.Popen, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'Backend exited with code {process.returncode}')
+        try:
+            if (await fetch(backend, Request('GET', '/health', []), timeout=2)).status == 200:
+                return
+        except (OSError, asyncio.TimeoutError):
+            pass
+        await asyncio.sleep(0.5)
+    raise RuntimeError(f'Backend not healthy after {timeout:.0f}s')
+
+
+async def bench(args):
+    async with build_stub(args) as stub:
+        process = None
+        if args.spawn_backend:
+            port = args.backend.rsplit(':', 1)[-1].strip('/')
+            env = {**os.environ, 'PORT': port, 'OPENAI_BASE_URL': stub.base_url, 'OPENAI_API_KEY': 'stub'}
+            process = subprocess.Popen(['node', 'server.js'], cwd=BACKEND_DIR, env=env,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            print(f"🚀 Backend started on :{port} (pid {process.pid}), waiting for /health")
+        try:
+            if process:
+                await wait_healthy(args.backend, process)
+            await AgentBenchmark(stub, args.backend, args.chats, args.workflows, args.onboardings,
+                                 args.concurrency, args.timeout).run()
+        finally:
+            if process:
+                process.terminate()
+                process.wait(10)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Agent TTFT / orchestration overhead benchmark')
+    parser.add_argument('--backend', default=DEFAULT_BACKEND,
+                        help='Backend started with OPENAI_BASE_URL pointing at the stub')
+    parser.add_argument('--spawn-backend', action='store_true', help='Start node server.js wired to the stub')
+    parser.add_argument('--port', type=int, default=STUB_PORT, help='LLM stub port')
+    parser.add_argument('--chats', type=int, default=10)
+    parser.add_argument('--workflows', type=int, default=5)
+    parser.add_argument('--onboardings', type=int, default=5)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--timeout', type=float, default=120, help='Per request, seconds')
+    add_stub_arguments(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(bench(args))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Audit CLI
+ONE entry point for every audit, benchmark and report
+Heavy dependencies (Playwright, NumPy) load only in the subcommand that needs them
+"""
+
+import argparse
+import importlib
+import os
+import runpy
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Full-browser audits - run exactly as their own scripts would
+AUDITS = {
+    'frontend': 'brutal_frontend_audit.py',
+    'pixel': 'brutal_pixel_perfect_audit.py',
+    'comprehensive': 'comprehensive_ui_audit.py',
+}
+
+# Benchmarks - each module exposes main(argv)
+BENCHES = {
+    'fire-effects': 'fire_effects_bench',
+    'cpu-profile': 'cpu_profiler',
+    'agents': 'agent_bench',
+    'pipeline': 'pipeline_bench',
+    'plume': 'predictor_check',
+    'optimizer': 'optimizer_bench',
+    'vectors': 'vector_bench',
+    'cache': 'cache_probe',
+    'sockets': 'socket_bench',
+    'sessions': 'session_load',
+    'inp': 'interaction_latency',
+    'scrub': 'scrub_bench',
+    'renders': 'render_profiler',
+    'layout': 'layout_metrics',
+    'soak': 'soak',
+}
+
+
+def cmd_capture(args, rest):
+    import asyncio
+
+    async def capture():
+        from playwright.async_api import async_playwright
+        from dom_snapshot import capture_raw, save_capture, SNAPSHOT_STYLES
+        from interactions import FRONTEND_URL, login
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=not args.headed)
+            context = await browser.new_context(viewport={'width': args.width, 'height': args.height})
+            page = await context.new_page()
+            if not args.no_login:
+                await login(page)
+            await page.goto(f'{FRONTEND_URL}{args.route}')
+            await page.wait_for_load_state('networkidle')
+            save_capture(await capture_raw(page, SNAPSHOT_STYLES), args.output)
+            await browser.close()
+
+    asyncio.run(capture())
+    print(f"📸 {args.route} captured to {args.output}")
+    return 0
+
+
+def cmd_analyze(args, rest):
+    from verify_ui_measurements import verify_capture
+
+    # The palette, glass and touch analyzers need NumPy (~55ms to import) - opt in with --full
+    verifier = verify_capture(args.capture, bulk=args.full)
+    print(verifier.generate_report())
+
+    if args.full and not args.skip_touch:
+        from dom_snapshot import PageSnapshot
+        from touch_targets import TouchTargetAnalyzer, print_report
+        print_report(TouchTargetAnalyzer().analyze(PageSnapshot.load(args.capture)))
+    return 1 if verifier.issues else 0
+
+
+def cmd_audit(args, rest):
+    import traceback
+    from results_store import REPORTED_CRITICAL
+
+    sys.argv = [AUDITS[args.name], *rest]
+    reported = len(REPORTED_CRITICAL)
+    try:
+        runpy.run_path(os.path.join(HERE, AUDITS[args.name]), run_name='__main__')
+    except SystemExit as e:
+        # Same meaning as the interpreter gives it: None/0 pass, ints are codes, anything else is printed
+        if e.code not in (None, 0):
+            if isinstance(e.code, int):
+                return e.code
+            print(e.code, file=sys.stderr)
+            return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    # The audits report through record_report rather than an exit code
+    return 1 if len(REPORTED_CRITICAL) > reported else 0
+
+
+def cmd_bench(args, rest):
+    return importlib.import_module(BENCHES[args.name]).main(rest)
+
+
+def cmd_report(args, rest):
+    from results_store import main
+    return main(rest or ['runs'])
+
+
+def cmd_standin(args, rest):
+    from backend_standin import main
+    return main(rest)
+
+
+def cmd_faults(args, rest):
+    from fault_proxy import main
+    return main(rest)
+
+
+def cmd_gate(args, rest):
+    from regression_gate import main
+    return main(rest)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='audit_cli.py',
+        description='BURNWISE frontend audits, benchmarks and reports',
+    )
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('capture', help='Save a DOMSnapshot capture of a route for offline analysis')
+    p.add_argument('--route', default='/spatial')
+    p.add_argument('--output', default='capture.json')
+    p.add_argument('--width', type=int, default=1920)
+    p.add_argument('--height', type=int, default=1080)
+    p.add_argument('--no-login', action='store_true')
+    p.add_argument('--headed', action='store_true')
+    p.set_defaults(handler=cmd_capture)
+
+    p = sub.add_parser('analyze', help='Run the UI checks on a saved capture (no browser)')
+    p.add_argument('capture')
+    p.add_argument('--full', action='store_true',
+                   help='Also run the NumPy palette, glass morphism and touch target analyzers')
+    p.add_argument('--skip-touch', action='store_true', help='Skip the touch target analysis with --full')
+    p.set_defaults(handler=cmd_analyze)
+
+    p = sub.add_parser('audit', help='Run one of the full browser audits')
+    p.add_argument('name', choices=sorted(AUDITS))
+    p.set_defaults(handler=cmd_audit, passthrough=True)
+
+    p = sub.add_parser('bench', add_help=False, help='Run a benchmark; extra arguments go to the benchmark')
+    p.add_argument('name', choices=sorted(BENCHES))
+    p.set_defaults(handler=cmd_bench, passthrough=True)
+
+    p = sub.add_parser('report', add_help=False,
+                       help='Query the results store (runs, metrics, trend, first-bad)')
+    p.set_defaults(handler=cmd_report, passthrough=True)
+
+    p = sub.add_parser('standin', add_help=False,
+                       help='Record/replay backend stand-in; extra arguments go to it')
+    p.set_defaults(handler=cmd_standin, passthrough=True)
+
+    p = sub.add_parser('faults', add_help=False,
+                       help='Fault injection proxy / degradation audit; extra arguments go to it')
+    p.set_defaults(handler=cmd_faults, passthrough=True)
+
+    p = sub.add_parser('gate', add_help=False,
+                       help='Statistical regression gate; extra arguments go to the gate')
+    p.set_defaults(handler=cmd_gate, passthrough=True)
+
+    return parser
+
+
+def main(argv=None):
+    # Sibling modules import each other by bare name
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    parser = build_parser()
+    args, rest = parser.parse_known_args(argv)
+    if rest and not getattr(args, 'passthrough', False):
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    return args.handler(args, rest)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
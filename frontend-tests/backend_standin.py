@@ -0,0 +1,610 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Backend Stand-In
+RECORD real /api/* and Socket.io traffic once, REPLAY it locally forever after
+Per-endpoint latency distributions - frontend timing without backend noise
+
+Record:  PORT=5101 node backend/server.js  +  backend_standin.py record --upstream http://localhost:5101
+Replay:  (backend stopped)  backend_standin.py replay --latency latency.json
+Check:   backend_standin.py check   (replays the cassette to a polling-first Socket.io client)
+"""
+
+import argparse
+import asyncio
+import base64
+import fnmatch
+import hashlib
+import json
+import random
+import re
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from local_http import (
+    OP_BINARY, OP_CLOSE, OP_PING, OP_PONG, OP_TEXT, LocalServer, Request, Response,
+    accept_websocket, connect_websocket, cors_headers, encode_frame, encode_response,
+    fetch, read_frame, relay_frames,
+)
+
+DEFAULT_CASSETTE = 'backend-cassette.json'
+STANDIN_PORT = 5001
+
+# A server packet this soon after a client event is treated as its reply
+REPLY_WINDOW_MS = 2000
+
+PING_INTERVAL_MS = 25000
+
+# Engine.IO v4 long-polling joins packets with a record separator
+POLLING_SEPARATOR = '\x1e'
+POLLING_HEADERS = [('Content-Type', 'text/plain; charset=UTF-8')]
+
+SIO_PACKET = re.compile(r'^4(?P<type>\d)(?:(?P<nsp>/[^,]*),)?(?P<id>\d+)?(?P<data>.*)$', re.S)
+
+
+def parse_sio(packet: str) -> Optional[Dict]:
+    """Engine.IO message carrying a Socket.io packet -> type, namespace, ack id, payload"""
+    match = SIO_PACKET.match(packet)
+    if not match:
+        return None
+    try:
+        data = json.loads(match['data']) if match['data'] else None
+    except ValueError:
+        data = None
+    return {
+        'type': int(match['type']),
+        'nsp': match['nsp'] or '/',
+        'id': match['id'],
+        'data': data,
+        'event': data[0] if int(match['type']) == 2 and isinstance(data, list) and data else None,
+    }
+
+
+def engine_open(sid: str, upgrades: List[str]) -> str:
+    """Engine.IO open packet; polling sessions advertise the WebSocket upgrade"""
+    return '0' + json.dumps({
+        'sid': sid, 'upgrades': upgrades, 'pingInterval': PING_INTERVAL_MS, 'pingTimeout': 20000,
+        'maxPayload': 1000000,
+    })
+
+
+def query_param(request: Request, name: str) -> Optional[str]:
+    return parse_qs(request.query).get(name, [None])[0]
+
+
+def body_digest(body: bytes) -> str:
+    return hashlib.sha1(body).hexdigest()[:16] if body else ''
+
+
+class LatencyModel:
+    """Per-route latency distributions; first matching pattern wins
+
+    Patterns are '[METHOD ]/path/glob*' for HTTP and 'socket:<event glob>' for
+    Socket.io replies. Distributions:
+      {"dist": "recorded", "scale": 1.0}     what the real backend took
+      {"dist": "zero"}                        frontend cost only
+      {"dist": "fixed", "ms": 250}
+      {"dist": "uniform", "min_ms": 50, "max_ms": 400}
+      {"dist": "normal", "mean_ms": 120, "sd_ms": 30}
+      {"dist": "lognormal", "median_ms": 120, "sigma": 0.5}
+    """
+
+    def __init__(self, routes: Optional[Dict[str, Dict]] = None, default: Optional[Dict] = None,
+                 seed: Optional[int] = 0):
+        self.routes = list((routes or {}).items())
+        self.default = default or {'dist': 'recorded'}
+        self.random = random.Random(seed)
+
+    @classmethod
+    def load(cls, path: str) -> 'LatencyModel':
+        with open(path) as f:
+            config = json.load(f)
+        return cls(config.get('routes'), config.get('default'), config.get('seed', 0))
+
+    def spec_for(self, key: str, method: str = '') -> Dict:
+        for pattern, spec in self.routes:
+            pattern_method, _, pattern_path = pattern.rpartition(' ')
+            if pattern_method and pattern_method.upper() != method.upper():
+                continue
+            if fnmatch.fnmatchcase(key, pattern_path):
+                return spec
+        return self.default
+
+    def sample(self, key: str, recorded_ms: float, method: str = '') -> float:
+        spec = self.spec_for(key, method)
+        dist = spec.get('dist', 'recorded')
+        if dist == 'zero':
+            return 0.0
+        if dist == 'fixed':
+            return float(spec['ms'])
+        if dist == 'uniform':
+            return self.random.uniform(spec['min_ms'], spec['max_ms'])
+        if dist == 'normal':
+            return max(0.0, self.random.gauss(spec['mean_ms'], spec['sd_ms']))
+        if dist == 'lognormal':
+            return self.random.lognormvariate(0, spec['sigma']) * spec['median_ms']
+        return recorded_ms * spec.get('scale', 1.0)
+
+
+class Cassette:
+    """Recorded HTTP exchanges + Socket.io conversations, JSON on disk"""
+
+    def __init__(self, http: Optional[List[Dict]] = None, sockets: Optional[List[List[Dict]]] = None,
+                 meta: Optional[Dict] = None):
+        self.http = http or []
+        self.sockets = sockets or []
+        self.meta = meta or {}
+        self._cursor: Dict[Tuple, int] = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'Cassette':
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data['http'], data['sockets'], data.get('meta'))
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump({'meta': self.meta, 'http': self.http, 'sockets': self.sockets}, f, indent=1)
+
+    def add_exchange(self, request: Request, response: Response, latency_ms: float):
+        self.http.append({
+            'method': request.method,
+            'path': request.path,
+            'query': request.query,
+            'body_sha1': body_digest(request.body),
+            'status': response.status,
+            'headers': response.headers,
+            'body_b64': base64.b64encode(response.body).decode(),
+            'latency_ms': round(latency_ms, 2),
+        })
+
+    def match(self, request: Request) -> Optional[Dict]:
+        """Exact match first, then ignore body, then ignore query; repeats cycle in order"""
+        keys = (
+            lambda e: (e['method'], e['path'], e['query'], e['body_sha1']),
+            lambda e: (e['method'], e['path'], e['query']),
+            lambda e: (e['method'], e['path']),
+        )
+        probe = {'method': request.method, 'path': request.path, 'query': request.query,
+                 'body_sha1': body_digest(request.body)}
+        for level, key in enumerate(keys):
+            wanted = key(probe)
+            candidates = [e for e in self.http if key(e) == wanted]
+            if candidates:
+                cursor = (level, wanted)
+                index = self._cursor.get(cursor, 0)
+                self._cursor[cursor] = index + 1
+                return candidates[index % len(candidates)]
+        return None
+
+
+class SocketScript:
+    """One recorded Socket.io connection split into timed pushes and event replies"""
+
+    def __init__(self, packets: List[Dict]):
+        self.pushes: List[Tuple[float, str]] = []
+        self.replies: Dict[str, List[Tuple[float, Dict]]] = {}
+        trigger, trigger_t = None, None
+        for packet in packets:
+            parsed = parse_sio(packet['packet'])
+            if packet['direction'] == 'in':
+                if parsed and parsed['event']:
+                    trigger, trigger_t = parsed, packet['t_ms']
+                continue
+            if not parsed or parsed['type'] == 0:
+                continue
+            if trigger and packet['t_ms'] - trigger_t <= REPLY_WINDOW_MS:
+                self.replies.setdefault(trigger['event'], []).append(
+                    (packet['t_ms'] - trigger_t, {'packet': packet['packet'], 'parsed': parsed})
+                )
+            else:
+                self.pushes.append((packet['t_ms'], packet['packet']))
+
+
+class ReplaySession:
+    """One replayed Engine.IO session: long-polling until the client upgrades, then WebSocket"""
+
+    def __init__(self, sid: str, script: Optional[SocketScript], latency: LatencyModel):
+        self.sid = sid
+        self.script = script
+        self.latency = latency
+        self.outbox: asyncio.Queue = asyncio.Queue()
+        self.upgraded = asyncio.Event()
+        self.writer = None
+        self.tasks: List[asyncio.Task] = []
+
+    def send(self, text: str):
+        if self.writer is None:
+            self.outbox.put_nowait(text)
+        else:
+            self.writer.write(encode_frame(OP_TEXT, text.encode()))
+
+    async def flush(self):
+        if self.writer is not None:
+            await self.writer.drain()
+
+    async def later(self, delay_ms: float, text: str):
+        await asyncio.sleep(delay_ms / 1000)
+        self.send(text)
+        await self.flush()
+
+    def upgrade(self, writer):
+        """Switch to the WebSocket; anything still queued for polling goes over it"""
+        self.writer = writer
+        while not self.outbox.empty():
+            self.send(self.outbox.get_nowait())
+        self.upgraded.set()
+
+    def receive(self, text: str):
+        """One client packet: a connect starts the recorded pushes, an event gets its replies"""
+        parsed = parse_sio(text)
+        if not parsed:
+            return
+        if parsed['type'] == 0:
+            prefix = '' if parsed['nsp'] == '/' else parsed['nsp'] + ','
+            self.send(f'40{prefix}{{"sid":"{self.sid}"}}')
+            if self.script:
+                self.tasks += [asyncio.create_task(self.later(t, p)) for t, p in self.script.pushes]
+        elif parsed['event'] and self.script:
+            for delay, reply in self.script.replies.get(parsed['event'], []):
+                packet = reply['packet']
+                if reply['parsed']['type'] == 3 and parsed['id']:
+                    # Re-address the recorded ack to this emit's id
+                    packet = f"43{parsed['id']}{json.dumps(reply['parsed']['data'])}"
+                delay = self.latency.sample(f"socket:{parsed['event']}", delay)
+                self.tasks.append(asyncio.create_task(self.later(delay, packet)))
+
+    async def poll(self) -> str:
+        """Long-poll GET: queued packets, a ping when idle, a noop once upgraded"""
+        if self.upgraded.is_set():
+            return '6'
+        get = asyncio.ensure_future(self.outbox.get())
+        upgraded = asyncio.ensure_future(self.upgraded.wait())
+        done, _ = await asyncio.wait({get, upgraded}, timeout=PING_INTERVAL_MS / 1000,
+                                     return_when=asyncio.FIRST_COMPLETED)
+        upgraded.cancel()
+        if get not in done:
+            get.cancel()
+            return '6' if self.upgraded.is_set() else '2'
+        packets = [get.result()]
+        while not self.outbox.empty():
+            packets.append(self.outbox.get_nowait())
+        return POLLING_SEPARATOR.join(packets)
+
+    def close(self):
+        for task in self.tasks:
+            task.cancel()
+        # Releases a long-poll still waiting on this session
+        self.upgraded.set()
+
+
+class BackendStandIn(LocalServer):
+    """asyncio server on the backend port: proxies + records, or replays"""
+
+    def __init__(self, cassette: Cassette, upstream: Optional[str] = None,
+                 latency: Optional[LatencyModel] = None, host: str = '127.0.0.1', port: int = STANDIN_PORT):
+        super().__init__(host, port)
+        self.cassette = cassette
+        self.upstream = upstream
+        self.latency = latency or LatencyModel()
+        self.stats = {'http': 0, 'misses': 0, 'sockets': 0}
+        self._socket_scripts = [SocketScript(packets) for packets in cassette.sockets]
+        # Replay: live Engine.IO sessions; record: sid -> (packet list, session start)
+        self._sessions: Dict[str, ReplaySession] = {}
+        self._recordings: Dict[str, Tuple[List[Dict], float]] = {}
+
+    @property
+    def recording(self) -> bool:
+        return self.upstream is not None
+
+    async def start(self):
+        await super().start()
+        mode = f"recording {self.upstream}" if self.recording else f"replaying {len(self.cassette.http)} exchanges"
+        print(f"🎞️  Backend stand-in on http://{self.host}:{self.port} ({mode})")
+        return self
+
+    async def _serve(self, request: Request, reader, writer) -> bool:
+        if request.is_websocket and request.path.startswith('/socket.io'):
+            await self._websocket(request, reader, writer)
+            return False
+        writer.write(encode_response(await self._http(request)))
+        await writer.drain()
+        return True
+
+    async def _http(self, request: Request) -> Response:
+        self.stats['http'] += 1
+        if self.recording:
+            start = time.perf_counter()
+            response = await fetch(self.upstream, request)
+            latency_ms = (time.perf_counter() - start) * 1000
+            # Preflights are answered locally on replay
+            if request.path.startswith('/api/') and request.method != 'OPTIONS':
+                self.cassette.add_exchange(request, response, latency_ms)
+            elif request.path.startswith('/socket.io'):
+                self._record_polling(request, response)
+            return response
+
+        if request.method == 'OPTIONS':
+            return Response(204, cors_headers(request))
+        if request.path.startswith('/socket.io'):
+            return await self._polling(request)
+        exchange = self.cassette.match(request)
+        if exchange is None:
+            self.stats['misses'] += 1
+            print(f"   ⚠️ No recording for {request.method} {request.target}")
+            return Response(404, cors_headers(request) + [('Content-Type', 'application/json')],
+                            b'{"error":"not recorded"}')
+
+        delay = self.latency.sample(request.path, exchange['latency_ms'], request.method)
+        await asyncio.sleep(delay / 1000)
+        # Recorded CORS headers belong to the recording origin; answer for this one
+        headers = [(k, v) for k, v in exchange['headers'] if not k.lower().startswith('access-control-')]
+        return Response(exchange['status'], headers + cors_headers(request),
+                        base64.b64decode(exchange['body_b64']))
+
+    def _new_session(self) -> ReplaySession:
+        self.stats['sockets'] += 1
+        scripts = self._socket_scripts
+        script = scripts[(self.stats['sockets'] - 1) % len(scripts)] if scripts else None
+        session = ReplaySession(f"standin-{self.stats['sockets']}", script, self.latency)
+        self._sessions[session.sid] = session
+        return session
+
+    def _end_session(self, session: ReplaySession):
+        session.close()
+        self._sessions.pop(session.sid, None)
+
+    async def _polling(self, request: Request) -> Response:
+        """Engine.IO long-polling answered locally; the client then upgrades onto the WebSocket"""
+        headers = cors_headers(request) + POLLING_HEADERS
+        sid = query_param(request, 'sid')
+        if sid is None:
+            session = self._new_session()
+            return Response(200, headers, engine_open(session.sid, ['websocket']).encode())
+
+        session = self._sessions.get(sid)
+        if session is None:
+            return Response(400, headers, b'{"code":1,"message":"Session ID unknown"}')
+        if request.method == 'POST':
+            for packet in request.body.decode('utf-8', 'replace').split(POLLING_SEPARATOR):
+                if packet == '1':
+                    self._end_session(session)
+                else:
+                    session.receive(packet)
+            return Response(200, headers, b'ok')
+        return Response(200, headers, (await session.poll()).encode())
+
+    def _recording_for(self, sid: Optional[str]) -> Tuple[List[Dict], float]:
+        """Packet list of a recorded session; polling and its WebSocket upgrade share one"""
+        key = sid or f'ws-{len(self.cassette.sockets)}'
+        if key not in self._recordings:
+            packets: List[Dict] = []
+            self.cassette.sockets.append(packets)
+            self.stats['sockets'] += 1
+            self._recordings[key] = (packets, time.perf_counter())
+        return self._recordings[key]
+
+    @staticmethod
+    def _log_packet(packets: List[Dict], opened: float, direction: str, text: str):
+        if text.startswith('4'):
+            packets.append({
+                'direction': direction,
+                't_ms': round((time.perf_counter() - opened) * 1000, 1),
+                'packet': text,
+            })
+
+    def _record_polling(self, request: Request, response: Response):
+        """Socket.io packets the upstream exchanged over long-polling before any upgrade"""
+        sid = query_param(request, 'sid')
+        body = response.body.decode('utf-8', 'replace')
+        if sid is None:
+            if response.status == 200 and body.startswith('0{'):
+                self._recording_for(json.loads(body[1:])['sid'])
+            return
+        if sid not in self._recordings:
+            return
+        packets, opened = self._recordings[sid]
+        direction, payload = ('in', request.body.decode('utf-8', 'replace')) if request.method == 'POST' else ('out', body)
+        for text in payload.split(POLLING_SEPARATOR):
+            self._log_packet(packets, opened, direction, text)
+
+    async def _websocket(self, request: Request, reader, writer):
+        await accept_websocket(request, writer)
+        if self.recording:
+            await self._record_socket(request, reader, writer)
+        else:
+            await self._replay_socket(request, reader, writer)
+
+    async def _record_socket(self, request: Request, reader, writer):
+        up_reader, up_writer = await connect_websocket(self.upstream, request)
+        packets, opened = self._recording_for(query_param(request, 'sid'))
+
+        def recorder(direction):
+            async def on_frame(fin, opcode, payload):
+                if opcode == OP_TEXT and fin:
+                    self._log_packet(packets, opened, direction, payload.decode('utf-8', 'replace'))
+            return on_frame
+
+        await asyncio.gather(
+            relay_frames(reader, up_writer, True, recorder('in')),
+            relay_frames(up_reader, writer, False, recorder('out')),
+        )
+
+    async def _replay_socket(self, request: Request, reader, writer):
+        async def heartbeat():
+            # Engine.IO v4: the server pings, a silent server gets dropped by the client
+            await session.upgraded.wait()
+            while True:
+                await session.later(PING_INTERVAL_MS, '2')
+
+        session = self._sessions.get(query_param(request, 'sid'))
+        if session is None:
+            # WebSocket-only client (transports: ['websocket']) - the session opens here
+            session = self._new_session()
+            session.upgrade(writer)
+            session.send(engine_open(session.sid, []))
+            await session.flush()
+        heartbeat_task = asyncio.create_task(heartbeat())
+
+        try:
+            while True:
+                fin, opcode, payload = await read_frame(reader)
+                if opcode == OP_CLOSE:
+                    break
+                if opcode == OP_PING:
+                    writer.write(encode_frame(OP_PONG, payload))
+                    continue
+                if opcode not in (OP_TEXT, OP_BINARY):
+                    continue
+                text = payload.decode('utf-8', 'replace')
+                if text == '2probe':
+                    # Upgrade probe answered on the socket itself while polling still carries data
+                    writer.write(encode_frame(OP_TEXT, b'3probe'))
+                elif text == '5':
+                    session.upgrade(writer)
+                else:
+                    session.receive(text)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            heartbeat_task.cancel()
+            self._end_session(session)
+
+
+def replay_standin(cassette_path: str, latency_path: Optional[str] = None,
+                   port: int = STANDIN_PORT) -> BackendStandIn:
+    """Replay server for in-process use: `async with replay_standin(path):`"""
+    latency = LatencyModel.load(latency_path) if latency_path else LatencyModel()
+    return BackendStandIn(Cassette.load(cassette_path), latency=latency, port=port)
+
+
+async def polling_client(port: int, event: Optional[List]) -> List[str]:
+    """socket.io-client with default transports: open on polling, connect, upgrade, emit"""
+    upstream = f'http://127.0.0.1:{port}'
+    base = '/socket.io/?EIO=4&transport=polling'
+    failures = []
+
+    opened = await fetch(upstream, Request('GET', base, []))
+    body = opened.body.decode()
+    if opened.status != 200 or not body.startswith('0{'):
+        return [f"❌ Polling open answered {opened.status}: {body[:80]!r}"]
+    handshake = json.loads(body[1:])
+    if 'websocket' not in handshake['upgrades']:
+        failures.append(f"❌ Polling open offers no WebSocket upgrade: {handshake['upgrades']}")
+    sid_query = f"&sid={handshake['sid']}"
+
+    headers = [('Content-Type', 'text/plain;charset=UTF-8')]
+    posted = await fetch(upstream, Request('POST', base + sid_query, headers, b'40'))
+    if posted.body != b'ok':
+        failures.append(f"❌ Polling POST of the connect answered {posted.status}: {posted.body[:80]!r}")
+    polled = (await fetch(upstream, Request('GET', base + sid_query, []))).body.decode()
+    if not polled.split(POLLING_SEPARATOR)[0].startswith('40{'):
+        return failures + [f"❌ Namespace connect not acknowledged over polling: {polled[:80]!r}"]
+
+    ws_request = Request('GET', f"/socket.io/?EIO=4&transport=websocket{sid_query}", [])
+    reader, writer = await connect_websocket(upstream, ws_request)
+    try:
+        async def receive() -> str:
+            while True:
+                _, opcode, payload = await asyncio.wait_for(read_frame(reader), 5)
+                if opcode == OP_TEXT:
+                    return payload.decode()
+
+        writer.write(encode_frame(OP_TEXT, b'2probe', masked=True))
+        await writer.drain()
+        probe = await receive()
+        if probe != '3probe':
+            return failures + [f"❌ Upgrade probe answered {probe!r}"]
+        # The pending long-poll has to be released before the client switches over
+        pending = asyncio.create_task(fetch(upstream, Request('GET', base + sid_query, [])))
+        writer.write(encode_frame(OP_TEXT, b'5', masked=True))
+        await writer.drain()
+        released = await pending
+        if released.status != 200:
+            failures.append(f"❌ Long-poll across the upgrade answered {released.status}: {released.body[:80]!r}")
+
+        if event:
+            writer.write(encode_frame(OP_TEXT, ('42' + json.dumps(event)).encode(), masked=True))
+            await writer.drain()
+            reply = await receive()
+            if not reply.startswith('4'):
+                failures.append(f"❌ No recorded reply to {event[0]!r} over the upgraded socket: {reply[:80]!r}")
+        writer.write(encode_frame(OP_CLOSE, b'', masked=True))
+        await writer.drain()
+    except asyncio.TimeoutError:
+        failures.append("❌ Upgraded socket went silent")
+    finally:
+        writer.close()
+    return failures
+
+
+async def check(args) -> int:
+    """Replay the cassette to a polling-first client; exits non-zero on a broken handshake"""
+    cassette = Cassette.load(args.cassette)
+    # First recorded client event with a reply, replayed over the upgraded socket
+    event = None
+    if cassette.sockets:
+        replies = SocketScript(cassette.sockets[0]).replies
+        for packet in cassette.sockets[0]:
+            parsed = parse_sio(packet['packet'])
+            if packet['direction'] == 'in' and parsed and parsed['event'] in replies:
+                event = parsed['data']
+                break
+    async with BackendStandIn(cassette, latency=LatencyModel(default={'dist': 'zero'}), port=0) as standin:
+        failures = await polling_client(standin.port, event)
+    for line in failures:
+        print(f"   {line}")
+    print(f"{'❌' if failures else '✅'} Default-transport replay {'failed' if failures else 'passed'}: "
+          f"{standin.stats}")
+    return 1 if failures else 0
+
+
+async def serve(args):
+    if args.mode == 'record':
+        cassette = Cassette(meta={'recorded_at': datetime.now().isoformat(), 'upstream': args.upstream})
+        standin = BackendStandIn(cassette, upstream=args.upstream, port=args.port)
+    else:
+        latency = LatencyModel.load(args.latency) if args.latency else LatencyModel(
+            default={'dist': args.default_latency}
+        )
+        standin = BackendStandIn(Cassette.load(args.cassette), latency=latency, port=args.port)
+
+    async with standin:
+        try:
+            if args.duration:
+                await asyncio.sleep(args.duration)
+            else:
+                await asyncio.Event().wait()
+        finally:
+            if standin.recording:
+                cassette.save(args.cassette)
+                print(f"💾 {len(cassette.http)} exchanges, {len(cassette.sockets)} sockets -> {args.cassette}")
+            print(f"📊 {standin.stats}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Record/replay stand-in for the BURNWISE backend')
+    parser.add_argument('mode', choices=['record', 'replay', 'check'])
+    parser.add_argument('--cassette', default=DEFAULT_CASSETTE)
+    parser.add_argument('--port', type=int, default=STANDIN_PORT)
+    parser.add_argument('--upstream', default='http://localhost:5101',
+                        help='Real backend while recording (run it with PORT=5101)')
+    parser.add_argument('--latency', help='Latency model JSON (see LatencyModel)')
+    parser.add_argument('--default-latency', default='recorded', choices=['recorded', 'zero'])
+    parser.add_argument('--duration', type=float, help='Seconds to run (default: until Ctrl+C)')
+    args = parser.parse_args(argv)
+
+    if args.mode == 'check':
+        return asyncio.run(check(args))
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
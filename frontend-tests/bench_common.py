@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Benchmark Helpers
+Pieces every benchmark mode shares: percentiles, Chromium launch flags, in-page samplers
+Standard library only, so importing it never drags in a browser or NumPy
+"""
+
+from typing import List
+
+# Force every canvas/GL call through SwiftShader so GPU cost is measurable on any box
+SWIFTSHADER_ARGS = [
+    '--use-gl=angle',
+    '--use-angle=swiftshader',
+    '--enable-unsafe-swiftshader',
+    '--ignore-gpu-blocklist',
+]
+
+# Frame pacing + heap growth on /spatial, one sample per page load
+FRAME_SAMPLE_JS = '''async (frames) => {
+    const gaps = [];
+    let last = null;
+    await new Promise(resolve => {
+        const step = (now) => {
+            if (last !== null) gaps.push(now - last);
+            last = now;
+            if (gaps.length < frames) requestAnimationFrame(step); else resolve();
+        };
+        requestAnimationFrame(step);
+    });
+    const heapBefore = performance.memory ? performance.memory.usedJSHeapSize : 0;
+    for (let i = 0; i < 10; i++) {
+        document.querySelectorAll('.dock-icon').forEach(item => {
+            item.dispatchEvent(new MouseEvent('mouseenter', { bubbles: true }));
+            item.dispatchEvent(new MouseEvent('mouseleave', { bubbles: true }));
+        });
+    }
+    await new Promise(resolve => setTimeout(resolve, 500));
+    const heapAfter = performance.memory ? performance.memory.usedJSHeapSize : 0;
+    const sorted = [...gaps].sort((a, b) => a - b);
+    const mean = gaps.reduce((a, b) => a + b, 0) / gaps.length;
+    return {
+        fps: 1000 / mean,
+        frame_ms_p95: sorted[Math.floor(0.95 * (sorted.length - 1))],
+        jank_frames: gaps.filter(t => t > 33).length,
+        heap_delta_mb: (heapAfter - heapBefore) / 1024 / 1024
+    };
+}'''
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty series"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
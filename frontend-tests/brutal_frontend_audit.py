@@ -9,6 +9,10 @@ import asyncio
 import json
 import re
 from playwright.async_api import async_playwright
+from dom_snapshot import capture_snapshot
+from color_analysis import ColorPaletteAnalyzer, GlassMorphismAnalyzer
+from touch_targets import TouchTargetAnalyzer
+from results_store import record_report
 from datetime import datetime
 import subprocess
 import time
@@ -133,21 +137,22 @@ class BrutalFrontendAuditor:
                 if matches:
                     self.critical.append(f"❌ HARDCODED DATA FOUND: {matches[:3]}...")
             
-            # Test 7: Check button states
-            print("\n🔍 TESTING ALL BUTTONS...")
-            buttons = await page.locator('button').all()
-            for i, btn in enumerate(buttons[:10]):  # Test first 10 buttons
-                try:
-                    is_disabled = await btn.is_disabled()
-                    is_visible = await btn.is_visible()
-                    text = await btn.text_content()
-                    
-                    if is_visible and not is_disabled:
-                        await btn.click()
-                        await page.wait_for_timeout(100)
-                        print(f"✅ Button '{text}' clickable")
-                except Exception as e:
-                    self.warnings.append(f"⚠️ Button {i} issue: {str(e)}")
+            # Test 7: Check every interactive element's real hit area
+            print("\n🔍 TESTING ALL TOUCH TARGETS...")
+            # One DOMSnapshot call also covers the font and z-index sweeps below
+            snapshot = await capture_snapshot(page)
+            targets = TouchTargetAnalyzer().analyze(snapshot)
+            for item in targets.blocked:
+                self.critical.append(
+                    f"❌ {item['element']} is {item['hidden_fraction'] * 100:.0f}% covered by another layer"
+                )
+            for item in targets.clipped:
+                self.critical.append(f"❌ {item['element']} is clipped away completely")
+            for item in targets.undersized:
+                self.warnings.append(
+                    f"⚠️ {item['element']} hit area {item['width']}x{item['height']}px (< 44px)"
+                )
+            print(f"✅ Checked {targets.target_count} interactive elements")
             
             # Test 8: Check CSS rendering
             print("\n🔍 CHECKING CSS RENDERING...")
@@ -158,36 +163,30 @@ class BrutalFrontendAuditor:
                 self.warnings.append(f"⚠️ Only {glass_elements} glass morphism elements found")
             
             # Check font consistency
-            fonts = await page.evaluate('''() => {
-                const elements = document.querySelectorAll('*');
-                const fontFamilies = new Set();
-                elements.forEach(el => {
-                    const style = window.getComputedStyle(el);
-                    if (style.fontFamily) fontFamilies.add(style.fontFamily);
-                });
-                return Array.from(fontFamilies);
-            }''')
+            fonts = snapshot.style_values('font-family')
             
             if 'Arial' in str(fonts):
                 self.warnings.append("⚠️ Arial font detected (should be Inter)")
             
+            # Check every painted color against the page's own palette
+            palette = ColorPaletteAnalyzer().analyze_snapshot(snapshot)
+            for dup in palette.near_duplicates:
+                self.warnings.append(
+                    f"⚠️ Near-duplicate color {dup['color']} ({dup['count']}x) "
+                    f"vs {dup['similar_to']} ({dup['similar_count']}x)"
+                )
+            for outlier in palette.outliers[:10]:
+                self.warnings.append(f"⚠️ Off-palette color {outlier['color']} on {outlier['element']}")
+            
+            for item in GlassMorphismAnalyzer().analyze_snapshot(snapshot):
+                self.warnings.append(f"⚠️ Blur behind opaque background on {item['element']}")
+            
             # Test 9: Check z-index layers
             print("\n🔍 CHECKING Z-INDEX LAYERING...")
-            z_indexes = await page.evaluate('''() => {
-                const elements = document.querySelectorAll('*');
-                const zIndexes = [];
-                elements.forEach(el => {
-                    const style = window.getComputedStyle(el);
-                    const z = parseInt(style.zIndex);
-                    if (!isNaN(z) && z !== 0) {
-                        zIndexes.push({
-                            element: el.className,
-                            zIndex: z
-                        });
-                    }
-                });
-                return zIndexes.sort((a, b) => b.zIndex - a.zIndex);
-            }''')
+            z_indexes = [
+                {'element': el.class_name, 'zIndex': el.z_index}
+                for el in snapshot.z_indexed()
+            ]
             
             # Check for overlapping issues
             if len(z_indexes) > 0:
@@ -203,6 +202,7 @@ class BrutalFrontendAuditor:
                     domInteractive: perf.domInteractive
                 };
             }''')
+            self.test_results['performance'] = metrics
             
             if metrics['loadComplete'] > 3000:
                 self.warnings.append(f"⚠️ Slow load time: {metrics['loadComplete']}ms")
@@ -279,6 +279,23 @@ class BrutalFrontendAuditor:
             }, f, indent=2)
         
         print("\n📄 Full report saved to frontend-audit-report.json")
+        
+        record_report(
+            'frontend-audit',
+            {
+                'total_issues': total_issues,
+                'critical': len(self.critical),
+                'warnings': len(self.warnings),
+                'console_errors': len(errors),
+                'failed_requests': len(failed_reqs),
+                'api_calls': len(unique_apis),
+                **{f'{name}_ms': value for name, value in self.test_results.get('performance', {}).items()},
+            },
+            critical=self.critical,
+            warnings=self.warnings,
+            route='/spatial',
+            viewport='1280x720',
+        )
 
 if __name__ == "__main__":
     auditor = BrutalFrontendAuditor()
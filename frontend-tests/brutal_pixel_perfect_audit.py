@@ -9,9 +9,8 @@ NO ROOM FOR MISTAKES
 import asyncio
 import json
 import math
-from playwright.async_api import async_playwright
 from datetime import datetime
-import numpy as np
+from results_store import record_report
 
 class BrutalPixelPerfectAuditor:
     def __init__(self):
@@ -23,6 +22,13 @@ class BrutalPixelPerfectAuditor:
         
     async def run_brutal_audit(self):
         """Run the most comprehensive pixel-perfect audit ever"""
+        # Browser + NumPy only when actually auditing, never for report paths
+        import numpy as np
+        from playwright.async_api import async_playwright
+        from dom_snapshot import capture_snapshot
+        from geometry_buffer import GeometryColumns, collect_geometry
+        from occlusion_map import capture_occlusion_map
+
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=False)
             context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
@@ -213,65 +219,33 @@ class BrutalPixelPerfectAuditor:
             
             # TEST 3: FLOATING PANELS Z-INDEX AND OVERLAP
             print("\n📐 CHECKING FLOATING PANELS FOR OVERLAPS...")
-            panels_data = await page.evaluate('''() => {
-                const panels = document.querySelectorAll('[class*="floating"], [class*="panel"], [class*="modal"]');
-                const elements = [];
-                
-                panels.forEach(panel => {
-                    const rect = panel.getBoundingClientRect();
-                    const styles = window.getComputedStyle(panel);
-                    if (rect.width > 0 && rect.height > 0) {
-                        elements.push({
-                            className: panel.className,
-                            x: rect.x,
-                            y: rect.y,
-                            width: rect.width,
-                            height: rect.height,
-                            left: rect.left,
-                            right: rect.right,
-                            top: rect.top,
-                            bottom: rect.bottom,
-                            zIndex: parseInt(styles.zIndex) || 0,
-                            position: styles.position,
-                            display: styles.display,
-                            visible: styles.visibility !== 'hidden' && styles.display !== 'none'
-                        });
-                    }
-                });
-                
-                return elements;
-            }''')
+            panels = await collect_geometry(
+                page,
+                '[class*="floating"], [class*="panel"], [class*="modal"]',
+                include_styles=True
+            )
             
-            if panels_data:
-                # Check for overlapping panels
-                for i, panel1 in enumerate(panels_data):
-                    if not panel1['visible']:
-                        continue
-                    
-                    for j, panel2 in enumerate(panels_data[i+1:], i+1):
-                        if not panel2['visible']:
-                            continue
-                        
-                        # Check if panels overlap
-                        overlap_x = (
-                            panel1['left'] < panel2['right'] and 
-                            panel1['right'] > panel2['left']
-                        )
-                        overlap_y = (
-                            panel1['top'] < panel2['bottom'] and 
-                            panel1['bottom'] > panel2['top']
+            if len(panels):
+                # Check for overlapping panels - every pair in one broadcast
+                for i, j in panels.overlap_pairs():
+                    # They overlap - check z-index
+                    if panels.z_index[i] == panels.z_index[j]:
+                        self.overlap_issues.append(
+                            f"❌ PANELS OVERLAP WITH SAME Z-INDEX! "
+                            f"{panels.class_of(i)[:30]} and {panels.class_of(j)[:30]} "
+                            f"both at z-index {panels.z_index[i]}"
                         )
-                        
-                        if overlap_x and overlap_y:
-                            # They overlap - check z-index
-                            if panel1['zIndex'] == panel2['zIndex']:
-                                self.overlap_issues.append(
-                                    f"❌ PANELS OVERLAP WITH SAME Z-INDEX! "
-                                    f"{panel1['className'][:30]} and {panel2['className'][:30]} "
-                                    f"both at z-index {panel1['zIndex']}"
-                                )
                 
-                print(f"✅ Analyzed {len(panels_data)} floating panels")
+                print(f"✅ Analyzed {len(panels)} floating panels")
+            
+            # Raw z-index numbers ignore stacking contexts - hit-test what is really on top
+            occlusion = await capture_occlusion_map(page, step=8)
+            for item in occlusion.hidden_controls(min_fraction=0.25):
+                self.overlap_issues.append(
+                    f"❌ CONTROL HIDDEN! {item['element'][:40]} ({item['component']}) "
+                    f"under {item['covered_by']} for {item['hidden_fraction'] * 100:.0f}% of its area"
+                )
+            print(f"✅ Hit-tested {occlusion.rows * occlusion.cols} grid points")
             
             # TEST 4: MAP COORDINATES AND CENTERING
             print("\n📐 CHECKING MAP MATHEMATICAL CENTERING...")
@@ -364,35 +338,21 @@ class BrutalPixelPerfectAuditor:
             golden_ratio = 1.618033988749895
             fibonacci = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233]
             
-            all_elements = await page.evaluate('''() => {
-                const elements = document.querySelectorAll('*');
-                const sizes = [];
-                
-                elements.forEach(el => {
-                    const rect = el.getBoundingClientRect();
-                    if (rect.width > 10 && rect.height > 10) {
-                        sizes.push({
-                            width: rect.width,
-                            height: rect.height,
-                            ratio: rect.width / rect.height,
-                            className: el.className || el.tagName
-                        });
-                    }
-                });
-                
-                return sizes;
-            }''')
+            snapshot = await capture_snapshot(page)
+            sizes = GeometryColumns.from_snapshot(snapshot, min_size=10)
             
             # Check for golden ratio violations in major elements
-            for el in all_elements[:50]:  # Check first 50 elements
-                ratio = el['ratio']
-                if 1.5 < ratio < 1.7:  # Near golden ratio range
-                    deviation = abs(ratio - golden_ratio)
-                    if 0.05 < deviation < 0.1:  # Close but not perfect
-                        self.math_violations.append(
-                            f"⚠️ NEAR GOLDEN RATIO: {el['className'][:30]} "
-                            f"ratio={ratio:.3f} (off by {deviation:.3f})"
-                        )
+            ratios = sizes.ratio[:50]  # Check first 50 elements
+            deviations = np.abs(ratios - golden_ratio)
+            near_golden = (
+                (ratios > 1.5) & (ratios < 1.7) &  # Near golden ratio range
+                (deviations > 0.05) & (deviations < 0.1)  # Close but not perfect
+            )
+            for i in np.flatnonzero(near_golden):
+                self.math_violations.append(
+                    f"⚠️ NEAR GOLDEN RATIO: {sizes.class_of(i)[:30]} "
+                    f"ratio={ratios[i]:.3f} (off by {deviations[i]:.3f})"
+                )
             
             # Generate comprehensive report
             self.generate_report()
@@ -471,6 +431,22 @@ class BrutalPixelPerfectAuditor:
             json.dump(report_data, f, indent=2)
         
         print("\n📄 Detailed report saved to pixel-perfect-audit-report.json")
+        
+        record_report(
+            'pixel-perfect',
+            {
+                'total_issues': total_issues,
+                'critical_issues': len(self.critical_issues),
+                'alignment_issues': len(self.alignment_issues),
+                'spacing_issues': len(self.spacing_issues),
+                'overlap_issues': len(self.overlap_issues),
+                'math_violations': len(self.math_violations),
+            },
+            critical=self.critical_issues,
+            warnings=self.alignment_issues + self.spacing_issues + self.overlap_issues + self.math_violations,
+            route='/spatial',
+            viewport='1920x1080',
+        )
 
 if __name__ == "__main__":
     auditor = BrutalPixelPerfectAuditor()
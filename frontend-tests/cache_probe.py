@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Query Cache Effectiveness Probe
+Does real traffic hit backend/db/queryCache.js? Three passes against a running backend:
+- cold vs warm latency per endpoint (cache cleared before each cold request)
+- a weighted dashboard request mix, sampling hit ratio and eviction/expiry churn over time
+- working sets swept past maxSize, measured and next to an LRU/TTL model of the same cache
+
+Counters come from GET /health/cache, cold starts from POST /health/cache/clear - neither exists in production
+Run the backend with RATE_LIMIT_MAX raised, or the limiter's 429s become the result
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import random
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from bench_common import percentile
+from local_http import Request, fetch
+from results_store import record_report
+
+DEFAULT_BACKEND = 'http://localhost:5001'
+
+# What a dashboard session reads, weighted by how often frontend/src fetches it
+ENDPOINTS = {
+    'burn-requests': (4, '/api/burn-requests?page={page}'),
+    'dashboard-stats': (3, '/api/analytics/dashboard-stats'),
+    'recent-activity': (3, '/api/analytics/recent-activity'),
+    'farms': (2, '/api/farms'),
+    'farm': (2, '/api/farms/{farm}'),
+    'alerts': (2, '/api/alerts'),
+    'schedule': (1, '/api/schedule'),
+    'burn-trends': (1, '/api/analytics/burn-trends'),
+    'farm-performance': (1, '/api/analytics/farm-performance'),
+    'weather-patterns': (1, '/api/analytics/weather-patterns'),
+    'conflict-analysis': (1, '/api/analytics/conflict-analysis'),
+}
+# Each page is its own main-query key (LIMIT/OFFSET are literals); the COUNT(*) key is shared
+SWEEP_TEMPLATE = '/api/burn-requests?page={page}'
+WORKING_SETS = (250, 500, 1000, 2000, 4000, 8000)
+
+# queryCache.js and the TTLs connection.query()/burnRequests.js pass it
+CACHE_MAX_SIZE = 2000
+LIST_TTL_MS = 60000
+COUNT_TTL_MS = 300000
+
+
+class QueryCacheModel:
+    """QueryCache as written: LRU by last access when full, TTL timers from set, gets never extend it"""
+
+    def __init__(self, max_size: int = CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self.entries: 'OrderedDict[str, float]' = OrderedDict()  # key -> expiry, least recent first
+        self.timers: List[Tuple[float, str]] = []
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def _fire_timers(self, now_ms: float):
+        while self.timers and self.timers[0][0] <= now_ms:
+            expiry, key = heapq.heappop(self.timers)
+            if self.entries.get(key) == expiry:
+                del self.entries[key]
+                self.expirations += 1
+
+    def access(self, key: str, now_ms: float, ttl_ms: float) -> bool:
+        """One cached query: get, then set on a miss. True on a hit"""
+        self._fire_timers(now_ms)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True
+        self.misses += 1
+        if len(self.entries) >= self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        self.entries[key] = now_ms + ttl_ms
+        heapq.heappush(self.timers, (now_ms + ttl_ms, key))
+        return False
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def page_accesses(pages: List[int], times_ms: List[float], max_size: int = CACHE_MAX_SIZE,
+                  warmup: int = 0) -> float:
+    """Model hit ratio of a GET /api/burn-requests page sequence - two cached queries per request -
+    counted after the first `warmup` requests"""
+    model = QueryCacheModel(max_size)
+    hits = misses = 0
+    for i, (page, now) in enumerate(zip(pages, times_ms)):
+        if i == warmup:
+            hits, misses = model.hits, model.misses
+        model.access('count', now, COUNT_TTL_MS)
+        model.access(f'page:{page}', now, LIST_TTL_MS)
+    total = model.hits + model.misses - hits - misses
+    return (model.hits - hits) / total if total else 0.0
+
+
+def counter_delta(after: Dict, before: Dict) -> Dict[str, int]:
+    return {k: after.get(k, 0) - before.get(k, 0)
+            for k in ('hits', 'misses', 'evictions', 'expirations', 'invalidations')}
+
+
+def hit_ratio(delta: Dict[str, int]) -> Optional[float]:
+    total = delta['hits'] + delta['misses']
+    return delta['hits'] / total if total else None
+
+
+class CacheProbe:
+    """Cold/warm latency, hit ratio over time and working-set sweep for the query cache"""
+
+    def __init__(self, backend: str = DEFAULT_BACKEND, warm_repeats: int = 5, duration_s: float = 120,
+                 rate: float = 20, concurrency: int = 8, sample_s: float = 5, working_sets=WORKING_SETS,
+                 passes: int = 3, farms: int = 10, min_hit_ratio: float = 0.5, timeout: float = 30,
+                 seed: int = 0):
+        self.backend = backend
+        self.warm_repeats = warm_repeats
+        self.duration_s = duration_s
+        self.rate = rate
+        self.concurrency = concurrency
+        self.sample_s = sample_s
+        self.working_sets = working_sets
+        self.passes = passes
+        self.farms = farms
+        self.min_hit_ratio = min_hit_ratio
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.can_clear = True
+        self.results: Dict = {}
+        self.critical: List[str] = []
+        self.warnings: List[str] = []
+
+    async def _request(self, method: str, path: str) -> Tuple[int, bytes, float]:
+        start = time.perf_counter()
+        try:
+            response = await fetch(self.backend, Request(method, path, []), self.timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            return 0, str(e).encode(), (time.perf_counter() - start) * 1000
+        return response.status, response.body, (time.perf_counter() - start) * 1000
+
+    async def stats(self) -> Dict:
+        status, body, _ = await self._request('GET', '/health/cache')
+        if status != 200:
+            raise RuntimeError(f'GET /health/cache returned HTTP {status} - backend predates the cache counters?')
+        return json.loads(body)
+
+    async def clear(self) -> bool:
+        if self.can_clear:
+            status, _, _ = await self._request('POST', '/health/cache/clear')
+            self.can_clear = status == 200
+        return self.can_clear
+
+    def concrete(self, template: str) -> str:
+        return template.format(page=self.rng.randint(1, 3), farm=self.rng.randint(1, self.farms))
+
+    async def cold_warm(self) -> Dict:
+        print(f"🧊 Cold vs warm: {len(ENDPOINTS)} endpoints, {self.warm_repeats} warm repeats each")
+        rows = {}
+        for name, (_, template) in ENDPOINTS.items():
+            path = template.format(page=1, farm=1)
+            cold = await self.clear()
+            before = await self.stats()
+            status, _, cold_ms = await self._request('GET', path)
+            after_cold = await self.stats()
+            warm_ms = []
+            for _ in range(self.warm_repeats):
+                _, _, elapsed = await self._request('GET', path)
+                warm_ms.append(elapsed)
+            after_warm = await self.stats()
+            first, warm = counter_delta(after_cold, before), counter_delta(after_warm, after_cold)
+            rows[name] = {
+                'path': path,
+                'status': status,
+                'cold': cold,
+                'cold_ms': round(cold_ms, 1),
+                'warm_ms_p50': round(percentile(warm_ms, 50), 1),
+                'speedup': round(cold_ms / max(0.01, percentile(warm_ms, 50)), 2),
+                'cached_queries': first['misses'] + first['hits'],
+                'warm_hit_ratio': hit_ratio(warm),
+            }
+            row = rows[name]
+            if status != 200:
+                self.warnings.append(f"⚠️ {name}: HTTP {status} - latency is the error path")
+            elif row['cached_queries'] == 0:
+                self.warnings.append(f"⚠️ {name}: runs no cached query - every request goes to TiDB")
+            elif row['warm_hit_ratio'] is not None and row['warm_hit_ratio'] < 1:
+                self.warnings.append(f"⚠️ {name}: warm repeats still miss ({row['warm_hit_ratio']:.0%} hits) - "
+                                     f"a parameter changes on every call")
+            hits = '  -' if row['warm_hit_ratio'] is None else f"{row['warm_hit_ratio']:.0%}"
+            print(f"   {name:18} {'cold' if cold else 'warm?'} {row['cold_ms']:>8.1f}ms -> warm "
+                  f"{row['warm_ms_p50']:>7.1f}ms  x{row['speedup']:<6} {row['cached_queries']} cached queries, "
+                  f"warm hits {hits}")
+        if not self.can_clear:
+            self.warnings.append("⚠️ /health/cache/clear unavailable (production?) - 'cold' numbers may be warm")
+        return rows
+
+    async def replay(self) -> Dict:
+        """Weighted mix at a fixed arrival rate, with the counters sampled on a fixed interval"""
+        print(f"🔁 Replay: {self.rate:.0f} req/s for {self.duration_s:.0f}s, {self.concurrency} connections")
+        await self.clear()
+        names = list(ENDPOINTS)
+        weights = [ENDPOINTS[n][0] for n in names]
+        queue: asyncio.Queue = asyncio.Queue()
+        latency: Dict[str, List[float]] = {n: [] for n in names}
+        statuses: Dict[int, int] = {}
+        timeline = []
+
+        async def worker():
+            while True:
+                name = await queue.get()
+                if name is None:
+                    return
+                status, _, elapsed = await self._request('GET', self.concrete(ENDPOINTS[name][1]))
+                statuses[status] = statuses.get(status, 0) + 1
+                latency[name].append(elapsed)
+
+        async def sampler(start: float):
+            previous = await self.stats()
+            while True:
+                await asyncio.sleep(self.sample_s)
+                current = await self.stats()
+                delta = counter_delta(current, previous)
+                timeline.append({
+                    't_s': round(time.perf_counter() - start, 1),
+                    'hit_ratio': hit_ratio(delta),
+                    'evictions_per_s': round(delta['evictions'] / self.sample_s, 2),
+                    'expirations_per_s': round(delta['expirations'] / self.sample_s, 2),
+                    'invalidations_per_s': round(delta['invalidations'] / self.sample_s, 2),
+                    'size': current.get('size'),
+                })
+                previous = current
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        start = time.perf_counter()
+        before = await self.stats()
+        sampling = asyncio.create_task(sampler(start))
+        sent = 0
+        while time.perf_counter() - start < self.duration_s:
+            queue.put_nowait(self.rng.choices(names, weights)[0])
+            sent += 1
+            await asyncio.sleep(self.rng.expovariate(self.rate))
+        for _ in workers:
+            queue.put_nowait(None)
+        await asyncio.gather(*workers)
+        sampling.cancel()
+        total = counter_delta(await self.stats(), before)
+
+        # Ignore the first sample - it is the cold start, not the steady state
+        steady = [s['hit_ratio'] for s in timeline[1:] if s['hit_ratio'] is not None]
+        result = {
+            'requests': sent,
+            'statuses': statuses,
+            'hit_ratio': hit_ratio(total),
+            'steady_hit_ratio': sum(steady) / len(steady) if steady else None,
+            'evictions': total['evictions'],
+            'expirations': total['expirations'],
+            'invalidations': total['invalidations'],
+            'latency_ms_p50': {n: round(percentile(v, 50), 1) for n, v in latency.items() if v},
+            'latency_ms_p95': {n: round(percentile(v, 95), 1) for n, v in latency.items() if v},
+            'timeline': timeline,
+        }
+        ratio = result['steady_hit_ratio']
+        if ratio is not None and ratio < self.min_hit_ratio:
+            self.warnings.append(f"⚠️ Replay steady hit ratio {ratio:.0%} < {self.min_hit_ratio:.0%}")
+        if total['evictions'] and ratio is not None and ratio < self.min_hit_ratio:
+            self.warnings.append(f"⚠️ Replay is thrashing: {total['evictions']} LRU evictions at "
+                                 f"{ratio:.0%} hits - maxSize is below the working set")
+        if statuses.get(429):
+            self.warnings.append(f"⚠️ {statuses[429]} replay requests rate-limited - raise RATE_LIMIT_MAX")
+        return result
+
+    async def sweep_one(self, working_set: int) -> Dict:
+        pages = []
+        for _ in range(self.passes):
+            order = list(range(1, working_set + 1))
+            self.rng.shuffle(order)
+            pages.extend(order)
+        await self.clear()
+        queue: asyncio.Queue = asyncio.Queue()
+        for i, page in enumerate(pages):
+            queue.put_nowait((i, page))
+        sent_ms = [0.0] * len(pages)
+        latency = [0.0] * len(pages)
+        start = time.perf_counter()
+        checkpoint: Dict = {}
+        before = await self.stats()
+
+        async def worker():
+            while not queue.empty():
+                i, page = queue.get_nowait()
+                if i == working_set and not checkpoint:
+                    checkpoint.update(await self.stats())  # end of the warm-up pass, near enough
+                sent_ms[i] = (time.perf_counter() - start) * 1000
+                _, _, latency[i] = await self._request('GET', SWEEP_TEMPLATE.format(page=page))
+
+        await asyncio.gather(*[worker() for _ in range(self.concurrency)])
+        elapsed_s = time.perf_counter() - start
+        after = await self.stats()
+        total = counter_delta(after, before)
+        steady = counter_delta(after, checkpoint or before)
+        warm_latency = latency[working_set:] or latency
+        return {
+            'working_set': working_set,
+            'requests': len(pages),
+            'elapsed_s': round(elapsed_s, 1),
+            'hit_ratio': hit_ratio(steady),
+            'model_hit_ratio': round(page_accesses(pages, sent_ms, warmup=working_set), 4),
+            'model_hit_ratio_2x': round(page_accesses(pages, sent_ms, CACHE_MAX_SIZE * 2, warmup=working_set), 4),
+            'model_hit_ratio_4x': round(page_accesses(pages, sent_ms, CACHE_MAX_SIZE * 4, warmup=working_set), 4),
+            'evictions': total['evictions'],
+            'expirations': total['expirations'],
+            'size': after.get('size'),
+            'latency_ms_p50': round(percentile(warm_latency, 50), 1),
+            'latency_ms_p95': round(percentile(warm_latency, 95), 1),
+        }
+
+    async def sweep(self) -> Dict:
+        print(f"📈 Working-set sweep {list(self.working_sets)} pages x {self.passes} passes "
+              f"(maxSize {CACHE_MAX_SIZE})")
+        rows = {}
+        for working_set in self.working_sets:
+            rows[working_set] = row = await self.sweep_one(working_set)
+            measured = '  -' if row['hit_ratio'] is None else f"{row['hit_ratio']:.0%}"
+            print(f"   {working_set:>6} pages: hits {measured:>4} (model {row['model_hit_ratio']:.0%}, "
+                  f"2x size {row['model_hit_ratio_2x']:.0%}, 4x {row['model_hit_ratio_4x']:.0%}), "
+                  f"{row['evictions']} evictions, {row['expirations']} expiries, "
+                  f"p50 {row['latency_ms_p50']:.1f}ms in {row['elapsed_s']:.0f}s")
+            if row['elapsed_s'] * 1000 > LIST_TTL_MS:
+                self.warnings.append(f"⚠️ {working_set}-page sweep took {row['elapsed_s']:.0f}s - longer than "
+                                     f"the {LIST_TTL_MS // 1000}s TTL, so expiry is part of its hit ratio")
+        collapse = [w for w, r in rows.items() if r['hit_ratio'] is not None and r['hit_ratio'] < self.min_hit_ratio]
+        if collapse:
+            self.warnings.append(f"⚠️ Hit ratio drops below {self.min_hit_ratio:.0%} from a "
+                                 f"{min(collapse)}-page working set (maxSize {CACHE_MAX_SIZE})")
+        return rows
+
+    async def run(self, phases=('cold-warm', 'replay', 'sweep')) -> Dict:
+        print("🗃️  BURNWISE QUERY CACHE PROBE")
+        try:
+            self.results['initial'] = await self.stats()
+            if 'cold-warm' in phases:
+                self.results['cold_warm'] = await self.cold_warm()
+            if 'replay' in phases:
+                self.results['replay'] = await self.replay()
+            if 'sweep' in phases:
+                self.results['sweep'] = await self.sweep()
+        except (RuntimeError, ValueError) as e:
+            self.critical.append(f"❌ {str(e)}")
+        self.print_report()
+        self.save()
+        return self.results
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        replay = self.results.get('replay')
+        if replay:
+            ratio = replay['steady_hit_ratio']
+            status = '✅' if ratio is not None and ratio >= self.min_hit_ratio else '⚠️'
+            steady = '-' if ratio is None else f"{ratio:.0%}"
+            print(f"{status} Replay: steady hit ratio {steady}, {replay['evictions']} evictions, "
+                  f"{replay['expirations']} expiries, {replay['invalidations']} invalidations "
+                  f"over {replay['requests']} requests")
+        cold_warm = self.results.get('cold_warm')
+        if cold_warm:
+            best = max(cold_warm.items(), key=lambda item: item[1]['speedup'])
+            print(f"   Largest cold->warm win: {best[0]} x{best[1]['speedup']}")
+        for line in self.critical + self.warnings:
+            print(f"   {line}")
+
+    def save(self):
+        metrics = {}
+        for name, row in self.results.get('cold_warm', {}).items():
+            metrics[f'{name}_cold_ms'] = row['cold_ms']
+            metrics[f'{name}_warm_ms'] = row['warm_ms_p50']
+        replay = self.results.get('replay')
+        if replay:
+            for key in ('hit_ratio', 'steady_hit_ratio', 'evictions', 'expirations', 'invalidations'):
+                if replay[key] is not None:
+                    metrics[f'replay_{key}'] = replay[key]
+        for working_set, row in self.results.get('sweep', {}).items():
+            if row['hit_ratio'] is not None:
+                metrics[f'sweep_{working_set}_hit_ratio'] = row['hit_ratio']
+            metrics[f'sweep_{working_set}_evictions'] = row['evictions']
+        record_report('query-cache', metrics, critical=self.critical, warnings=self.warnings, route='/api')
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'backend': self.backend,
+            'cache': {'max_size': CACHE_MAX_SIZE, 'list_ttl_ms': LIST_TTL_MS, 'count_ttl_ms': COUNT_TTL_MS},
+            **self.results,
+            'critical': self.critical,
+            'warnings': self.warnings,
+        }
+        with open('query-cache-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to query-cache-report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Query cache hit ratio, churn and cold/warm latency probe')
+    parser.add_argument('--backend', default=DEFAULT_BACKEND)
+    parser.add_argument('--phases', nargs='+', choices=('cold-warm', 'replay', 'sweep'),
+                        default=['cold-warm', 'replay', 'sweep'])
+    parser.add_argument('--warm-repeats', type=int, default=5)
+    parser.add_argument('--duration', type=float, default=120, help='Replay seconds')
+    parser.add_argument('--rate', type=float, default=20, help='Replay requests per second')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--sample', type=float, default=5, help='Seconds between counter samples')
+    parser.add_argument('--working-sets', type=int, nargs='+', default=list(WORKING_SETS))
+    parser.add_argument('--passes', type=int, default=3, help='Passes over each working set')
+    parser.add_argument('--farms', type=int, default=10, help='Farm ids the replay spreads over')
+    parser.add_argument('--min-hit-ratio', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    probe = CacheProbe(args.backend, args.warm_repeats, args.duration, args.rate, args.concurrency, args.sample,
+                       sorted(args.working_sets), args.passes, args.farms, args.min_hit_ratio, seed=args.seed)
+    asyncio.run(probe.run(args.phases))
+    return 1 if probe.critical else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
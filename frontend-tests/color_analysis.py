@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Bulk Color Palette Analysis
+Every painted color on the page, parsed into ONE NumPy array
+Clusters the real palette, flags near-duplicates and one-off outliers
+"""
+
+import re
+from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from verify_ui_measurements import PRIMARY_COLORS
+
+COLOR_PROPERTIES = ('color', 'background-color')
+
+RGBA_PATTERN = re.compile(r'rgba?\(\s*([\d.]+)[,\s]+([\d.]+)[,\s]+([\d.]+)(?:\s*[,/]\s*([\d.]+%?))?\s*\)')
+HEX_PATTERN = re.compile(r'^#([0-9a-fA-F]{3,8})$')
+
+
+def parse_color(value: str) -> Tuple[float, float, float, float]:
+    """Parse one rgb()/rgba()/hex string into (r, g, b, a); NaNs if unparseable"""
+    value = value.strip()
+    if value.lower() == 'transparent':
+        return (0.0, 0.0, 0.0, 0.0)
+
+    match = RGBA_PATTERN.match(value)
+    if match:
+        r, g, b, a = match.groups()
+        if a is None:
+            alpha = 1.0
+        elif a.endswith('%'):
+            alpha = float(a[:-1]) / 100
+        else:
+            alpha = float(a)
+        return (float(r), float(g), float(b), alpha)
+
+    match = HEX_PATTERN.match(value)
+    if match:
+        digits = match.group(1)
+        if len(digits) in (3, 4):
+            digits = ''.join(c * 2 for c in digits)
+        if len(digits) in (6, 8):
+            channels = [int(digits[i:i + 2], 16) for i in range(0, len(digits), 2)]
+            alpha = channels[3] / 255 if len(channels) == 4 else 1.0
+            return (float(channels[0]), float(channels[1]), float(channels[2]), alpha)
+
+    return (np.nan, np.nan, np.nan, np.nan)
+
+
+def parse_colors(values: List[str]) -> np.ndarray:
+    """Parse many color strings into an (N, 4) array, parsing each distinct string once"""
+    distinct, inverse = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    parsed = np.array([parse_color(v) for v in distinct], dtype=np.float64).reshape(-1, 4)
+    return parsed[inverse.reshape(-1)]
+
+
+def _rgba_space(colors: np.ndarray) -> np.ndarray:
+    """Alpha rescaled to 0-255 so it weighs like a color channel"""
+    return np.column_stack([colors[:, :3], colors[:, 3] * 255])
+
+
+def _brand_palette() -> Tuple[List[str], np.ndarray]:
+    names = [f"{group} {hex_value}" for group, values in PRIMARY_COLORS.items() for hex_value in values]
+    colors = parse_colors([hex_value for values in PRIMARY_COLORS.values() for hex_value in values])
+    return names, colors[:, :3]
+
+
+@dataclass
+class PaletteReport:
+    """Result of one bulk palette pass"""
+    sample_count: int = 0
+    palette: List[Dict] = field(default_factory=list)
+    near_duplicates: List[Dict] = field(default_factory=list)
+    outliers: List[Dict] = field(default_factory=list)
+    unparsed: List[str] = field(default_factory=list)
+
+
+class ColorPaletteAnalyzer:
+    """Cluster every captured color into a palette and flag the strays"""
+
+    def __init__(self, cluster_distance: float = 30.0, duplicate_distance: float = 8.0,
+                 outlier_share: float = 0.01, min_outlier_count: int = 2):
+        # RGB distance that still counts as the same palette entry
+        self.cluster_distance = cluster_distance
+        # RGBA distance under which two *different* strings are near-duplicates
+        self.duplicate_distance = duplicate_distance
+        # Clusters used by fewer elements than this are outliers
+        self.outlier_share = outlier_share
+        self.min_outlier_count = min_outlier_count
+
+    def collect(self, snapshot, properties=COLOR_PROPERTIES) -> Tuple[List[str], List[str]]:
+        """Flatten (element, color string) pairs for every visible element"""
+        names, values = [], []
+        for el in snapshot.elements:
+            if not el.visible:
+                continue
+            for prop in properties:
+                value = el.styles.get(prop, '')
+                if value:
+                    names.append(f"{el.name} [{prop}]")
+                    values.append(value)
+        return names, values
+
+    def analyze(self, element_names: List[str], values: List[str]) -> PaletteReport:
+        """One vectorized pass over all (element, color) samples"""
+        report = PaletteReport(sample_count=len(values))
+        if not values:
+            return report
+
+        colors = parse_colors(values)
+        parsed = ~np.isnan(colors).any(axis=1)
+        report.unparsed = sorted({values[i] for i in np.flatnonzero(~parsed)})
+
+        # Fully transparent paint is not part of the palette
+        painted = parsed & (colors[:, 3] > 0)
+        sample_index = np.flatnonzero(painted)
+        if len(sample_index) == 0:
+            return report
+
+        distinct, inverse, counts = np.unique(
+            colors[painted], axis=0, return_inverse=True, return_counts=True
+        )
+        inverse = inverse.reshape(-1)
+
+        labels, centers = self._cluster(distinct[:, :3], counts)
+        cluster_counts = np.bincount(labels, weights=counts, minlength=len(centers)).astype(int)
+
+        brand_names, brand_colors = _brand_palette()
+        brand_distance = np.linalg.norm(centers[:, None, :] - brand_colors[None, :, :], axis=2)
+        nearest_brand = brand_distance.argmin(axis=1)
+
+        for k in np.argsort(-cluster_counts):
+            report.palette.append({
+                'rgb': [round(float(c)) for c in centers[k]],
+                'count': int(cluster_counts[k]),
+                'variants': int((labels == k).sum()),
+                'nearest_brand': brand_names[nearest_brand[k]],
+                'brand_distance': round(float(brand_distance[k, nearest_brand[k]]), 1),
+            })
+
+        report.near_duplicates = self._near_duplicates(distinct, counts, values, sample_index, inverse)
+
+        threshold = max(self.min_outlier_count, self.outlier_share * len(sample_index))
+        rare = cluster_counts < threshold
+        for sample, distinct_idx in zip(sample_index, inverse):
+            k = labels[distinct_idx]
+            if rare[k]:
+                report.outliers.append({
+                    'element': element_names[sample],
+                    'color': values[sample],
+                    'cluster_count': int(cluster_counts[k]),
+                    'nearest_brand': brand_names[nearest_brand[k]],
+                })
+
+        return report
+
+    def analyze_snapshot(self, snapshot) -> PaletteReport:
+        return self.analyze(*self.collect(snapshot))
+
+    def _cluster(self, rgb: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Leader clustering, most-used colors first so they become the centers
+
+        Each pass promotes the most-used color no center covers yet and covers everything within
+        cluster_distance of it, so the loop runs once per palette entry, not once per color.
+        Colors then join the nearest center that outranks them, as a one-by-one leader pass would.
+        """
+        if len(rgb) == 0:
+            return np.empty(0, dtype=np.int64), np.empty((0, 3))
+        order = np.argsort(-counts, kind='stable')
+        ranked = rgb[order]
+        covered = np.zeros(len(ranked), dtype=bool)
+        leaders, rows = [], []
+        while not covered.all():
+            leader = int(np.argmin(covered))
+            leaders.append(leader)
+            rows.append(np.linalg.norm(ranked - ranked[leader], axis=1))
+            covered |= rows[-1] <= self.cluster_distance
+
+        leaders = np.array(leaders)
+        # Centers x colors; a center promoted after a color did not exist when that color was placed
+        distance = np.vstack(rows)
+        distance[leaders[:, None] > np.arange(len(ranked))[None, :]] = np.inf
+        labels = np.empty(len(rgb), dtype=np.int64)
+        labels[order] = distance.argmin(axis=0)
+        return labels, ranked[leaders]
+
+    def _near_duplicates(self, distinct, counts, values, sample_index, inverse) -> List[Dict]:
+        """Distinct RGBA values that sit almost on top of each other"""
+        space = _rgba_space(distinct)
+        distance = np.linalg.norm(space[:, None, :] - space[None, :, :], axis=2)
+        pairs = np.argwhere(np.triu((distance > 0) & (distance <= self.duplicate_distance), k=1))
+
+        # Representative source string for each distinct color
+        first_sample = np.full(len(distinct), -1)
+        first_sample[inverse[::-1]] = sample_index[::-1]
+
+        duplicates = []
+        for i, j in pairs:
+            # The rarer variant is the one that should be snapped to the common one
+            common, stray = (i, j) if counts[i] >= counts[j] else (j, i)
+            duplicates.append({
+                'color': values[first_sample[stray]],
+                'count': int(counts[stray]),
+                'similar_to': values[first_sample[common]],
+                'similar_count': int(counts[common]),
+                'distance': round(float(distance[i, j]), 2),
+            })
+        return sorted(duplicates, key=lambda d: d['distance'])
+
+
+class GlassMorphismAnalyzer:
+    """Bulk version of UIVerifier.verify_glass_morphism over the whole page"""
+
+    def analyze_snapshot(self, snapshot) -> List[Dict]:
+        """Blurred elements whose background is fully opaque (the blur can never show)"""
+        elements = [el for el in snapshot.elements if el.visible]
+        if not elements:
+            return []
+
+        filters = np.array([el.styles.get('backdrop-filter', 'none') for el in elements], dtype=str)
+        backgrounds = [el.styles.get('background-color', '') or 'transparent' for el in elements]
+        blurred = np.char.find(filters, 'blur') >= 0
+        alpha = parse_colors(backgrounds)[:, 3]
+        broken = blurred & (alpha >= 1)
+
+        return [
+            {
+                'element': elements[i].name,
+                'backdrop_filter': filters[i],
+                'background': backgrounds[i],
+            }
+            for i in np.flatnonzero(broken)
+        ]
@@ -413,4 +413,12 @@ if __name__ == "__main__":
     with open('audit_report.json', 'w') as f:
         json.dump(report, f, indent=2)
     
-    print("\n📄 Report saved to audit_report.json")
\ No newline at end of file
+    print("\n📄 Report saved to audit_report.json")
+    
+    from results_store import record_report
+    record_report(
+        'comprehensive-ui',
+        {'score': report['score'], 'duration_s': report['duration'], **report['metrics']},
+        critical=report['issues'],
+        route='/spatial',
+    )
\ No newline at end of file
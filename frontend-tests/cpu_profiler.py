@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+BURNWISE JS CPU Profile Attribution
+Records a DevTools CPU profile around EVERY scripted interaction
+Self/total time per function and source file + flamegraph-ready collapsed stacks
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+from datetime import datetime
+
+from interactions import INTERACTIONS, login
+from results_store import record_report
+
+# 100us sampling - fine enough for React commits, cheap enough not to skew them
+SAMPLING_INTERVAL_US = 100
+
+IDLE_FRAMES = {'(idle)', '(program)', '(garbage collector)', '(root)'}
+
+
+def frame_key(call_frame: Dict) -> Tuple[str, str]:
+    """(function, source file) identity of a profile node"""
+    name = call_frame.get('functionName') or '(anonymous)'
+    url = call_frame.get('url') or ''
+    return name, url.split('?')[0].rsplit('/', 1)[-1]
+
+
+def frame_label(call_frame: Dict) -> str:
+    """Collapsed-stack frame: semicolons are the separator, so they cannot appear"""
+    name, source = frame_key(call_frame)
+    line = call_frame.get('lineNumber', -1) + 1
+    label = f"{name} ({source}:{line})" if source else name
+    return label.replace(';', ',')
+
+
+def node_self_times(profile: Dict) -> Dict[int, float]:
+    """Microseconds of self time per node id, from samples + timeDeltas"""
+    samples = profile.get('samples', [])
+    deltas = profile.get('timeDeltas', [])
+    self_time = defaultdict(float)
+    # timeDeltas[i] is the gap *before* sample i, so sample i lasts timeDeltas[i + 1]
+    for i, node_id in enumerate(samples):
+        if i + 1 < len(deltas):
+            self_time[node_id] += deltas[i + 1]
+        else:
+            self_time[node_id] += max(0, profile['endTime'] - profile['startTime'] - sum(deltas))
+    return self_time
+
+
+class ProfileAggregate:
+    """Accumulates CPU profiles of one interaction across repeated runs"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.runs = 0
+        self.wall_us = 0.0
+        self.self_us = defaultdict(float)
+        self.total_us = defaultdict(float)
+        self.file_self_us = defaultdict(float)
+        self.collapsed = defaultdict(float)
+
+    def add(self, profile: Dict):
+        self.runs += 1
+        self.wall_us += profile['endTime'] - profile['startTime']
+
+        nodes = {node['id']: node for node in profile['nodes']}
+        parent = {}
+        for node in profile['nodes']:
+            for child in node.get('children', []):
+                parent[child] = node['id']
+
+        for node_id, micros in node_self_times(profile).items():
+            node = nodes[node_id]
+            key = frame_key(node['callFrame'])
+            self.self_us[key] += micros
+            self.file_self_us[key[1] or key[0]] += micros
+
+            # Walk to the root once; recursion must not count a frame twice
+            stack = []
+            seen = set()
+            current = node_id
+            while current is not None:
+                frame = nodes[current]['callFrame']
+                if frame.get('functionName') != '(root)':
+                    stack.append(frame_label(frame))
+                    frame_id = frame_key(frame)
+                    if frame_id not in seen:
+                        seen.add(frame_id)
+                        self.total_us[frame_id] += micros
+                current = parent.get(current)
+            if stack:
+                self.collapsed[';'.join(reversed(stack))] += micros
+
+    def top_functions(self, limit: int = 25) -> List[Dict]:
+        runs = self.runs or 1
+        ranked = sorted(
+            (key for key in self.self_us if key[0] not in IDLE_FRAMES),
+            key=lambda key: -self.self_us[key],
+        )
+        return [
+            {
+                'function': name,
+                'file': source,
+                'self_ms_per_run': round(self.self_us[(name, source)] / runs / 1000, 3),
+                'total_ms_per_run': round(self.total_us[(name, source)] / runs / 1000, 3),
+            }
+            for name, source in ranked[:limit]
+        ]
+
+    def top_files(self, limit: int = 15) -> List[Dict]:
+        runs = self.runs or 1
+        ranked = sorted(
+            (key for key in self.file_self_us if key not in IDLE_FRAMES),
+            key=lambda key: -self.file_self_us[key],
+        )
+        return [
+            {'file': source, 'self_ms_per_run': round(self.file_self_us[source] / runs / 1000, 3)}
+            for source in ranked[:limit]
+        ]
+
+    def write_collapsed(self, path: str):
+        """Brendan Gregg collapsed format, microseconds as the sample weight"""
+        with open(path, 'w') as f:
+            for stack, micros in sorted(self.collapsed.items()):
+                if micros >= 1:
+                    f.write(f"{stack} {int(micros)}\n")
+
+
+class CPUProfiler:
+    """Wraps a CDP session: start before an interaction, stop after"""
+
+    def __init__(self, page, interval_us: int = SAMPLING_INTERVAL_US):
+        self.page = page
+        self.interval_us = interval_us
+        self.client = None
+
+    async def __aenter__(self):
+        self.client = await self.page.context.new_cdp_session(self.page)
+        await self.client.send('Profiler.enable')
+        await self.client.send('Profiler.setSamplingInterval', {'interval': self.interval_us})
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.client.send('Profiler.disable')
+        await self.client.detach()
+
+    async def profile(self, action) -> Dict:
+        await self.client.send('Profiler.start')
+        try:
+            await action()
+        finally:
+            result = await self.client.send('Profiler.stop')
+        return result['profile']
+
+
+class InteractionProfiler:
+    """Profile each scripted interaction N times and aggregate"""
+
+    def __init__(self, interactions: List[str], runs: int = 5, output_dir: str = 'cpu-profiles'):
+        self.interactions = [INTERACTIONS[name] for name in interactions]
+        self.runs = runs
+        self.output_dir = output_dir
+        self.aggregates = {name: ProfileAggregate(name) for name in interactions}
+        self.failures = []
+
+    async def run(self, headless: bool = False):
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
+            page = await context.new_page()
+            await login(page)
+
+            async with CPUProfiler(page) as profiler:
+                for interaction in self.interactions:
+                    print(f"\n🔥 PROFILING {interaction.name} x{self.runs}...")
+                    for run in range(self.runs):
+                        try:
+                            await interaction.prepare(page)
+                            profile = await profiler.profile(lambda: interaction.run(page))
+                            self.aggregates[interaction.name].add(profile)
+                        except Exception as e:
+                            self.failures.append(f"❌ {interaction.name} run {run}: {str(e)}")
+
+            await browser.close()
+
+        return self.generate_report()
+
+    def generate_report(self) -> Dict:
+        os.makedirs(self.output_dir, exist_ok=True)
+        report = {'timestamp': datetime.now().isoformat(), 'interactions': {}, 'failures': self.failures}
+
+        print("\n" + "=" * 80)
+        print("🔥 CPU PROFILE ATTRIBUTION REPORT")
+        print("=" * 80)
+
+        for name, aggregate in self.aggregates.items():
+            if not aggregate.runs:
+                continue
+            collapsed_path = os.path.join(self.output_dir, f"{name}.collapsed")
+            aggregate.write_collapsed(collapsed_path)
+
+            functions = aggregate.top_functions()
+            report['interactions'][name] = {
+                'runs': aggregate.runs,
+                'wall_ms_per_run': round(aggregate.wall_us / aggregate.runs / 1000, 2),
+                'top_functions': functions,
+                'top_files': aggregate.top_files(),
+                'collapsed_stacks': collapsed_path,
+            }
+
+            print(f"\n📊 {name} ({aggregate.runs} runs, {aggregate.wall_us / aggregate.runs / 1000:.0f}ms each)")
+            for fn in functions[:10]:
+                print(f"   {fn['self_ms_per_run']:8.2f}ms self {fn['total_ms_per_run']:8.2f}ms total  "
+                      f"{fn['function']} ({fn['file']})")
+
+            record_report(
+                'cpu-profile',
+                {
+                    'wall_ms_per_run': report['interactions'][name]['wall_ms_per_run'],
+                    **{f"self_ms:{entry['file']}": entry['self_ms_per_run'] for entry in aggregate.top_files()},
+                },
+                route=INTERACTIONS[name].route,
+                viewport='1920x1080',
+                profile=name,
+            )
+
+        for failure in self.failures:
+            print(f"   {failure}")
+
+        report_path = os.path.join(self.output_dir, 'cpu-profile-report.json')
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📄 Report saved to {report_path} (feed *.collapsed to flamegraph.pl / speedscope)")
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Profile scripted interactions')
+    parser.add_argument('--interaction', action='append', choices=sorted(INTERACTIONS),
+                        help='Interaction to profile (repeatable, default: all)')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--output-dir', default='cpu-profiles')
+    parser.add_argument('--headless', action='store_true')
+    args = parser.parse_args(argv)
+
+    profiler = InteractionProfiler(args.interaction or list(INTERACTIONS), args.runs, args.output_dir)
+    asyncio.run(profiler.run(headless=args.headless))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+BURNWISE DOMSnapshot Capture Backend
+ONE CDP call for the layout + computed styles of EVERY element
+NO per-element getComputedStyle sweeps, NO giant JSON payloads
+"""
+
+import json
+import sys
+from typing import Dict, List
+from dataclasses import dataclass, field
+
+from verify_ui_measurements import UIElement
+
+# Only these computed styles are serialised by Chromium - keep the list short,
+# every extra property adds a string index to every layout node
+SNAPSHOT_STYLES = (
+    'display',
+    'visibility',
+    'opacity',
+    'position',
+    'z-index',
+    'font-family',
+    'font-size',
+    'color',
+    'background-color',
+    'backdrop-filter',
+    'border-radius',
+    'box-shadow',
+    'cursor',
+    'pointer-events',
+    'overflow-x',
+    'overflow-y',
+)
+
+ELEMENT_NODE = 1
+
+
+@dataclass
+class SnapshotElement:
+    """One laid-out element decoded from the DOMSnapshot string tables"""
+    node_index: int
+    parent_index: int
+    backend_node_id: int
+    tag: str
+    class_name: str
+    element_id: str
+    attributes: Dict[str, str]
+    x: float
+    y: float
+    width: float
+    height: float
+    styles: Dict[str, str]
+    paint_order: int = 0
+    is_clickable: bool = False
+    is_stacking_context: bool = False
+
+    @property
+    def name(self) -> str:
+        """Human readable label in the same shape the auditors print"""
+        if self.element_id:
+            return f"{self.tag}#{self.element_id}"
+        if self.class_name:
+            return f"{self.tag}.{'.'.join(self.class_name.split())}"
+        return self.tag
+
+    @property
+    def z_index(self) -> int:
+        """Computed z-index, 'auto' counts as 0"""
+        try:
+            return int(self.styles.get('z-index', 'auto'))
+        except ValueError:
+            return 0
+
+    @property
+    def visible(self) -> bool:
+        """Rendered with a non-empty box"""
+        return (
+            self.width > 0 and self.height > 0 and
+            self.styles.get('display') != 'none' and
+            self.styles.get('visibility') != 'hidden'
+        )
+
+
+@dataclass
+class PageSnapshot:
+    """Whole-page snapshot: every laid-out element of the main frame"""
+    url: str
+    viewport_width: float
+    viewport_height: float
+    scroll_x: float
+    scroll_y: float
+    elements: List[SnapshotElement] = field(default_factory=list)
+
+    @classmethod
+    def from_capture(cls, capture: Dict) -> 'PageSnapshot':
+        """Decode a raw capture (see capture_raw) into the analysis model"""
+        raw = capture['snapshot']
+        strings = raw['strings']
+        doc = raw['documents'][0]  # Main frame only - the app has no iframes
+        nodes = doc['nodes']
+        layout = doc['layout']
+        style_names = capture.get('styles', SNAPSHOT_STYLES)
+
+        def s(index):
+            return strings[index] if index is not None and index >= 0 else ''
+
+        node_names = nodes['nodeName']
+        node_types = nodes['nodeType']
+        parents = nodes['parentIndex']
+        backend_ids = nodes['backendNodeId']
+        attributes = nodes.get('attributes', [])
+        clickable = set(nodes.get('isClickable', {}).get('index', []))
+        stacking = set(layout.get('stackingContexts', {}).get('index', []))
+        paint_orders = layout.get('paintOrders', [])
+
+        scroll_x = doc.get('scrollOffsetX', 0)
+        scroll_y = doc.get('scrollOffsetY', 0)
+
+        elements = []
+        for layout_index, node_index in enumerate(layout['nodeIndex']):
+            if node_types[node_index] != ELEMENT_NODE:
+                continue
+
+            attrs = attributes[node_index] if node_index < len(attributes) else []
+            attr_map = {s(attrs[i]): s(attrs[i + 1]) for i in range(0, len(attrs) - 1, 2)}
+            style_values = layout['styles'][layout_index]
+            bounds = layout['bounds'][layout_index]
+
+            elements.append(SnapshotElement(
+                node_index=node_index,
+                parent_index=parents[node_index],
+                backend_node_id=backend_ids[node_index],
+                tag=s(node_names[node_index]).lower(),
+                class_name=attr_map.get('class', ''),
+                element_id=attr_map.get('id', ''),
+                attributes=attr_map,
+                # Bounds are document coordinates - shift into the viewport
+                x=bounds[0] - scroll_x,
+                y=bounds[1] - scroll_y,
+                width=bounds[2],
+                height=bounds[3],
+                styles={name: s(value) for name, value in zip(style_names, style_values)},
+                paint_order=paint_orders[layout_index] if layout_index < len(paint_orders) else 0,
+                is_clickable=node_index in clickable,
+                is_stacking_context=layout_index in stacking,
+            ))
+
+        # Layout order is not guaranteed to be document order; analyzers rely on it
+        elements.sort(key=lambda el: el.node_index)
+
+        return cls(
+            url=s(doc.get('documentURL')),
+            viewport_width=capture['viewport']['width'],
+            viewport_height=capture['viewport']['height'],
+            scroll_x=scroll_x,
+            scroll_y=scroll_y,
+            elements=elements,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'PageSnapshot':
+        """Decode a capture previously written by save_capture"""
+        with open(path) as f:
+            return cls.from_capture(json.load(f))
+
+    def style_values(self, prop: str) -> List[str]:
+        """Distinct values of one whitelisted style across the page"""
+        return sorted({el.styles.get(prop, '') for el in self.elements} - {''})
+
+    def z_indexed(self) -> List[SnapshotElement]:
+        """Elements with an explicit non-zero z-index, highest first"""
+        return sorted(
+            (el for el in self.elements if el.z_index != 0),
+            key=lambda el: el.z_index,
+            reverse=True,
+        )
+
+    def select(self, class_fragment: str) -> List[SnapshotElement]:
+        """Elements whose class attribute contains the fragment"""
+        return [el for el in self.elements if class_fragment in el.class_name]
+
+    def to_ui_elements(self, visible_only: bool = True) -> List[UIElement]:
+        """Convert to the UIVerifier measurement model"""
+        ui_elements = []
+        for el in self.elements:
+            if visible_only and not el.visible:
+                continue
+            try:
+                opacity = float(el.styles.get('opacity', '1') or 1)
+            except ValueError:
+                opacity = 1.0
+            ui_elements.append(UIElement(
+                name=el.name,
+                x=el.x,
+                y=el.y,
+                width=el.width,
+                height=el.height,
+                color=el.styles.get('background-color', ''),
+                opacity=opacity,
+                z_index=el.z_index,
+            ))
+        return ui_elements
+
+
+async def capture_raw(page, styles=SNAPSHOT_STYLES) -> Dict:
+    """Grab layout + whitelisted styles for the whole page in one protocol call"""
+    client = await page.context.new_cdp_session(page)
+    try:
+        snapshot = await client.send('DOMSnapshot.captureSnapshot', {
+            'computedStyles': list(styles),
+            'includePaintOrder': True,
+            'includeDOMRects': False,
+        })
+    finally:
+        await client.detach()
+
+    viewport = page.viewport_size or await page.evaluate(
+        '() => ({width: window.innerWidth, height: window.innerHeight})'
+    )
+    return {
+        'url': page.url,
+        'viewport': viewport,
+        'styles': list(styles),
+        'snapshot': snapshot,
+    }
+
+
+async def capture_snapshot(page, styles=SNAPSHOT_STYLES) -> PageSnapshot:
+    """Capture and decode straight into a PageSnapshot"""
+    return PageSnapshot.from_capture(await capture_raw(page, styles))
+
+
+def save_capture(capture: Dict, path: str):
+    """Persist a raw capture so analysis can run offline"""
+    with open(path, 'w') as f:
+        json.dump(capture, f)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: dom_snapshot.py <capture.json>")
+        sys.exit(1)
+
+    snapshot = PageSnapshot.load(sys.argv[1])
+    print(f"📸 {snapshot.url}: {len(snapshot.elements)} laid-out elements")
+    print(f"   Fonts: {snapshot.style_values('font-family')}")
+    print(f"   Z-indexed elements: {len(snapshot.z_indexed())}")
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Latency + Fault Injection Proxy
+Sits on the backend port between browser and backend (real or stand-in)
+Per-route delay, jitter, bandwidth caps, errors, resets, dropped WebSocket frames
+Then measures how much time-to-interactive and frame pacing degrade per scenario
+
+Run the backend on another port (PORT=5101, or backend_standin.py replay --port 5101)
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import random
+import statistics
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from local_http import (
+    OP_TEXT, LocalServer, Request, Response, accept_websocket, connect_websocket, cors_headers,
+    encode_response, fetch, relay_frames,
+)
+from backend_standin import parse_sio
+from bench_common import FRAME_SAMPLE_JS
+from interactions import FRONTEND_URL, login
+from results_store import record_report
+
+PROXY_PORT = 5001
+DEFAULT_UPSTREAM = 'http://localhost:5101'
+
+# Built-in scenarios; --scenarios FILE adds/overrides with the same shape
+DEFAULT_SCENARIOS = {
+    'baseline': [],
+    'slow-weather': [{'match': '/api/weather/*', 'delay_ms': 3000, 'jitter_ms': 500}],
+    'slow-everything': [{'match': '/api/*', 'delay_ms': 800, 'jitter_ms': 400}],
+    'farms-500': [{'match': 'GET /api/farms*', 'status': 500}],
+    'burn-requests-flaky': [{'match': '/api/burn-requests*', 'status': 503, 'error_rate': 0.5}],
+    'analytics-reset': [{'match': '/api/analytics/*', 'reset': True}],
+    '3g-bandwidth': [{'match': '/api/*', 'delay_ms': 300, 'bandwidth_kbps': 400}],
+    'socket-drops': [{'match': 'socket:*', 'drop_rate': 0.3}],
+    'socket-lag': [{'match': 'socket:*', 'delay_ms': 1500, 'jitter_ms': 500}],
+}
+
+# Pages to settle per scenario: route -> selector that means "usable"
+PAGES = {
+    '/spatial': '.dock-icon',
+    '/settings': '.settings-container',
+}
+
+SPINNER_SELECTOR = (
+    '.spinner, .loading-spinner, .loading-state, .loading-overlay, .loading, '
+    '.auth-loading, .dashboard-loading, .settings-loading'
+)
+
+# Polls until the ready selector is visible with no spinner left; times are from navigation start
+INTERACTIVE_JS = '''async ([ready, spinners, timeoutMs]) => {
+    const visible = el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+    const start = performance.now();
+    let busy = 0;
+    while (performance.now() - start < timeoutMs) {
+        const ok = [...document.querySelectorAll(ready)].some(visible);
+        busy = [...document.querySelectorAll(spinners)].filter(visible).length;
+        if (ok && !busy) return { interactive_ms: performance.now(), spinners: 0, timed_out: false };
+        await new Promise(r => setTimeout(r, 50));
+    }
+    return { interactive_ms: performance.now(), spinners: busy, timed_out: true };
+}'''
+
+
+@dataclass
+class FaultRule:
+    """One fault; `match` is '[METHOD ]/path/glob' or 'socket:<event glob>'"""
+    match: str
+    delay_ms: float = 0
+    jitter_ms: float = 0
+    bandwidth_kbps: float = 0
+    status: int = 0
+    error_rate: float = 1.0
+    reset: bool = False
+    drop_rate: float = 0
+
+    def matches(self, key: str, method: str = '') -> bool:
+        rule_method, _, pattern = self.match.rpartition(' ')
+        if rule_method and rule_method.upper() != method.upper():
+            return False
+        return fnmatch.fnmatchcase(key, pattern)
+
+    def delay(self, rng: random.Random) -> float:
+        return max(0.0, self.delay_ms + rng.uniform(-self.jitter_ms, self.jitter_ms))
+
+
+def load_scenarios(path: Optional[str] = None) -> Dict[str, List[FaultRule]]:
+    raw = dict(DEFAULT_SCENARIOS)
+    if path:
+        with open(path) as f:
+            raw.update(json.load(f))
+    return {name: [FaultRule(**rule) for rule in rules] for name, rules in raw.items()}
+
+
+class FaultProxy(LocalServer):
+    """asyncio reverse proxy applying the first matching rule per request/frame"""
+
+    def __init__(self, rules: List[FaultRule], upstream: str = DEFAULT_UPSTREAM,
+                 host: str = '127.0.0.1', port: int = PROXY_PORT, seed: int = 0):
+        super().__init__(host, port)
+        self.rules = rules
+        self.upstream = upstream
+        self.rng = random.Random(seed)
+        self.requests: Dict[str, int] = {}
+        self.injected = {'delayed': 0, 'errors': 0, 'resets': 0, 'throttled': 0,
+                         'frames_dropped': 0, 'frames_delayed': 0}
+
+    def rule_for(self, key: str, method: str = '') -> Optional[FaultRule]:
+        return next((rule for rule in self.rules if rule.matches(key, method)), None)
+
+    async def _serve(self, request: Request, reader, writer) -> bool:
+        if request.is_websocket:
+            await self._websocket(request, reader, writer)
+            return False
+        return await self._http(request, writer)
+
+    async def _http(self, request: Request, writer) -> bool:
+        """Serve one request; False when the connection was deliberately reset"""
+        self.requests[request.path] = self.requests.get(request.path, 0) + 1
+        rule = self.rule_for(request.path, request.method) if request.method != 'OPTIONS' else None
+
+        if rule and (rule.delay_ms or rule.jitter_ms):
+            self.injected['delayed'] += 1
+            await asyncio.sleep(rule.delay(self.rng) / 1000)
+        if rule and rule.reset:
+            self.injected['resets'] += 1
+            writer.transport.abort()
+            return False
+        if rule and rule.status and self.rng.random() < rule.error_rate:
+            self.injected['errors'] += 1
+            body = json.dumps({'error': f'Injected {rule.status}', 'path': request.path}).encode()
+            response = Response(rule.status, cors_headers(request) + [('Content-Type', 'application/json')], body)
+        else:
+            try:
+                response = await fetch(self.upstream, request)
+            except (OSError, asyncio.TimeoutError) as e:
+                response = Response(502, cors_headers(request), str(e).encode())
+
+        data = encode_response(response)
+        if rule and rule.bandwidth_kbps:
+            self.injected['throttled'] += 1
+            await self._write_throttled(writer, data, rule.bandwidth_kbps)
+        else:
+            writer.write(data)
+            await writer.drain()
+        return True
+
+    async def _write_throttled(self, writer, data: bytes, kbps: float, tick_s: float = 0.05):
+        chunk = max(1, int(kbps * 1000 / 8 * tick_s))
+        for offset in range(0, len(data), chunk):
+            writer.write(data[offset:offset + chunk])
+            await writer.drain()
+            await asyncio.sleep(tick_s)
+
+    async def _websocket(self, request: Request, reader, writer):
+        up_reader, up_writer = await connect_websocket(self.upstream, request)
+        await accept_websocket(request, writer)
+
+        async def on_frame(fin, opcode, payload):
+            # Only Socket.io events, on any namespace - Engine.IO pings keep flowing so the link stays up
+            parsed = parse_sio(payload.decode('utf-8', 'replace')) if opcode == OP_TEXT else None
+            if not parsed or parsed['type'] != 2:
+                return True
+            rule = self.rule_for(f"socket:{parsed['event'] or ''}")
+            if not rule:
+                return True
+            if rule.drop_rate and self.rng.random() < rule.drop_rate:
+                self.injected['frames_dropped'] += 1
+                return False
+            if rule.delay_ms or rule.jitter_ms:
+                self.injected['frames_delayed'] += 1
+                await asyncio.sleep(rule.delay(self.rng) / 1000)
+            return True
+
+        await asyncio.gather(
+            relay_frames(reader, up_writer, True),
+            relay_frames(up_reader, writer, False, on_frame),
+        )
+
+
+class FaultInjectionAudit:
+    """Every scenario x page: time to interactive, leftover spinners, retries, frame pacing"""
+
+    def __init__(self, scenarios: Dict[str, List[FaultRule]], upstream: str = DEFAULT_UPSTREAM,
+                 runs: int = 3, settle_timeout_ms: int = 15000, headless: bool = True, port: int = PROXY_PORT):
+        self.scenarios = scenarios
+        self.upstream = upstream
+        self.port = port
+        self.runs = runs
+        self.settle_timeout_ms = settle_timeout_ms
+        self.headless = headless
+        self.results: Dict[str, Dict] = {}
+
+    async def run(self):
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless)
+            for name, rules in self.scenarios.items():
+                print(f"\n💥 SCENARIO {name} ({len(rules)} rules)")
+                async with FaultProxy(rules, self.upstream, port=self.port) as proxy:
+                    context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
+                    page = await context.new_page()
+                    try:
+                        await login(page)
+                    except Exception as e:
+                        # Faults on auth may legitimately block login - still measure what renders
+                        print(f"   ⚠️ Login under {name}: {str(e)}")
+
+                    samples = {route: [] for route in PAGES}
+                    for run in range(self.runs):
+                        for route, ready in PAGES.items():
+                            await page.goto(f'{FRONTEND_URL}{route}', wait_until='commit')
+                            settled = await page.evaluate(
+                                INTERACTIVE_JS, [ready, SPINNER_SELECTOR, self.settle_timeout_ms]
+                            )
+                            frames = await page.evaluate(FRAME_SAMPLE_JS, 60)
+                            samples[route].append({**settled, **frames})
+                    await context.close()
+
+                self.results[name] = {
+                    'pages': {route: self._summarize(values) for route, values in samples.items()},
+                    'requests': dict(sorted(proxy.requests.items(), key=lambda kv: -kv[1])[:15]),
+                    'injected': dict(proxy.injected),
+                }
+            await browser.close()
+        return self.generate_report()
+
+    def _summarize(self, values: List[Dict]) -> Dict:
+        return {
+            'interactive_ms': round(statistics.median(v['interactive_ms'] for v in values), 1),
+            'timed_out': sum(v['timed_out'] for v in values),
+            'spinners_left': max(v['spinners'] for v in values),
+            'fps': round(statistics.median(v['fps'] for v in values), 1),
+            'frame_ms_p95': round(statistics.median(v['frame_ms_p95'] for v in values), 2),
+        }
+
+    def generate_report(self) -> Dict:
+        baseline = self.results.get('baseline', {}).get('pages', {})
+        print("\n" + "=" * 100)
+        print("💥 FAULT INJECTION DEGRADATION REPORT")
+        print("=" * 100)
+        print(f"{'scenario':<22} {'page':<10} {'TTI':>9} {'ΔTTI':>9} {'fps':>6} {'Δp95':>8} "
+              f"{'spinners':>9} {'timeouts':>9}")
+
+        for name, result in self.results.items():
+            for route, page in result['pages'].items():
+                base = baseline.get(route)
+                page['interactive_delta_ms'] = round(page['interactive_ms'] - base['interactive_ms'], 1) if base else None
+                page['frame_p95_delta_ms'] = round(page['frame_ms_p95'] - base['frame_ms_p95'], 2) if base else None
+                print(f"{name:<22} {route:<10} {page['interactive_ms']:>7.0f}ms "
+                      f"{page['interactive_delta_ms'] or 0:>+7.0f}ms {page['fps']:>6.1f} "
+                      f"{page['frame_p95_delta_ms'] or 0:>+6.1f}ms {page['spinners_left']:>9} {page['timed_out']:>9}")
+
+                findings = []
+                if page['spinners_left']:
+                    findings.append(f"⚠️ {route} under {name}: {page['spinners_left']} spinner(s) never cleared")
+                if page['timed_out']:
+                    findings.append(f"⚠️ {route} under {name}: not interactive within {self.settle_timeout_ms}ms")
+                record_report(
+                    'fault-injection',
+                    {k: v for k, v in page.items() if v is not None},
+                    warnings=findings,
+                    route=route,
+                    viewport='1920x1080',
+                    profile=name,
+                )
+
+            # More than one call per page load per run smells like a retry loop
+            loads = self.runs * len(PAGES)
+            retries = {path: count for path, count in result['requests'].items() if count > 2 * loads}
+            if retries:
+                print(f"   🔁 {name}: possible retry storms {retries}")
+            result['suspected_retries'] = retries
+
+        report = {'timestamp': datetime.now().isoformat(), 'upstream': self.upstream, 'scenarios': self.results}
+        with open('fault-injection-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to fault-injection-report.json")
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Latency/fault injection proxy and degradation audit')
+    parser.add_argument('mode', choices=['proxy', 'audit'])
+    parser.add_argument('--scenarios', help='JSON file: {"name": [rule, ...]} merged over the built-ins')
+    parser.add_argument('--scenario', action='append', help='Scenario to use (repeatable)')
+    parser.add_argument('--upstream', default=DEFAULT_UPSTREAM)
+    parser.add_argument('--port', type=int, default=PROXY_PORT,
+                        help='Port the proxy listens on - the port the frontend calls as its backend')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--headed', action='store_true')
+    args = parser.parse_args(argv)
+
+    scenarios = load_scenarios(args.scenarios)
+    if args.scenario:
+        unknown = set(args.scenario) - set(scenarios)
+        if unknown:
+            parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+        scenarios = {name: scenarios[name] for name in args.scenario}
+
+    if args.mode == 'audit':
+        if 'baseline' not in scenarios:
+            scenarios = {'baseline': [], **scenarios}
+        asyncio.run(FaultInjectionAudit(scenarios, args.upstream, args.runs, headless=not args.headed,
+                                        port=args.port).run())
+        return 0
+
+    # Proxy mode stacks the chosen scenarios; nothing chosen = plain pass-through
+    rules = [rule for name in (args.scenario or []) for rule in scenarios[name]]
+
+    async def serve():
+        async with FaultProxy(rules, args.upstream, port=args.port) as proxy:
+            print(f"💥 Fault proxy on :{args.port} -> {args.upstream} ({len(rules)} rules)")
+            try:
+                await asyncio.Event().wait()
+            finally:
+                print(f"📊 {proxy.injected}")
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
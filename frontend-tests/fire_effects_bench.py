@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Fire Effects Frame-Cost Benchmark
+Runs FireParticleSystem + FireRenderer under SOFTWARE GL (SwiftShader)
+Steps particle counts x resolutions x CPU classes -> a real cost curve
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+from datetime import datetime
+from typing import Dict
+
+from bench_common import SWIFTSHADER_ARGS, percentile
+from interactions import FRONTEND_URL
+from results_store import record_report
+from trace_events import DEFAULT_CATEGORIES, Trace
+
+COMPONENTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'frontend', 'src', 'components')
+
+PARTICLE_COUNTS = (100, 250, 500, 1000, 2000, 4000)
+RESOLUTIONS = ((640, 360), (1280, 720), (1920, 1080))
+
+# CDP CPU throttling rate per device class; budget is one 60Hz frame
+DEVICE_CLASSES = {'desktop': 1, 'mid-range': 4, 'low-end': 6}
+FRAME_BUDGET_MS = 1000 / 60
+
+# Pages rendered by the real app that run the cinematic/logo animations
+ROUTE_SCENES = {'landing': '/'}
+
+HARNESS_ORIGIN = 'http://fire-bench.local'
+
+# Per-point numbers worth a trend line in the results store
+RECORDED_METRICS = (
+    'frame_script_ms_p95', 'script_ms_per_frame', 'gpu_process_ms_per_frame',
+    'frame_interval_ms_p95', 'fps',
+)
+
+HARNESS_HTML = '''<!DOCTYPE html>
+<html><head><style>
+  html, body { margin: 0; background: #000; overflow: hidden; }
+  canvas { width: 100vw; height: 100vh; display: block; }
+</style></head>
+<body><canvas id="fire"></canvas>
+<script type="module">
+  import { FireEmitter, FireParticle } from './FireParticleSystem.js';
+  import FireRenderer from './FireRenderer.js';
+  window.fireBench = { FireEmitter, FireParticle, FireRenderer };
+  window.fireBenchReady = true;
+</script>
+</body></html>'''
+
+# Runs the emitter at a steady particle count; times update and render per frame
+RUN_FRAMES_JS = '''async ([particles, warmup, frames]) => {
+    const { FireEmitter, FireParticle, FireRenderer } = window.fireBench;
+    const canvas = document.getElementById('fire');
+    const renderer = new FireRenderer(canvas);
+    const w = window.innerWidth, h = window.innerHeight;
+    const emitter = new FireEmitter(w / 2, h * 0.8);
+
+    emitter.maxParticles = particles;
+    while (emitter.particlePool.length < particles) emitter.particlePool.push(new FireParticle(0, 0));
+    // Mean lifespan is ~1.65s; overshoot so the pool stays saturated
+    emitter.spawnRate = particles / 1.2;
+
+    const update = [], render = [], interval = [], alive = [];
+    let last = performance.now();
+    let time = 0;
+    await new Promise(resolve => {
+        let frame = 0;
+        const step = (now) => {
+            const dt = Math.min(0.05, (now - last) / 1000);
+            last = now;
+            time += dt;
+            const t0 = performance.now();
+            emitter.update(dt, time);
+            const t1 = performance.now();
+            renderer.render(emitter, dt, time, 'steady');
+            const t2 = performance.now();
+            if (frame >= warmup) {
+                update.push(t1 - t0);
+                render.push(t2 - t1);
+                interval.push(now);
+                alive.push(emitter.particles.length);
+            }
+            frame++;
+            if (frame < warmup + frames) requestAnimationFrame(step); else resolve();
+        };
+        requestAnimationFrame(step);
+    });
+    const gaps = interval.slice(1).map((t, i) => t - interval[i]);
+    return { update, render, gaps, alive };
+}'''
+
+# Counts rAF callbacks on a real app page while the animation plays
+COUNT_FRAMES_JS = '''async (durationMs) => {
+    const gaps = [];
+    let last = null;
+    await new Promise(resolve => {
+        const start = performance.now();
+        const step = (now) => {
+            if (last !== null) gaps.push(now - last);
+            last = now;
+            if (now - start < durationMs) requestAnimationFrame(step); else resolve();
+        };
+        requestAnimationFrame(step);
+    });
+    return { gaps };
+}'''
+
+
+class FireEffectsBenchmark:
+    """Cost curve of the fire effects per particle count, resolution and device class"""
+
+    def __init__(self, particle_counts=PARTICLE_COUNTS, resolutions=RESOLUTIONS,
+                 device_classes=None, warmup_frames: int = 60, frames: int = 120):
+        self.particle_counts = particle_counts
+        self.resolutions = resolutions
+        self.device_classes = device_classes or DEVICE_CLASSES
+        self.warmup_frames = warmup_frames
+        self.frames = frames
+        self.curve = []
+        self.scenes = []
+
+    async def _serve_harness(self, route):
+        name = route.request.url.rsplit('/', 1)[-1]
+        if name in ('FireParticleSystem.js', 'FireRenderer.js'):
+            with open(os.path.join(COMPONENTS_DIR, name)) as f:
+                await route.fulfill(body=f.read(), content_type='text/javascript')
+        else:
+            await route.fulfill(body=HARNESS_HTML, content_type='text/html')
+
+    async def _traced(self, browser, page, action):
+        """Run action under a Chromium trace, return (result, Trace)"""
+        await browser.start_tracing(page=page, categories=DEFAULT_CATEGORIES)
+        try:
+            result = await action()
+        finally:
+            trace = Trace.from_bytes(await browser.stop_tracing())
+        return result, trace
+
+    async def run(self):
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True, args=SWIFTSHADER_ARGS)
+
+            for device, throttle in self.device_classes.items():
+                for width, height in self.resolutions:
+                    context = await browser.new_context(viewport={'width': width, 'height': height})
+                    page = await context.new_page()
+                    await page.route(f'{HARNESS_ORIGIN}/**', self._serve_harness)
+                    client = await context.new_cdp_session(page)
+                    await client.send('Emulation.setCPUThrottlingRate', {'rate': throttle})
+
+                    for particles in self.particle_counts:
+                        print(f"🔥 {device} {width}x{height} {particles} particles...")
+                        await page.goto(f'{HARNESS_ORIGIN}/index.html')
+                        await page.wait_for_function('window.fireBenchReady === true')
+                        frames, trace = await self._traced(browser, page, lambda: page.evaluate(
+                            RUN_FRAMES_JS, [particles, self.warmup_frames, self.frames]
+                        ))
+                        self.curve.append(self._summarize(device, width, height, particles, frames, trace))
+
+                    for scene, path in ROUTE_SCENES.items():
+                        print(f"🎬 {device} {width}x{height} scene {scene}...")
+                        try:
+                            await page.goto(f'{FRONTEND_URL}{path}')
+                            frames, trace = await self._traced(browser, page, lambda: page.evaluate(
+                                COUNT_FRAMES_JS, 3000
+                            ))
+                            self.scenes.append(self._summarize(device, width, height, None, frames, trace, scene))
+                        except Exception as e:
+                            print(f"   ⚠️ Scene {scene} skipped: {str(e)}")
+
+                    await context.close()
+
+            await browser.close()
+
+        return self.generate_report()
+
+    def _summarize(self, device, width, height, particles, frames, trace, scene=None) -> Dict:
+        gaps = frames['gaps']
+        frame_count = max(1, len(gaps))
+        frame_ms = [u + r for u, r in zip(frames.get('update', []), frames.get('render', []))]
+        return {
+            'device': device,
+            'resolution': f"{width}x{height}",
+            'pixels': width * height,
+            'particles': particles,
+            'scene': scene,
+            'alive_particles': round(statistics.mean(frames['alive'])) if frames.get('alive') else None,
+            'update_ms_p50': round(percentile(frames.get('update', []), 50), 3),
+            'render_ms_p50': round(percentile(frames.get('render', []), 50), 3),
+            'frame_script_ms_p50': round(percentile(frame_ms, 50), 3),
+            'frame_script_ms_p95': round(percentile(frame_ms, 95), 3),
+            'script_ms_per_frame': round(trace.script_ms() / frame_count, 3),
+            'gpu_process_ms_per_frame': round(trace.gpu_process_ms() / frame_count, 3),
+            'frame_interval_ms_p50': round(percentile(gaps, 50), 2),
+            'frame_interval_ms_p95': round(percentile(gaps, 95), 2),
+            'fps': round(1000 / statistics.mean(gaps), 1) if gaps else 0,
+        }
+
+    def particle_budgets(self) -> Dict[str, Dict[str, int]]:
+        """Largest particle count whose p95 frame cost fits one 60Hz frame"""
+        budgets = {}
+        for point in self.curve:
+            fits = max(point['frame_script_ms_p95'], point['frame_interval_ms_p95']) <= FRAME_BUDGET_MS * 1.05
+            per_device = budgets.setdefault(point['device'], {})
+            if fits:
+                per_device[point['resolution']] = max(per_device.get(point['resolution'], 0), point['particles'])
+            else:
+                per_device.setdefault(point['resolution'], 0)
+        return budgets
+
+    def generate_report(self) -> Dict:
+        print("\n" + "=" * 100)
+        print("🔥 FIRE EFFECTS FRAME-COST CURVE (SwiftShader)")
+        print("=" * 100)
+        print(f"{'device':<10} {'resolution':<10} {'particles':>9} {'script p95':>11} "
+              f"{'gpu/frame':>10} {'interval p95':>13} {'fps':>6}")
+        for point in self.curve:
+            print(f"{point['device']:<10} {point['resolution']:<10} {point['particles']:>9} "
+                  f"{point['frame_script_ms_p95']:>9.2f}ms {point['gpu_process_ms_per_frame']:>8.2f}ms "
+                  f"{point['frame_interval_ms_p95']:>11.2f}ms {point['fps']:>6.1f}")
+
+        budgets = self.particle_budgets()
+        print("\n🎯 PARTICLE BUDGETS (p95 within one 60Hz frame):")
+        for device, per_resolution in budgets.items():
+            print(f"   {device}: " + ', '.join(f"{res}={count}" for res, count in per_resolution.items()))
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'renderer': 'swiftshader',
+            'frame_budget_ms': FRAME_BUDGET_MS,
+            'curve': self.curve,
+            'scenes': self.scenes,
+            'particle_budgets': budgets,
+        }
+        with open('fire-effects-bench-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Cost curve saved to fire-effects-bench-report.json")
+
+        for point in self.curve + self.scenes:
+            record_report(
+                'fire-effects',
+                {key: point[key] for key in RECORDED_METRICS},
+                route=ROUTE_SCENES.get(point['scene'], f"particles={point['particles']}"),
+                viewport=point['resolution'],
+                profile=point['device'],
+            )
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fire effects frame-cost benchmark')
+    parser.add_argument('--particles', type=int, nargs='+', default=list(PARTICLE_COUNTS))
+    parser.add_argument('--frames', type=int, default=120)
+    parser.add_argument('--device', choices=sorted(DEVICE_CLASSES), action='append')
+    args = parser.parse_args(argv)
+
+    devices = {name: DEVICE_CLASSES[name] for name in args.device} if args.device else None
+    bench = FireEffectsBenchmark(args.particles, device_classes=devices, frames=args.frames)
+    asyncio.run(bench.run())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
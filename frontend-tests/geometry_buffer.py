@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Binary Geometry Transfer
+Packs element geometry into typed arrays IN THE PAGE
+Python wraps the buffer as NumPy columns - ZERO per-element parsing
+"""
+
+import base64
+from typing import List
+from dataclasses import dataclass
+
+import numpy as np
+
+# Column order of the packed Float32 buffer; z_index and class_index follow as Int32
+# (z-index needs all 32 bits: Float32 turns 2147483647 into -2147483648)
+GEOMETRY_COLUMNS = ('x', 'y', 'width', 'height', 'ratio', 'visible')
+
+# Shared by every in-page collector that ships typed arrays back to Python
+TO_BASE64_JS = '''
+    const toBase64 = (buffer) => {
+        const bytes = new Uint8Array(buffer);
+        let binary = '';
+        for (let i = 0; i < bytes.length; i += 0x8000) {
+            binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+        }
+        return btoa(binary);
+    };
+'''
+
+# Runs in the page: one pass over the matched elements, one base64 string back.
+# Layout: len(GEOMETRY_COLUMNS) Float32 columns of n values, then n Int32 z-indices and n Int32 class indices.
+COLLECTOR_JS = '''([selector, minSize, includeStyles, columnCount]) => {''' + TO_BASE64_JS + '''
+    const elements = document.querySelectorAll(selector);
+    const picked = [];
+    for (const el of elements) {
+        const rect = el.getBoundingClientRect();
+        if (rect.width > minSize && rect.height > minSize) picked.push([el, rect]);
+    }
+
+    const n = picked.length;
+    const buffer = new ArrayBuffer(4 * n * (columnCount + 2));
+    const columns = new Float32Array(buffer, 0, n * columnCount);
+    const zIndex = new Int32Array(buffer, 4 * n * columnCount, n);
+    const classIndex = new Int32Array(buffer, 4 * n * (columnCount + 1), n);
+    const classNames = [];
+    const classLookup = new Map();
+
+    picked.forEach(([el, rect], i) => {
+        let z = 0;
+        let visible = 1;
+        if (includeStyles) {
+            const style = window.getComputedStyle(el);
+            z = parseInt(style.zIndex) || 0;
+            visible = (style.visibility !== 'hidden' && style.display !== 'none') ? 1 : 0;
+        }
+        columns[i] = rect.x;
+        columns[n + i] = rect.y;
+        columns[2 * n + i] = rect.width;
+        columns[3 * n + i] = rect.height;
+        columns[4 * n + i] = rect.height > 0 ? rect.width / rect.height : 0;
+        columns[5 * n + i] = visible;
+        zIndex[i] = z;
+
+        // SVG elements expose className as an SVGAnimatedString
+        const cls = (typeof el.className === 'string' ? el.className : el.getAttribute('class')) || el.tagName;
+        let idx = classLookup.get(cls);
+        if (idx === undefined) {
+            idx = classNames.length;
+            classLookup.set(cls, idx);
+            classNames.push(cls);
+        }
+        classIndex[i] = idx;
+    });
+
+    return { count: n, buffer: toBase64(buffer), classNames: classNames };
+}'''
+
+
+@dataclass
+class GeometryColumns:
+    """Column-oriented element geometry backed by NumPy arrays"""
+    x: np.ndarray
+    y: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+    ratio: np.ndarray
+    z_index: np.ndarray
+    visible: np.ndarray
+    class_index: np.ndarray
+    class_names: List[str]
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @property
+    def right(self) -> np.ndarray:
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> np.ndarray:
+        return self.y + self.height
+
+    def class_of(self, i: int) -> str:
+        """Class attribute of row i, resolved through the string table"""
+        return self.class_names[self.class_index[i]]
+
+    @classmethod
+    def from_buffer(cls, payload: dict) -> 'GeometryColumns':
+        """Wrap the packed collector payload without touching single elements"""
+        n = payload['count']
+        raw = base64.b64decode(payload['buffer'])
+        column_count = len(GEOMETRY_COLUMNS)
+        columns = np.frombuffer(raw, dtype='<f4', count=n * column_count).reshape(column_count, n)
+        ints = np.frombuffer(raw, dtype='<i4', offset=4 * n * column_count, count=2 * n).reshape(2, n)
+        return cls(
+            *columns[:5],
+            z_index=ints[0],
+            visible=columns[5].astype(bool),
+            class_index=ints[1],
+            class_names=payload['classNames'],
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot, min_size: float = 0) -> 'GeometryColumns':
+        """Same columns from an already decoded PageSnapshot"""
+        elements = [el for el in snapshot.elements if el.width > min_size and el.height > min_size]
+        class_names = []
+        lookup = {}
+        class_index = np.empty(len(elements), dtype=np.int32)
+        for i, el in enumerate(elements):
+            cls_name = el.class_name or el.tag.upper()
+            idx = lookup.get(cls_name)
+            if idx is None:
+                idx = lookup[cls_name] = len(class_names)
+                class_names.append(cls_name)
+            class_index[i] = idx
+
+        rects = np.array([(el.x, el.y, el.width, el.height) for el in elements], dtype=np.float32).reshape(-1, 4)
+        height = rects[:, 3]
+        ratio = np.divide(rects[:, 2], height, out=np.zeros_like(height), where=height > 0)
+        return cls(
+            x=rects[:, 0], y=rects[:, 1], width=rects[:, 2], height=height, ratio=ratio,
+            z_index=np.array([el.z_index for el in elements], dtype=np.int32),
+            visible=np.array([el.visible for el in elements], dtype=bool),
+            class_index=class_index,
+            class_names=class_names,
+        )
+
+    def overlap_pairs(self) -> np.ndarray:
+        """Index pairs (i < j) of visible boxes that intersect"""
+        left, top, right, bottom = self.x, self.y, self.right, self.bottom
+        overlap = (
+            (left[:, None] < right[None, :]) & (right[:, None] > left[None, :]) &
+            (top[:, None] < bottom[None, :]) & (bottom[:, None] > top[None, :])
+        )
+        overlap &= self.visible[:, None] & self.visible[None, :]
+        return np.argwhere(np.triu(overlap, k=1))
+
+
+async def collect_geometry(page, selector: str = '*', min_size: float = 0,
+                           include_styles: bool = False) -> GeometryColumns:
+    """Collect geometry for every element matching selector in one evaluate"""
+    payload = await page.evaluate(
+        COLLECTOR_JS, [selector, min_size, include_styles, len(GEOMETRY_COLUMNS)]
+    )
+    return GeometryColumns.from_buffer(payload)
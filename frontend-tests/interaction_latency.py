@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Interaction-to-Next-Paint Probe
+Clicks every dock icon, overlay toggle and timeline button N times on /spatial
+Event Timing splits each click into input delay, processing and presentation delay;
+a trace of the same window says which main-thread phase ate the time
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from bench_common import percentile
+from interactions import FRONTEND_URL, login
+from results_store import record_report
+from trace_events import DEFAULT_CATEGORIES, RENDERING_PHASES, Trace
+
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+# web.dev INP thresholds
+INP_GOOD_MS = 200
+INP_POOR_MS = 500
+
+# Lowest threshold the Event Timing API accepts; faster interactions never produce an entry
+EVENT_TIMING_THRESHOLD_MS = 16
+
+EVENT_OBSERVER_JS = f'''
+window.__burnwiseEvents = [];
+try {{
+  new PerformanceObserver(list => {{
+    for (const e of list.getEntries()) {{
+      if (!e.interactionId) continue;
+      window.__burnwiseEvents.push({{
+        type: e.name, interactionId: e.interactionId, startTime: e.startTime, duration: e.duration,
+        processingStart: e.processingStart, processingEnd: e.processingEnd,
+      }});
+    }}
+  }}).observe({{ type: 'event', durationThreshold: {EVENT_TIMING_THRESHOLD_MS}, buffered: true }});
+}} catch (e) {{}}
+'''
+
+# Entries arrive after the frame they painted in; wait for one or give up after the timeout
+COLLECT_EVENTS_JS = '''async (timeoutMs) => {
+    const start = performance.now();
+    await new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+    while (!window.__burnwiseEvents.length && performance.now() - start < timeoutMs) {
+        await new Promise(resolve => setTimeout(resolve, 25));
+    }
+    return window.__burnwiseEvents.splice(0);
+}'''
+
+
+# Dock items whose action routes away from /spatial (DockNavigation.js: 'user' -> /settings)
+NAVIGATING_DOCK_ITEMS = {'user'}
+
+
+@dataclass
+class Control:
+    """A clickable control on /spatial"""
+    name: str
+    kind: str
+    selector: str
+    navigates: bool = False
+
+
+STATIC_CONTROLS = [
+    Control('overlay:weather', 'overlay', '.overlay-btn:has-text("Weather")'),
+    Control('overlay:smoke', 'overlay', '.overlay-btn:has-text("Smoke")'),
+    Control('timeline:play', 'timeline', '.timeline-btn.play-btn'),
+    Control('timeline:now', 'timeline', '.timeline-btn.now-btn'),
+    Control('timeline:day', 'timeline', '.view-mode-btn:has-text("Day")'),
+    Control('timeline:week', 'timeline', '.view-mode-btn:has-text("Week")'),
+    Control('timeline:month', 'timeline', '.view-mode-btn:has-text("Month")'),
+]
+
+
+def interaction_breakdown(entries: List[Dict]) -> Optional[Dict[str, float]]:
+    """Collapse one interaction's pointerdown/pointerup/click entries into INP phases"""
+    if not entries:
+        return None
+    start = min(e['startTime'] for e in entries)
+    end = max(e['startTime'] + e['duration'] for e in entries)
+    processing_start = min(e['processingStart'] for e in entries)
+    processing_end = max(e['processingEnd'] for e in entries)
+    return {
+        'latency_ms': round(end - start, 1),
+        'input_delay_ms': round(processing_start - start, 1),
+        'processing_ms': round(processing_end - processing_start, 1),
+        'presentation_ms': round(max(0.0, end - processing_end), 1),
+    }
+
+
+class InteractionLatencyProbe:
+    """Click each control N times and aggregate latency per control"""
+
+    def __init__(self, repeats: int = 10, kinds=('dock', 'overlay', 'timeline'), trace: bool = True,
+                 settle_ms: int = 300, frontend: str = FRONTEND_URL):
+        self.repeats = repeats
+        self.kinds = kinds
+        self.trace = trace
+        self.settle_ms = settle_ms
+        self.frontend = frontend
+        self.samples: Dict[str, List[Dict]] = {}
+        self.results: Dict[str, Dict] = {}
+        self.critical: List[str] = []
+        self.warnings: List[str] = []
+
+    async def discover(self, page) -> List[Control]:
+        docks = await page.eval_on_selector_all(
+            '.dock-item[data-dock-item]', 'items => items.map(item => item.dataset.dockItem)'
+        )
+        controls = [
+            Control(f'dock:{item}', 'dock', f'.dock-item[data-dock-item="{item}"] .dock-icon',
+                    navigates=item in NAVIGATING_DOCK_ITEMS)
+            for item in docks
+        ] + STATIC_CONTROLS
+        # Route changes go last so the reload back to /spatial disturbs as few samples as possible
+        return sorted((c for c in controls if c.kind in self.kinds), key=lambda c: c.navigates)
+
+    async def back_to_spatial(self, page):
+        """The dock, overlay buttons and timeline only exist on /spatial"""
+        if not page.url.rstrip('/').endswith('/spatial'):
+            await page.goto(f'{self.frontend}/spatial')
+        await page.wait_for_selector('.dock-icon', timeout=15000)
+
+    async def sample(self, browser, page, control: Control) -> Dict:
+        await page.evaluate('window.__burnwiseEvents.length = 0')
+        if self.trace:
+            await browser.start_tracing(page=page, categories=DEFAULT_CATEGORIES)
+        try:
+            await page.click(control.selector, timeout=5000)
+            events = await page.evaluate(COLLECT_EVENTS_JS, self.settle_ms)
+        finally:
+            trace = Trace.from_bytes(await browser.stop_tracing()) if self.trace else None
+
+        # The click is the interaction with the longest entry; anything else is incidental
+        by_interaction: Dict[int, List[Dict]] = {}
+        for event in events:
+            by_interaction.setdefault(event['interactionId'], []).append(event)
+        groups = sorted(by_interaction.values(), key=lambda g: max(e['duration'] for e in g), reverse=True)
+        sample = interaction_breakdown(groups[0] if groups else []) or {}
+        sample['events'] = sorted({e['type'] for e in events})
+        if trace:
+            sample['phases_ms'] = trace.phase_ms()
+        return sample
+
+    async def run(self, headless: bool = False) -> Dict:
+        from playwright.async_api import async_playwright
+
+        print("👆 BURNWISE INTERACTION-TO-NEXT-PAINT PROBE")
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            context = await browser.new_context(viewport=VIEWPORT)
+            await context.add_init_script(EVENT_OBSERVER_JS)
+            page = await context.new_page()
+            await login(page, self.frontend)
+            await page.wait_for_selector('.dock-icon', timeout=15000)
+
+            controls = await self.discover(page)
+            print(f"   {len(controls)} controls x{self.repeats}")
+            for control in controls:
+                samples = self.samples[control.name] = []
+                for repeat in range(self.repeats):
+                    try:
+                        await self.back_to_spatial(page)
+                        samples.append(await self.sample(browser, page, control))
+                    except Exception as e:
+                        self.warnings.append(f"⚠️ {control.name}: repeat {repeat} failed - {str(e).splitlines()[0]}")
+                        break
+                    await page.wait_for_timeout(self.settle_ms)
+                if samples:
+                    self.results[control.name] = self.aggregate(control, samples)
+
+            await browser.close()
+
+        self.print_report()
+        self.save()
+        return self.results
+
+    def aggregate(self, control: Control, samples: List[Dict]) -> Dict:
+        measured = [s for s in samples if 'latency_ms' in s]
+        result = {
+            'kind': control.kind,
+            'selector': control.selector,
+            'samples': len(samples),
+            # No Event Timing entry means the click painted within the observer threshold
+            f'under_{EVENT_TIMING_THRESHOLD_MS}ms': len(samples) - len(measured),
+        }
+        for key in ('latency_ms', 'input_delay_ms', 'processing_ms', 'presentation_ms'):
+            values = [s[key] for s in measured]
+            if values:
+                result[f'{key}_p50'] = round(percentile(values, 50), 1)
+                result[f'{key}_p75'] = round(percentile(values, 75), 1)
+                result[f'{key}_max'] = round(max(values), 1)
+
+        traced = [s['phases_ms'] for s in samples if 'phases_ms' in s]
+        if traced:
+            result['phases_ms'] = {
+                phase: round(sum(t[phase] for t in traced) / len(traced), 2) for phase in RENDERING_PHASES
+            }
+
+        latency = result.get('latency_ms_p75')
+        if latency is not None:
+            phases = {k: result[f'{k}_p75'] for k in ('input_delay_ms', 'processing_ms', 'presentation_ms')}
+            result['dominant'] = max(phases, key=phases.get).replace('_ms', '')
+            cause = result['dominant']
+            if traced:
+                cause += f", mostly {max(result['phases_ms'], key=result['phases_ms'].get)}"
+            if latency > INP_POOR_MS:
+                self.critical.append(f"❌ {control.name}: p75 {latency:.0f}ms to next paint ({cause})")
+            elif latency > INP_GOOD_MS:
+                self.warnings.append(f"⚠️ {control.name}: p75 {latency:.0f}ms to next paint ({cause})")
+        return result
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        print(f"{'control':<24} {'p75':>7} {'input':>7} {'proc':>7} {'present':>8}  dominant")
+        for name, result in sorted(self.results.items(), key=lambda kv: -kv[1].get('latency_ms_p75', 0)):
+            if 'latency_ms_p75' not in result:
+                print(f"{name:<24} {'<' + str(EVENT_TIMING_THRESHOLD_MS) + 'ms':>7}")
+                continue
+            print(f"{name:<24} {result['latency_ms_p75']:>6.0f}ms {result['input_delay_ms_p75']:>6.0f}ms "
+                  f"{result['processing_ms_p75']:>6.0f}ms {result['presentation_ms_p75']:>7.0f}ms  "
+                  f"{result['dominant']}")
+        for line in self.critical + self.warnings:
+            print(f"   {line}")
+
+    def save(self):
+        for name, result in self.results.items():
+            metrics = {k: v for k, v in result.items() if isinstance(v, (int, float))}
+            metrics.update({f'{phase}_ms': v for phase, v in result.get('phases_ms', {}).items()})
+            prefix = f"{name}:"
+            record_report('interaction-latency', metrics,
+                          critical=[m for m in self.critical if prefix in m],
+                          warnings=[m for m in self.warnings if prefix in m],
+                          route='/spatial', viewport=f"{VIEWPORT['width']}x{VIEWPORT['height']}", profile=name)
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'repeats': self.repeats,
+            'event_timing_threshold_ms': EVENT_TIMING_THRESHOLD_MS,
+            'controls': self.results,
+            'samples': self.samples,
+            'critical': self.critical,
+            'warnings': self.warnings,
+        }
+        with open('interaction-latency-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to interaction-latency-report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Per-control interaction-to-next-paint on /spatial')
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--kind', action='append', choices=('dock', 'overlay', 'timeline'),
+                        help='Control group to probe (repeatable, default: all)')
+    parser.add_argument('--no-trace', action='store_true', help='Skip the per-click trace phase breakdown')
+    parser.add_argument('--settle-ms', type=int, default=300)
+    parser.add_argument('--frontend', default=FRONTEND_URL)
+    parser.add_argument('--headless', action='store_true')
+    args = parser.parse_args(argv)
+
+    probe = InteractionLatencyProbe(args.repeats, tuple(args.kind or ('dock', 'overlay', 'timeline')),
+                                    not args.no_trace, args.settle_ms, args.frontend)
+    asyncio.run(probe.run(args.headless))
+    return 1 if probe.critical else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
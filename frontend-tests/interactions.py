@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Scripted Interactions
+The REAL user flows every performance mode replays
+Login, dock navigation, timeline scrub, FloatingAI, agent chat, farm boundary drawing
+"""
+
+from typing import Awaitable, Callable, Dict
+from dataclasses import dataclass
+
+FRONTEND_URL = 'http://localhost:3000'
+BACKEND_URL = 'http://localhost:5001'
+
+TEST_EMAIL = 'robert@goldenfields.com'
+TEST_PASSWORD = 'TestPassword123!'
+
+
+async def login(page, base_url: str = FRONTEND_URL):
+    """Sign in with the real test account and land on /spatial"""
+    await page.goto(f'{base_url}/login')
+    await page.fill('input[type="email"]', TEST_EMAIL)
+    await page.fill('input[type="password"]', TEST_PASSWORD)
+    await page.click('button:has-text("Sign In")')
+
+    # Skip onboarding if needed
+    await page.wait_for_timeout(1000)
+    if 'onboarding' in page.url:
+        await page.click('button:has-text("Skip Setup")')
+
+    await page.wait_for_url('**/spatial')
+    await page.wait_for_timeout(2000)  # Let everything load
+
+
+async def dock_navigation(page):
+    """Click through every dock icon, waiting for each to activate"""
+    icons = await page.locator('.dock-icon').all()
+    for icon in icons:
+        await icon.click()
+        await page.wait_for_timeout(300)
+
+
+async def toggle_dock_panels(page):
+    """Open and close the in-page dock panels; unlike dock_navigation it never leaves /spatial"""
+    for item in ('layers', 'metrics'):
+        icon = page.locator(f'.dock-item[data-dock-item="{item}"] .dock-icon')
+        for _ in range(2):
+            await icon.click()
+            await page.wait_for_timeout(300)
+
+
+async def timeline_scrub(page, steps: int = 20):
+    """Drag the timeline indicator across the whole track"""
+    track = await page.locator('.timeline-track').bounding_box()
+    handle = await page.locator('.timeline-current').bounding_box()
+    if not track or not handle:
+        return
+
+    y = handle['y'] + handle['height'] / 2
+    await page.mouse.move(handle['x'] + handle['width'] / 2, y)
+    await page.mouse.down()
+    await page.mouse.move(track['x'] + track['width'] - 1, y, steps=steps)
+    await page.mouse.move(track['x'] + 1, y, steps=steps)
+    await page.mouse.up()
+
+
+async def open_floating_ai(page):
+    """Open the FloatingAI assistant from the flame logo and close it again"""
+    await page.locator('.animated-flame-logo').first.click()
+    await page.wait_for_selector('.floating-ai-container, .floating-ai-bubble', timeout=5000)
+    await page.wait_for_timeout(500)
+    await page.locator('.animated-flame-logo').first.click()
+    await page.wait_for_timeout(300)
+
+
+async def chat_with_agent(page, prompt: str = 'Is it safe to burn 40 acres of wheat tomorrow morning?',
+                          timeout_ms: int = 60000):
+    """Open FloatingAI, send one message and wait for the agent's reply bubble"""
+    await page.locator('.animated-flame-logo').first.click()
+    await page.wait_for_selector('.floating-ai-container, .new-chat-btn', timeout=5000)
+    # Existing conversations open ChatHistory first
+    if await page.locator('.new-chat-btn').count():
+        await page.locator('.new-chat-btn').first.click()
+    field = page.locator('.ai-input-field')
+    await field.wait_for(timeout=5000)
+    replies = '.floating-message.ai .message-bubble:not(.typing)'
+    before = await page.locator(replies).count()
+    await field.fill(prompt)
+    await field.press('Enter')
+    await page.wait_for_function(
+        '([selector, count]) => document.querySelectorAll(selector).length > count',
+        arg=[replies, before], timeout=timeout_ms,
+    )
+
+
+async def draw_farm_boundary(page):
+    """Draw and complete a polygon in FarmBoundaryDrawer"""
+    await page.click('button[title="Draw Farm Boundary"]')
+    box = await page.locator('.boundary-map').bounding_box()
+    cx, cy = box['x'] + box['width'] / 2, box['y'] + box['height'] / 2
+    for dx, dy in ((-80, -60), (80, -60), (100, 50), (-60, 70)):
+        await page.mouse.click(cx + dx, cy + dy)
+        await page.wait_for_timeout(100)
+    await page.click('.tool-btn.complete-btn')
+    await page.wait_for_timeout(300)
+
+
+@dataclass
+class Interaction:
+    """A named user flow and the route it has to start from"""
+    name: str
+    route: str
+    run: Callable[..., Awaitable]
+    ready_selector: str = 'body'
+
+    async def prepare(self, page, base_url: str = FRONTEND_URL):
+        """Navigate to the starting route unless the page is already there"""
+        if not page.url.rstrip('/').endswith(self.route):
+            await page.goto(f'{base_url}{self.route}')
+        await page.wait_for_selector(self.ready_selector, timeout=15000)
+
+
+INTERACTIONS: Dict[str, Interaction] = {
+    interaction.name: interaction for interaction in (
+        Interaction('dock-navigation', '/spatial', dock_navigation, '.dock-icon'),
+        Interaction('dock-panels', '/spatial', toggle_dock_panels, '.dock-icon'),
+        Interaction('timeline-scrub', '/spatial', timeline_scrub, '.timeline-current'),
+        Interaction('floating-ai', '/spatial', open_floating_ai, '.animated-flame-logo'),
+        Interaction('farm-boundary-draw', '/onboarding', draw_farm_boundary, 'button[title="Draw Farm Boundary"]:not([disabled])'),
+    )
+}
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Layout Thrash Sampler
+Performance.getMetrics before and after EVERY scripted interaction: layouts, style recalcs,
+their durations, script time, DOM nodes and JS listeners
+A trace of the same run attributes each forced synchronous reflow to the JS stack that asked
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List
+
+from cpu_profiler import frame_label
+from interactions import FRONTEND_URL, INTERACTIONS, login
+from results_store import record_report
+from trace_events import REFLOW_CATEGORIES, Trace
+
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+# Performance.getMetrics counters worth a delta; durations arrive in seconds
+COUNTERS = ('LayoutCount', 'RecalcStyleCount', 'Nodes', 'JSEventListeners')
+DURATIONS = ('LayoutDuration', 'RecalcStyleDuration', 'ScriptDuration', 'TaskDuration')
+
+LAYOUTS_PER_FRAME_MAX = 2
+FORCED_REFLOWS_PER_FRAME_MAX = 1
+
+START_FRAMES_JS = '''() => {
+    const state = window.__burnwiseFrames = { count: 0, running: true };
+    const tick = () => { state.count++; if (state.running) requestAnimationFrame(tick); };
+    requestAnimationFrame(tick);
+}'''
+
+STOP_FRAMES_JS = '''() => {
+    const state = window.__burnwiseFrames;
+    if (!state) return null;
+    state.running = false;
+    return state.count;
+}'''
+
+# Glass panels: every element currently painting a backdrop-filter
+BACKDROP_LAYERS_JS = '''() => [...document.querySelectorAll('body *')].filter(el => {
+    const style = getComputedStyle(el);
+    return (style.backdropFilter || style.webkitBackdropFilter || 'none') !== 'none' && el.getClientRects().length;
+}).length'''
+
+
+def metrics_dict(result: Dict) -> Dict[str, float]:
+    return {m['name']: m['value'] for m in result['metrics']}
+
+
+def reflow_stack(event: Dict, depth: int = 8) -> List[str]:
+    """Innermost-first JS frames of a forced layout; trace frames are 1-based, profile frames 0-based"""
+    frames = event['args']['beginData']['stackTrace'][:depth]
+    return [frame_label({**frame, 'lineNumber': frame.get('lineNumber', 1) - 1}) for frame in frames]
+
+
+class LayoutAggregate:
+    """Metric deltas and forced-reflow stacks for one interaction across runs"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.runs = 0
+        self.deltas: Dict[str, float] = defaultdict(float)
+        self.frames = 0
+        self.forced = 0
+        self.backdrop_layers: List[int] = []
+        self.listener_deltas: List[float] = []
+        # innermost frame -> {count, ms, stack}
+        self.reflows: Dict[str, Dict] = {}
+
+    def add(self, before: Dict[str, float], after: Dict[str, float], frames: int, trace: Trace, backdrop: int):
+        self.runs += 1
+        for name in COUNTERS:
+            self.deltas[name] += after.get(name, 0) - before.get(name, 0)
+        for name in DURATIONS:
+            self.deltas[name] += (after.get(name, 0) - before.get(name, 0)) * 1000
+        self.listener_deltas.append(after.get('JSEventListeners', 0) - before.get('JSEventListeners', 0))
+        self.frames += max(1, frames or 0)
+        self.backdrop_layers.append(backdrop)
+
+        for event in trace.forced_layouts():
+            self.forced += 1
+            stack = reflow_stack(event)
+            entry = self.reflows.setdefault(stack[0], {'count': 0, 'ms': 0.0, 'stack': stack, 'phases': set()})
+            entry['count'] += 1
+            entry['ms'] += event.get('dur', 0) / 1000
+            entry['phases'].update(event['phases'])
+
+    def per_run(self, value: float) -> float:
+        return round(value / self.runs, 2)
+
+    def summary(self) -> Dict:
+        return {
+            'runs': self.runs,
+            **{f'{name}_per_run': self.per_run(self.deltas[name]) for name in COUNTERS},
+            **{f'{name}_ms_per_run': self.per_run(self.deltas[name]) for name in DURATIONS},
+            'frames_per_run': self.per_run(self.frames),
+            'layouts_per_frame': round(self.deltas['LayoutCount'] / self.frames, 2),
+            'recalc_styles_per_frame': round(self.deltas['RecalcStyleCount'] / self.frames, 2),
+            'forced_reflows_per_run': self.per_run(self.forced),
+            'forced_reflows_per_frame': round(self.forced / self.frames, 2),
+            'backdrop_filter_layers': max(self.backdrop_layers),
+        }
+
+    def top_reflows(self, limit: int = 10) -> List[Dict]:
+        ranked = sorted(self.reflows.values(), key=lambda r: (r['count'], r['ms']), reverse=True)
+        return [
+            {
+                'caller': r['stack'][0],
+                'count_per_run': self.per_run(r['count']),
+                'ms_per_run': self.per_run(r['ms']),
+                'phases': sorted(r['phases']),
+                'stack': r['stack'],
+            }
+            for r in ranked[:limit]
+        ]
+
+
+class LayoutSampler:
+    """Sample layout/style counters and forced reflows around each scripted interaction"""
+
+    def __init__(self, interactions: List[str], runs: int = 5, frontend: str = FRONTEND_URL):
+        self.interactions = [INTERACTIONS[name] for name in interactions]
+        self.runs = runs
+        self.frontend = frontend
+        self.aggregates = {name: LayoutAggregate(name) for name in interactions}
+        self.failures: List[str] = []
+        self.warnings: List[str] = []
+
+    async def run(self, headless: bool = False):
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            context = await browser.new_context(viewport=VIEWPORT)
+            page = await context.new_page()
+            await login(page, self.frontend)
+
+            client = await context.new_cdp_session(page)
+            await client.send('Performance.enable')
+            for interaction in self.interactions:
+                print(f"\n📐 SAMPLING LAYOUT {interaction.name} x{self.runs}...")
+                for run in range(self.runs):
+                    try:
+                        await interaction.prepare(page, self.frontend)
+                        await page.evaluate(START_FRAMES_JS)
+                        before = metrics_dict(await client.send('Performance.getMetrics'))
+                        await browser.start_tracing(page=page, categories=REFLOW_CATEGORIES)
+                        try:
+                            await interaction.run(page)
+                        finally:
+                            trace = Trace.from_bytes(await browser.stop_tracing())
+                        after = metrics_dict(await client.send('Performance.getMetrics'))
+                        frames = await page.evaluate(STOP_FRAMES_JS)
+                        backdrop = await page.evaluate(BACKDROP_LAYERS_JS)
+                        self.aggregates[interaction.name].add(before, after, frames, trace, backdrop)
+                    except Exception as e:
+                        self.failures.append(f"❌ {interaction.name} run {run}: {str(e)}")
+            await client.send('Performance.disable')
+            await client.detach()
+
+            await browser.close()
+
+        return self.generate_report()
+
+    def generate_report(self) -> Dict:
+        report = {'timestamp': datetime.now().isoformat(), 'interactions': {}, 'failures': self.failures}
+
+        print("\n" + "=" * 80)
+        print("📐 LAYOUT THRASH REPORT")
+        print("=" * 80)
+
+        for name, aggregate in self.aggregates.items():
+            if not aggregate.runs:
+                continue
+            summary = aggregate.summary()
+            reflows = aggregate.top_reflows()
+            report['interactions'][name] = {**summary, 'forced_reflows': reflows}
+
+            warnings = []
+            if summary['layouts_per_frame'] > LAYOUTS_PER_FRAME_MAX:
+                warnings.append(f"⚠️ {name}: {summary['layouts_per_frame']:.1f} layouts per frame "
+                                f"({summary['backdrop_filter_layers']} backdrop-filter layers on screen)")
+            if summary['forced_reflows_per_frame'] > FORCED_REFLOWS_PER_FRAME_MAX:
+                caller = f" - mostly {reflows[0]['caller']}" if reflows else ''
+                warnings.append(f"⚠️ {name}: {summary['forced_reflows_per_frame']:.1f} forced reflows per frame{caller}")
+            if aggregate.runs > 1 and all(delta > 0 for delta in aggregate.listener_deltas):
+                warnings.append(f"⚠️ {name}: JS event listeners grow every run "
+                                f"(+{summary['JSEventListeners_per_run']:.0f} per run)")
+            self.warnings.extend(warnings)
+
+            print(f"\n📊 {name} ({aggregate.runs} runs, {summary['frames_per_run']:.0f} frames each)")
+            print(f"   {summary['LayoutCount_per_run']:.0f} layouts ({summary['LayoutDuration_ms_per_run']:.1f}ms), "
+                  f"{summary['RecalcStyleCount_per_run']:.0f} style recalcs "
+                  f"({summary['RecalcStyleDuration_ms_per_run']:.1f}ms), "
+                  f"{summary['ScriptDuration_ms_per_run']:.1f}ms script per run")
+            print(f"   {summary['layouts_per_frame']:.2f} layouts/frame, {summary['forced_reflows_per_frame']:.2f} "
+                  f"forced/frame, Nodes {summary['Nodes_per_run']:+.0f}, "
+                  f"listeners {summary['JSEventListeners_per_run']:+.0f}")
+            for reflow in reflows[:5]:
+                print(f"   {reflow['count_per_run']:6.1f}x {reflow['ms_per_run']:7.2f}ms  {reflow['caller']}")
+
+            record_report(
+                'layout-thrash',
+                {k: v for k, v in summary.items() if k != 'runs'},
+                warnings=warnings,
+                route=INTERACTIONS[name].route,
+                viewport=f"{VIEWPORT['width']}x{VIEWPORT['height']}",
+                profile=name,
+            )
+
+        for line in self.warnings + self.failures:
+            print(f"   {line}")
+
+        report['warnings'] = self.warnings
+        with open('layout-thrash-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to layout-thrash-report.json")
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Layout/style counters and forced reflows per interaction')
+    parser.add_argument('--interaction', action='append', choices=sorted(INTERACTIONS),
+                        help='Interaction to sample (repeatable, default: all)')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--frontend', default=FRONTEND_URL)
+    parser.add_argument('--headless', action='store_true')
+    args = parser.parse_args(argv)
+
+    sampler = LayoutSampler(args.interaction or list(INTERACTIONS), args.runs, args.frontend)
+    asyncio.run(sampler.run(headless=args.headless))
+    return 1 if sampler.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+BURNWISE LLM Stub
+OpenAI-compatible model server with a configurable time-to-first-token and token rate
+Point the backend at it (OPENAI_BASE_URL=http://localhost:5199/v1) and model time becomes
+a known quantity - whatever else a request costs is orchestration
+
+Serves /v1/responses, /v1/chat/completions (plain + SSE streaming) and /v1/embeddings
+GET /stub/calls returns the call log, POST /stub/reset clears it
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import re
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from backend_standin import LatencyModel
+from local_http import LocalServer, Request, Response, encode_response
+
+STUB_PORT = 5199
+DEFAULT_TTFT_MS = 400
+DEFAULT_TOKENS_PER_S = 80
+DEFAULT_OUTPUT_TOKENS = 60
+
+# Agents open their instructions with "You are the <Name>," - the SDK sends no other label
+AGENT_NAME = re.compile(r'You are (?:the )?([A-Z][\w ]*?)[,.]')
+
+# Requests tag their prompts with this so calls can be tied back to a session
+SESSION_MARKER = re.compile(r'\[bench:([\w-]+)\]')
+
+TOKEN = re.compile(r'\w+|[^\w\s]')
+
+FILLER = (
+    'Burn window looks acceptable with winds from the southwest at eight miles per hour . '
+    'Relative humidity stays above thirty percent through the afternoon and mixing height '
+    'clears the inversion by noon . Smoke plume stays north of the county road and no '
+    'neighbouring burns overlap the dispersion corridor . Recommend ignition after ten '
+    'with crews staged on the east line .'
+).split()
+
+
+def count_tokens(text: str) -> int:
+    return len(TOKEN.findall(text or ''))
+
+
+def agent_name(instructions: str) -> str:
+    match = AGENT_NAME.search(instructions or '')
+    # LatencyModel patterns split on spaces, so names are squashed to one word
+    return match[1].replace(' ', '') if match else 'gpt5-mini-client'
+
+
+def _text_of(content) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return ' '.join(_text_of(part.get('text') or part.get('content') or '') for part in content
+                        if isinstance(part, dict))
+    return ''
+
+
+def sample_from_schema(schema: Dict, text: str, depth: int = 0):
+    """Smallest value satisfying a JSON schema; strings carry the prompt so markers survive"""
+    if not isinstance(schema, dict) or depth > 6:
+        return None
+    if 'enum' in schema:
+        return schema['enum'][0]
+    if 'const' in schema:
+        return schema['const']
+    for key in ('anyOf', 'oneOf', 'allOf'):
+        if schema.get(key):
+            return sample_from_schema(schema[key][0], text, depth + 1)
+    kind = schema.get('type', 'object')
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != 'null'), 'null')
+    if kind == 'object':
+        props = schema.get('properties', {})
+        return {name: sample_from_schema(spec, text, depth + 1) for name, spec in props.items()}
+    if kind == 'array':
+        item = sample_from_schema(schema.get('items', {}), text, depth + 1)
+        return [item] * max(1, schema.get('minItems', 1))
+    if kind in ('number', 'integer'):
+        value = max(schema.get('minimum', 1), 1)
+        return int(value) if kind == 'integer' else float(value)
+    if kind == 'boolean':
+        return True
+    if kind == 'null':
+        return None
+    if schema.get('format') == 'date':
+        return time.strftime('%Y-%m-%d')
+    return text[:schema.get('maxLength', 500)]
+
+
+def pick_tool(tools: List[Dict], text: str) -> Dict:
+    """Tool whose name/description shares the most words with the prompt - enough to route"""
+    words = set(w.lower() for w in TOKEN.findall(text))
+
+    def overlap(tool):
+        name = tool.get('name') or tool.get('function', {}).get('name', '')
+        description = tool.get('description') or tool.get('function', {}).get('description', '')
+        return len(words & set(w.lower() for w in re.split(r'[\W_]+', f"{name} {description}")))
+
+    return max(tools, key=overlap)
+
+
+class StubCall:
+    """Everything the stub decided about one model call before it starts answering"""
+
+    def __init__(self, api: str, agent: str, prompt: str, stream: bool, tool: Optional[Dict],
+                 schema: Optional[Dict], max_tokens: Optional[int], output_tokens: int):
+        self.id = uuid.uuid4().hex[:24]
+        self.api = api
+        self.agent = agent
+        self.prompt = prompt
+        self.stream = stream
+        self.tool = tool
+        marker = SESSION_MARKER.search(prompt)
+        self.session = marker[1] if marker else None
+        self.input_tokens = count_tokens(prompt)
+
+        if tool is not None:
+            params = tool.get('parameters') or tool.get('function', {}).get('parameters') or {}
+            self.tool_name = tool.get('name') or tool.get('function', {}).get('name')
+            self.output = json.dumps(sample_from_schema(params, prompt) or {})
+            self.tokens = TOKEN.findall(self.output)
+        elif schema is not None:
+            self.tool_name = None
+            self.output = json.dumps(sample_from_schema(schema, prompt))
+            self.tokens = TOKEN.findall(self.output)
+        else:
+            self.tool_name = None
+            n = min(output_tokens, max_tokens or output_tokens)
+            words = [FILLER[i % len(FILLER)] for i in range(n)]
+            self.output = ' '.join(words)
+            self.tokens = words
+
+    @property
+    def output_tokens(self) -> int:
+        return len(self.tokens)
+
+    def chunks(self) -> List[str]:
+        """Output split into one delta per token, concatenating back to self.output"""
+        pieces, cursor = [], 0
+        for token in self.tokens:
+            end = self.output.find(token, cursor) + len(token)
+            pieces.append(self.output[cursor:end])
+            cursor = end
+        if cursor < len(self.output):
+            pieces.append(self.output[cursor:])
+        return pieces or ['']
+
+
+class LLMStub(LocalServer):
+    """asyncio OpenAI stand-in; TTFT is drawn per agent from a LatencyModel, then tokens stream at a fixed rate"""
+
+    def __init__(self, ttft: Optional[LatencyModel] = None, tokens_per_s: float = DEFAULT_TOKENS_PER_S,
+                 output_tokens: int = DEFAULT_OUTPUT_TOKENS, tool_calls: str = 'required',
+                 host: str = '127.0.0.1', port: int = STUB_PORT):
+        super().__init__(host, port)
+        self.ttft = ttft or LatencyModel(default={'dist': 'fixed', 'ms': DEFAULT_TTFT_MS})
+        self.tokens_per_s = tokens_per_s
+        self.output_tokens = output_tokens
+        self.tool_calls = tool_calls
+        self.calls: List[Dict] = []
+
+    @property
+    def base_url(self) -> str:
+        return f'http://localhost:{self.port}/v1'
+
+    async def _serve(self, request: Request, reader, writer) -> bool:
+        """One request; False when the response was close-delimited (SSE)"""
+        path = request.path.rstrip('/')
+        if request.method == 'GET' and path == '/stub/calls':
+            return await self._json(writer, {'calls': self.calls})
+        if request.method == 'POST' and path == '/stub/reset':
+            self.calls.clear()
+            return await self._json(writer, {'reset': True})
+        if request.method != 'POST':
+            return await self._json(writer, {'error': {'message': f'No route {request.path}'}}, 404)
+
+        try:
+            body = json.loads(request.body or b'{}')
+        except ValueError:
+            return await self._json(writer, {'error': {'message': 'Invalid JSON body'}}, 400)
+
+        if path.endswith('/embeddings'):
+            return await self._json(writer, self.embeddings(body))
+        if path.endswith('/responses'):
+            call = self._plan_responses(body)
+        elif path.endswith('/chat/completions'):
+            call = self._plan_chat(body)
+        else:
+            return await self._json(writer, {'error': {'message': f'No route {request.path}'}}, 404)
+        return await self._answer(call, writer)
+
+    async def _json(self, writer, payload, status: int = 200) -> bool:
+        writer.write(encode_response(Response(status, [('Content-Type', 'application/json')],
+                                              json.dumps(payload).encode())))
+        await writer.drain()
+        return True
+
+    def _wants_tool(self, tools: List[Dict], tool_choice, already_called: bool) -> bool:
+        if not tools or already_called or tool_choice == 'none':
+            return False
+        return self.tool_calls == 'always' or tool_choice == 'required' or isinstance(tool_choice, dict)
+
+    def _plan_responses(self, body: Dict) -> StubCall:
+        items = body.get('input')
+        if isinstance(items, str):
+            items = [{'role': 'user', 'content': items}]
+        items = items or []
+        prompt = ' '.join(_text_of(item.get('content')) for item in items
+                          if isinstance(item, dict) and item.get('role') == 'user')
+        called = any(isinstance(item, dict) and item.get('type') == 'function_call_output' for item in items)
+        tools = [tool for tool in body.get('tools') or [] if tool.get('type') == 'function']
+        fmt = (body.get('text') or {}).get('format') or {}
+        return StubCall(
+            'responses', agent_name(body.get('instructions')), prompt, bool(body.get('stream')),
+            pick_tool(tools, prompt) if self._wants_tool(tools, body.get('tool_choice'), called) else None,
+            fmt.get('schema') if fmt.get('type') == 'json_schema' else None,
+            body.get('max_output_tokens'), self.output_tokens,
+        )
+
+    def _plan_chat(self, body: Dict) -> StubCall:
+        messages = body.get('messages') or []
+        system = ' '.join(_text_of(m.get('content')) for m in messages if m.get('role') in ('system', 'developer'))
+        prompt = ' '.join(_text_of(m.get('content')) for m in messages if m.get('role') == 'user')
+        called = any(m.get('role') == 'tool' for m in messages)
+        tools = [tool for tool in body.get('tools') or [] if tool.get('type') == 'function']
+        fmt = body.get('response_format') or {}
+        schema = (fmt.get('json_schema') or {}).get('schema') if fmt.get('type') == 'json_schema' else None
+        return StubCall(
+            'chat', agent_name(system), prompt, bool(body.get('stream')),
+            pick_tool(tools, prompt) if self._wants_tool(tools, body.get('tool_choice'), called) else None,
+            schema, body.get('max_completion_tokens') or body.get('max_tokens'), self.output_tokens,
+        )
+
+    async def _answer(self, call: StubCall, writer) -> bool:
+        arrived = time.time()
+        start = time.perf_counter()
+        ttft_s = self.ttft.sample(call.agent, DEFAULT_TTFT_MS) / 1000
+        token_s = 1 / self.tokens_per_s if self.tokens_per_s > 0 else 0
+
+        if call.stream:
+            writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n'
+                         b'Cache-Control: no-cache\r\nConnection: close\r\n\r\n')
+            events = self._responses_events(call) if call.api == 'responses' else self._chat_events(call)
+            await asyncio.sleep(ttft_s)
+            first_token = None
+            for is_token, event in events:
+                if is_token and first_token is None:
+                    first_token = time.perf_counter()
+                elif is_token:
+                    await asyncio.sleep(token_s)
+                writer.write(event)
+                await writer.drain()
+        else:
+            await asyncio.sleep(ttft_s)
+            first_token = time.perf_counter()
+            await asyncio.sleep(token_s * max(0, call.output_tokens - 1))
+            payload = self._responses_body(call) if call.api == 'responses' else self._chat_body(call)
+            await self._json(writer, payload)
+
+        self.calls.append({
+            'id': call.id,
+            'api': call.api,
+            'agent': call.agent,
+            'session': call.session,
+            'tool': call.tool_name,
+            'stream': call.stream,
+            'arrived': arrived,
+            'ttft_ms': round(((first_token or time.perf_counter()) - start) * 1000, 2),
+            'total_ms': round((time.perf_counter() - start) * 1000, 2),
+            'input_tokens': call.input_tokens,
+            'output_tokens': call.output_tokens,
+        })
+        return not call.stream
+
+    def _usage(self, call: StubCall) -> Dict:
+        return {
+            'input_tokens': call.input_tokens,
+            'input_tokens_details': {'cached_tokens': 0},
+            'output_tokens': call.output_tokens,
+            'output_tokens_details': {'reasoning_tokens': 0},
+            'total_tokens': call.input_tokens + call.output_tokens,
+        }
+
+    def _output_item(self, call: StubCall) -> Dict:
+        if call.tool_name:
+            return {'type': 'function_call', 'id': f'fc_{call.id}', 'call_id': f'call_{call.id}',
+                    'name': call.tool_name, 'arguments': call.output, 'status': 'completed'}
+        return {'type': 'message', 'id': f'msg_{call.id}', 'role': 'assistant', 'status': 'completed',
+                'content': [{'type': 'output_text', 'text': call.output, 'annotations': []}]}
+
+    def _responses_body(self, call: StubCall, status: str = 'completed') -> Dict:
+        return {
+            'id': f'resp_{call.id}', 'object': 'response', 'created_at': int(time.time()),
+            'model': 'llm-stub', 'status': status,
+            'output': [self._output_item(call)] if status == 'completed' else [],
+            'usage': self._usage(call) if status == 'completed' else None,
+        }
+
+    def _responses_events(self, call: StubCall):
+        """(is_token, SSE bytes) in the order the Responses API streams them"""
+        seq = iter(range(1 << 30))
+
+        def sse(kind, **data):
+            data = {'type': kind, 'sequence_number': next(seq), **data}
+            return f"event: {kind}\ndata: {json.dumps(data)}\n\n".encode()
+
+        item = self._output_item(call)
+        yield False, sse('response.created', response=self._responses_body(call, 'in_progress'))
+        if call.tool_name:
+            yield False, sse('response.output_item.added', output_index=0, item={**item, 'arguments': ''})
+            for piece in call.chunks():
+                yield True, sse('response.function_call_arguments.delta', item_id=item['id'],
+                                output_index=0, delta=piece)
+            yield False, sse('response.function_call_arguments.done', item_id=item['id'],
+                             output_index=0, arguments=call.output)
+        else:
+            yield False, sse('response.output_item.added', output_index=0, item={**item, 'content': []})
+            part = {'type': 'output_text', 'text': '', 'annotations': []}
+            yield False, sse('response.content_part.added', item_id=item['id'], output_index=0,
+                             content_index=0, part=part)
+            for piece in call.chunks():
+                yield True, sse('response.output_text.delta', item_id=item['id'], output_index=0,
+                                content_index=0, delta=piece)
+            yield False, sse('response.output_text.done', item_id=item['id'], output_index=0,
+                             content_index=0, text=call.output)
+            yield False, sse('response.content_part.done', item_id=item['id'], output_index=0,
+                             content_index=0, part={**part, 'text': call.output})
+        yield False, sse('response.output_item.done', output_index=0, item=item)
+        yield False, sse('response.completed', response=self._responses_body(call))
+
+    def _chat_body(self, call: StubCall) -> Dict:
+        message = {'role': 'assistant', 'content': None if call.tool_name else call.output}
+        if call.tool_name:
+            message['tool_calls'] = [{'id': f'call_{call.id}', 'type': 'function',
+                                      'function': {'name': call.tool_name, 'arguments': call.output}}]
+        return {
+            'id': f'chatcmpl-{call.id}', 'object': 'chat.completion', 'created': int(time.time()),
+            'model': 'llm-stub',
+            'choices': [{'index': 0, 'message': message,
+                         'finish_reason': 'tool_calls' if call.tool_name else 'stop'}],
+            'usage': {'prompt_tokens': call.input_tokens, 'completion_tokens': call.output_tokens,
+                      'total_tokens': call.input_tokens + call.output_tokens},
+        }
+
+    def _chat_events(self, call: StubCall):
+        def sse(delta, finish=None):
+            chunk = {'id': f'chatcmpl-{call.id}', 'object': 'chat.completion.chunk',
+                     'created': int(time.time()), 'model': 'llm-stub',
+                     'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish}]}
+            return f"data: {json.dumps(chunk)}\n\n".encode()
+
+        yield False, sse({'role': 'assistant', 'content': None if call.tool_name else ''})
+        for i, piece in enumerate(call.chunks()):
+            if call.tool_name:
+                tool_call = {'index': 0, 'function': {'arguments': piece}}
+                if i == 0:
+                    tool_call.update(id=f'call_{call.id}', type='function')
+                    tool_call['function']['name'] = call.tool_name
+                yield True, sse({'tool_calls': [tool_call]})
+            else:
+                yield True, sse({'content': piece})
+        yield False, sse({}, 'tool_calls' if call.tool_name else 'stop')
+        yield False, b'data: [DONE]\n\n'
+
+    def embeddings(self, body: Dict) -> Dict:
+        """Deterministic unit vectors from a hash of each input - same text, same vector"""
+        inputs = body.get('input')
+        inputs = [inputs] if isinstance(inputs, str) else inputs or []
+        dims = int(body.get('dimensions') or 1536)
+        data = []
+        for i, text in enumerate(inputs):
+            seed = hashlib.sha256(str(text).encode()).digest()
+            raw = [((seed[j % 32] ^ (j * 131)) % 255) / 127.0 - 1 for j in range(dims)]
+            norm = math.sqrt(sum(v * v for v in raw)) or 1.0
+            data.append({'object': 'embedding', 'index': i, 'embedding': [v / norm for v in raw]})
+        tokens = sum(count_tokens(str(text)) for text in inputs)
+        return {'object': 'list', 'data': data, 'model': body.get('model', 'llm-stub'),
+                'usage': {'prompt_tokens': tokens, 'total_tokens': tokens}}
+
+
+def build_stub(args) -> LLMStub:
+    ttft = LatencyModel.load(args.latency) if args.latency else LatencyModel(
+        default={'dist': 'lognormal', 'median_ms': args.ttft_ms, 'sigma': args.ttft_sigma}
+        if args.ttft_sigma else {'dist': 'fixed', 'ms': args.ttft_ms}
+    )
+    return LLMStub(ttft, args.tokens_per_s, args.output_tokens, args.tool_calls, port=args.port)
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--ttft-ms', type=float, default=DEFAULT_TTFT_MS, help='Median time to first token')
+    parser.add_argument('--ttft-sigma', type=float, default=0.0, help='Lognormal spread (0 = fixed TTFT)')
+    parser.add_argument('--latency', help='Per-agent TTFT LatencyModel JSON, patterns match agent names')
+    parser.add_argument('--tokens-per-s', type=float, default=DEFAULT_TOKENS_PER_S)
+    parser.add_argument('--output-tokens', type=int, default=DEFAULT_OUTPUT_TOKENS)
+    parser.add_argument('--tool-calls', choices=['required', 'always'], default='required',
+                        help="Emit tool calls only when tool_choice demands one, or on every agent's first turn")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='OpenAI-compatible LLM stub with configurable TTFT and token rate')
+    parser.add_argument('--port', type=int, default=STUB_PORT)
+    add_stub_arguments(parser)
+    args = parser.parse_args(argv)
+
+    async def serve():
+        async with build_stub(args) as stub:
+            print(f"🤖 LLM stub on {stub.base_url} - TTFT {args.ttft_ms:.0f}ms, {args.tokens_per_s:.0f} tok/s")
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Local HTTP/WebSocket Primitives
+Just enough HTTP/1.1 + RFC 6455 on asyncio streams for local stand-ins and proxies
+No third-party server - every byte on the wire stays under our control
+"""
+
+import abc
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+# Never forwarded or replayed verbatim - they describe one hop, not the resource
+HOP_BY_HOP = {
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailer', 'transfer-encoding', 'upgrade', 'content-length',
+}
+
+REASONS = {
+    101: 'Switching Protocols', 200: 'OK', 204: 'No Content', 304: 'Not Modified',
+    400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error',
+    502: 'Bad Gateway', 503: 'Service Unavailable', 504: 'Gateway Timeout',
+}
+
+
+@dataclass
+class Request:
+    method: str
+    target: str
+    headers: List[Tuple[str, str]]
+    body: bytes = b''
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.target).path
+
+    @property
+    def query(self) -> str:
+        return urlsplit(self.target).query
+
+    def header(self, name: str, default: str = '') -> str:
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return default
+
+    @property
+    def is_websocket(self) -> bool:
+        return self.header('upgrade').lower() == 'websocket'
+
+
+@dataclass
+class Response:
+    status: int
+    headers: List[Tuple[str, str]] = field(default_factory=list)
+    body: bytes = b''
+
+    def header(self, name: str, default: str = '') -> str:
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return default
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Tuple[str, List[Tuple[str, str]]]:
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    headers = []
+    for line in lines[1:]:
+        if ':' in line:
+            key, value = line.split(':', 1)
+            headers.append((key.strip(), value.strip()))
+    return lines[0], headers
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: List[Tuple[str, str]],
+                     until_close: bool = False) -> bytes:
+    lookup = {key.lower(): value for key, value in headers}
+    if 'chunked' in lookup.get('transfer-encoding', '').lower():
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0].strip() or b'0', 16)
+            if size == 0:
+                await reader.readline()
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+    if 'content-length' in lookup:
+        return await reader.readexactly(int(lookup['content-length']))
+    return await reader.read() if until_close else b''
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Next request on a keep-alive connection, None when the client hung up"""
+    try:
+        start, headers = await _read_headers(reader)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+    method, target, _ = start.split(' ', 2)
+    return Request(method, target, headers, await _read_body(reader, headers))
+
+
+async def read_response(reader: asyncio.StreamReader, method: str = 'GET') -> Response:
+    start, headers = await _read_headers(reader)
+    status = int(start.split(' ', 2)[1])
+    if method == 'HEAD' or status in (101, 204, 304):
+        return Response(status, headers)
+    return Response(status, headers, await _read_body(reader, headers, until_close=True))
+
+
+def encode_response(response: Response) -> bytes:
+    lines = [f"HTTP/1.1 {response.status} {REASONS.get(response.status, 'Unknown')}"]
+    for key, value in response.headers:
+        if key.lower() not in HOP_BY_HOP:
+            lines.append(f"{key}: {value}")
+    lines.append(f"Content-Length: {len(response.body)}")
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + response.body
+
+
+def encode_request(request: Request, host: str) -> bytes:
+    lines = [f"{request.method} {request.target} HTTP/1.1", f"Host: {host}"]
+    for key, value in request.headers:
+        if key.lower() not in HOP_BY_HOP and key.lower() != 'host':
+            lines.append(f"{key}: {value}")
+    if request.body or request.method in ('POST', 'PUT', 'PATCH'):
+        lines.append(f"Content-Length: {len(request.body)}")
+    lines.append('Connection: close')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + request.body
+
+
+async def fetch(upstream: str, request: Request, timeout: float = 30) -> Response:
+    """Forward one request to http://host:port upstream on a fresh connection"""
+    parts = urlsplit(upstream)
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(parts.hostname, parts.port or 80), timeout
+    )
+    try:
+        writer.write(encode_request(request, parts.netloc))
+        await writer.drain()
+        return await asyncio.wait_for(read_response(reader, request.method), timeout)
+    finally:
+        writer.close()
+
+
+def websocket_accept(key: str) -> str:
+    return base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+
+
+async def accept_websocket(request: Request, writer: asyncio.StreamWriter):
+    """Answer the Upgrade handshake; the stream carries frames afterwards"""
+    writer.write((
+        'HTTP/1.1 101 Switching Protocols\r\n'
+        'Upgrade: websocket\r\n'
+        'Connection: Upgrade\r\n'
+        f"Sec-WebSocket-Accept: {websocket_accept(request.header('sec-websocket-key'))}\r\n\r\n"
+    ).encode())
+    await writer.drain()
+
+
+async def connect_websocket(upstream: str, request: Request):
+    """Client side of the handshake towards upstream, replaying the browser's headers"""
+    parts = urlsplit(upstream)
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+    key = base64.b64encode(os.urandom(16)).decode()
+    skip = HOP_BY_HOP | {'host', 'sec-websocket-key', 'sec-websocket-extensions'}
+    lines = [f"GET {request.target} HTTP/1.1", f"Host: {parts.netloc}",
+             'Upgrade: websocket', 'Connection: Upgrade', f"Sec-WebSocket-Key: {key}"]
+    lines += [f"{k}: {v}" for k, v in request.headers if k.lower() not in skip]
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+    await writer.drain()
+    start, _ = await _read_headers(reader)
+    if ' 101 ' not in start + ' ':
+        writer.close()
+        raise ConnectionError(f"Upstream refused WebSocket upgrade: {start}")
+    return reader, writer
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[bool, int, bytes]:
+    """(fin, opcode, unmasked payload)"""
+    b1, b2 = await reader.readexactly(2)
+    length = b2 & 0x7F
+    if length == 126:
+        length = struct.unpack('!H', await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack('!Q', await reader.readexactly(8))[0]
+    mask = await reader.readexactly(4) if b2 & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return bool(b1 & 0x80), b1 & 0x0F, payload
+
+
+def encode_frame(opcode: int, payload: bytes, masked: bool = False, fin: bool = True) -> bytes:
+    """Servers send unmasked frames, clients must mask"""
+    header = bytearray([(0x80 if fin else 0) | opcode])
+    mask_bit = 0x80 if masked else 0
+    if len(payload) < 126:
+        header.append(mask_bit | len(payload))
+    elif len(payload) < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack('!H', len(payload))
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack('!Q', len(payload))
+    if masked:
+        mask = os.urandom(4)
+        header += mask
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return bytes(header) + payload
+
+
+async def relay_frames(src: asyncio.StreamReader, dst: asyncio.StreamWriter, masked: bool, on_frame=None):
+    """Copy frames one way until close; on_frame(fin, opcode, payload) may await and returns False to drop"""
+    try:
+        while True:
+            fin, opcode, payload = await read_frame(src)
+            if on_frame is None or await on_frame(fin, opcode, payload) is not False:
+                dst.write(encode_frame(opcode, payload, masked=masked, fin=fin))
+                await dst.drain()
+            if opcode == OP_CLOSE:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        dst.close()
+
+
+def cors_headers(request: Request) -> List[Tuple[str, str]]:
+    """Credentialed CORS for whatever origin asked - local use only"""
+    return [
+        ('Access-Control-Allow-Origin', request.header('origin', '*')),
+        ('Access-Control-Allow-Credentials', 'true'),
+        ('Access-Control-Allow-Methods', 'GET, POST, PUT, PATCH, DELETE, OPTIONS'),
+        ('Access-Control-Allow-Headers', request.header('access-control-request-headers', '*')),
+        ('Vary', 'Origin'),
+    ]
+
+
+class LocalServer(abc.ABC):
+    """asyncio server lifecycle for the local stand-ins; subclasses answer requests in _serve"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.server = None
+        self._connections = {}
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        # Port 0 asks for an ephemeral port
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self.server:
+            self.server.close()
+            # Open keep-alive/WebSocket connections would otherwise outlive the server
+            for task in list(self._connections.values()):
+                task.cancel()
+            await self.server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None or not await self._serve(request, reader, writer):
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # Cancelled by stop() - the connection just ends with the server
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    @abc.abstractmethod
+    async def _serve(self, request: Request, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """Answer one request; False ends the connection (WebSocket taken over, close-delimited body)"""
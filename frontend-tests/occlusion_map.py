@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Occlusion Map
+Hit-tests the WHOLE viewport on a grid in ONE batched evaluate
+Shows which component is really on top - stacking contexts included
+"""
+
+import base64
+from typing import Dict, List, Tuple
+from dataclasses import dataclass
+
+import numpy as np
+
+from geometry_buffer import TO_BASE64_JS
+
+# First match walking up from the hit element decides the owning component
+COMPONENT_SELECTORS = (
+    ('dock', '.dock-navigation'),
+    ('timeline', '.timeline-scrubber'),
+    ('floating-ai', '.floating-ai-container, .floating-ai-bubble'),
+    ('backend-metrics', '.backend-metrics-panel'),
+    ('farm-info', '.farm-info-card'),
+    ('layers', '.layers-panel'),
+    ('burns', '.burns-panel'),
+    ('alerts', '.alerts-panel'),
+    ('boundary-drawer', '.farm-boundary-drawer'),
+    ('coordinates', '.coordinates-display'),
+    ('tutorial', '[class*="tutorial"]'),
+    ('modal', '[class*="modal"]'),
+    ('map', '.mapboxgl-map, .map-container'),
+)
+
+INTERACTIVE_SELECTOR = (
+    'button, a[href], input, select, textarea, summary, '
+    '[role="button"], [role="link"], [role="tab"], [role="menuitem"], '
+    '[role="checkbox"], [role="switch"], [role="slider"], [onclick], [tabindex]:not([tabindex="-1"])'
+)
+
+# Runs in the page. Per grid point: topmost element and its owning interactive
+# control; plus (point, control) pairs for controls found *under* something else.
+OCCLUSION_JS = '''([step, components, interactiveSelector]) => {''' + TO_BASE64_JS + '''
+    const cols = Math.ceil(window.innerWidth / step);
+    const rows = Math.ceil(window.innerHeight / step);
+    const table = new Map();
+    const names = [];
+    const componentOf = [];
+    const interactive = [];
+
+    const componentIndex = (el) => {
+        for (let node = el; node && node.nodeType === 1; node = node.parentElement) {
+            for (let c = 0; c < components.length; c++) {
+                if (node.matches(components[c])) return c;
+            }
+        }
+        return -1;
+    };
+    const describe = (el) => {
+        const cls = typeof el.className === 'string' ? el.className : (el.getAttribute('class') || '');
+        const label = el.getAttribute('aria-label') || el.getAttribute('title') || '';
+        return el.tagName.toLowerCase() + (cls ? '.' + cls.trim().split(/\\s+/).join('.') : '') +
+            (label ? ' "' + label + '"' : '');
+    };
+    const indexOf = (el) => {
+        let idx = table.get(el);
+        if (idx === undefined) {
+            idx = names.length;
+            table.set(el, idx);
+            names.push(describe(el));
+            componentOf.push(componentIndex(el));
+            interactive.push(el.matches(interactiveSelector) ? 1 : 0);
+        }
+        return idx;
+    };
+
+    const topElement = new Int32Array(cols * rows).fill(-1);
+    const topControl = new Int32Array(cols * rows).fill(-1);
+    const hidden = [];
+
+    for (let r = 0; r < rows; r++) {
+        for (let c = 0; c < cols; c++) {
+            const point = r * cols + c;
+            const stack = document.elementsFromPoint(c * step + step / 2, r * step + step / 2);
+            if (!stack.length) continue;
+
+            const top = stack[0];
+            topElement[point] = indexOf(top);
+            const control = top.closest(interactiveSelector);
+            if (control) topControl[point] = indexOf(control);
+
+            const seen = new Set();
+            for (let i = 1; i < stack.length; i++) {
+                const el = stack[i];
+                // Ancestors of the top element are not covered by it
+                if (el.contains(top) || !el.matches(interactiveSelector) || seen.has(el)) continue;
+                seen.add(el);
+                hidden.push(point, indexOf(el));
+            }
+        }
+    }
+
+    return {
+        step: step,
+        cols: cols,
+        rows: rows,
+        topElement: toBase64(topElement.buffer),
+        topControl: toBase64(topControl.buffer),
+        hidden: toBase64(new Int32Array(hidden).buffer),
+        names: names,
+        componentOf: componentOf,
+        interactive: interactive
+    };
+}'''
+
+
+def _int32(encoded: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(encoded), dtype='<i4')
+
+
+@dataclass
+class OcclusionMap:
+    """Grid of who-is-on-top, plus every interactive control found underneath"""
+    step: int
+    cols: int
+    rows: int
+    top_element: np.ndarray
+    top_control: np.ndarray
+    hidden_points: np.ndarray
+    hidden_elements: np.ndarray
+    element_names: List[str]
+    element_component: np.ndarray
+    element_interactive: np.ndarray
+    component_names: List[str]
+
+    @classmethod
+    def from_payload(cls, payload: Dict, component_names: List[str]) -> 'OcclusionMap':
+        rows, cols = payload['rows'], payload['cols']
+        hidden = _int32(payload['hidden']).reshape(-1, 2)
+        return cls(
+            step=payload['step'],
+            cols=cols,
+            rows=rows,
+            top_element=_int32(payload['topElement']).reshape(rows, cols),
+            top_control=_int32(payload['topControl']).reshape(rows, cols),
+            hidden_points=hidden[:, 0],
+            hidden_elements=hidden[:, 1],
+            element_names=payload['names'],
+            element_component=np.asarray(payload['componentOf'], dtype=np.int32),
+            element_interactive=np.asarray(payload['interactive'], dtype=bool),
+            component_names=list(component_names),
+        )
+
+    @property
+    def top_component(self) -> np.ndarray:
+        """(rows, cols) grid of the owning component index, -1 where unowned"""
+        lookup = np.append(self.element_component, -1)  # top_element == -1 maps to the sentinel
+        return lookup[self.top_element]
+
+    def coverage(self) -> Dict[str, float]:
+        """Fraction of the viewport each component actually wins"""
+        grid = self.top_component.ravel()
+        counts = np.bincount(grid + 1, minlength=len(self.component_names) + 1)
+        total = grid.size or 1
+        coverage = {name: float(counts[i + 1] / total) for i, name in enumerate(self.component_names)}
+        coverage['unowned'] = float(counts[0] / total)
+        return coverage
+
+    def component_label(self, index: int) -> str:
+        return self.component_names[index] if index >= 0 else 'unowned'
+
+    def hidden_controls(self, min_fraction: float = 0.0) -> List[Dict]:
+        """Controls that are (partly) covered, with what covers them"""
+        if len(self.hidden_elements) == 0:
+            return []
+
+        n = len(self.element_names)
+        hidden_counts = np.bincount(self.hidden_elements, minlength=n)
+        visible_counts = np.bincount(self.top_control[self.top_control >= 0], minlength=n)
+        sampled = hidden_counts + visible_counts
+        fraction = np.divide(hidden_counts, sampled, out=np.zeros(n), where=sampled > 0)
+
+        # Which component is on top at each hidden sample
+        covering = self.top_component.ravel()[self.hidden_points]
+        pairs, pair_counts = np.unique(
+            np.column_stack([self.hidden_elements, covering]), axis=0, return_counts=True
+        )
+
+        results = []
+        for element in np.flatnonzero((hidden_counts > 0) & (fraction >= min_fraction)):
+            mine = pairs[:, 0] == element
+            # Covered by its own component is layering inside a panel, not occlusion
+            others = mine & (pairs[:, 1] != self.element_component[element])
+            if not others.any():
+                continue
+            best = np.flatnonzero(others)[pair_counts[others].argmax()]
+            results.append({
+                'element': self.element_names[element],
+                'component': self.component_label(self.element_component[element]),
+                'covered_by': self.component_label(pairs[best, 1]),
+                'hidden_fraction': round(float(fraction[element]), 3),
+                'hidden_samples': int(hidden_counts[element]),
+                'fully_hidden': bool(visible_counts[element] == 0),
+            })
+        return sorted(results, key=lambda r: -r['hidden_fraction'])
+
+    def ascii_map(self) -> str:
+        """One character per cell, for eyeballing the layering in a terminal"""
+        symbols = '.' + ''.join(chr(ord('A') + i) for i in range(len(self.component_names)))
+        grid = self.top_component + 1
+        lines = [''.join(symbols[v] for v in row) for row in grid]
+        legend = ', '.join(f"{symbols[i + 1]}={name}" for i, name in enumerate(self.component_names))
+        return '\n'.join(lines + [legend])
+
+
+async def capture_occlusion_map(page, step: int = 16,
+                                components: Tuple = COMPONENT_SELECTORS) -> OcclusionMap:
+    """Hit-test the whole viewport at `step` px resolution in one evaluate"""
+    payload = await page.evaluate(
+        OCCLUSION_JS, [step, [selector for _, selector in components], INTERACTIVE_SELECTOR]
+    )
+    return OcclusionMap.from_payload(payload, [name for name, _ in components])
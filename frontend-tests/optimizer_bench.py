@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Schedule Optimizer Scaling Benchmark
+Synthetic burn days from 10 to 10,000 requests with realistic conflict density:
+farms cluster the way real growing regions do, morning windows crowd the same slots,
+and spatial conflicts come from plume_engine dispersion radii, not a fixed distance
+
+Each size runs backend/scripts/optimizer-bench.js in a fresh node process and records
+wall time per phase, iterations, reheats and final score - plus the log-log slope of
+the curve, so a change that makes scheduling superlinear shows up as a number
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from plume_engine import PlumeEngine, PlumeInputs
+from results_store import record_report
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+BENCH_SCRIPT = os.path.join(BACKEND_DIR, 'scripts', 'optimizer-bench.js')
+
+SIZES = (10, 30, 100, 300, 1000, 3000, 10000)
+CROPS = ('wheat', 'rice', 'barley', 'corn', 'cotton', 'sorghum')
+
+# Farm clusters ~ growing districts, spread over a region the size of a few counties
+REGION_CENTER = (38.5, -121.7)
+REGION_SPAN_DEG = 1.0
+CLUSTER_SPREAD_M = 4000
+
+# What the real predictor would report - nearest first, a handful per burn
+MAX_CONFLICTS_PER_BURN = 20
+
+WEATHER = {'windSpeed': 6, 'humidity': 45, 'precipitationProb': 10, 'temperature': 75}
+
+
+def _square(lat: float, lon: float, acres: float) -> Dict:
+    side_m = np.sqrt(acres * 4046.86)
+    dlat, dlon = side_m / 110540 / 2, side_m / (111320 * np.cos(np.radians(lat))) / 2
+    ring = [[lon - dlon, lat - dlat], [lon - dlon, lat + dlat], [lon + dlon, lat + dlat],
+            [lon + dlon, lat - dlat], [lon - dlon, lat - dlat]]
+    return {'type': 'Polygon', 'coordinates': [[[round(x, 6), round(y, 6)] for x, y in ring]]}
+
+
+def generate_scenario(n: int, seed: int = 0, clusters: Optional[int] = None,
+                      burn_date: Optional[str] = None) -> Dict:
+    """One burn day: n requests, their plume conflicts, and the weather the optimizer sees"""
+    rng = np.random.default_rng(seed)
+    clusters = clusters or max(1, int(np.sqrt(n) / 2))
+    centers = np.column_stack([
+        REGION_CENTER[0] + rng.uniform(-REGION_SPAN_DEG / 2, REGION_SPAN_DEG / 2, clusters),
+        REGION_CENTER[1] + rng.uniform(-REGION_SPAN_DEG / 2, REGION_SPAN_DEG / 2, clusters),
+    ])
+    which = rng.integers(0, clusters, n)
+    lat = centers[which, 0] + rng.normal(0, CLUSTER_SPREAD_M / 110540, n)
+    lon = centers[which, 1] + rng.normal(0, CLUSTER_SPREAD_M / (111320 * np.cos(np.radians(lat))), n)
+
+    acres = np.clip(rng.lognormal(np.log(80), 0.8, n), 5, 1000).round()
+    crops = rng.choice(CROPS, n)
+    # Everyone wants the morning; a few can only go in the afternoon
+    starts = np.where(rng.random(n) < 0.8, rng.choice([7, 8, 9], n), rng.choice([12, 13], n))
+    lengths = rng.choice([3, 4, 5, 6], n)
+    wind = rng.uniform(3, 12, n)
+
+    radius = {}
+    for crop in set(crops):
+        for a in set(acres[crops == crop]):
+            radius[(crop, a)] = PlumeEngine(PlumeInputs(float(a), str(crop), float(wind.mean()))).max_dispersion_radius()
+    reach = np.array([radius[(c, a)] for c, a in zip(crops, acres)])
+
+    ids = np.arange(1, n + 1)
+    requests = [{
+        'id': int(ids[i]),
+        'farm_id': int(which[i]) + 1,
+        'acres': float(acres[i]),
+        'crop_type': str(crops[i]),
+        'priority_score': int(rng.integers(1, 11)),
+        'time_window_start': f'{int(starts[i]):02d}:00',
+        'time_window_end': f'{int(min(20, starts[i] + lengths[i])):02d}:00',
+        'field_boundary': _square(float(lat[i]), float(lon[i]), float(acres[i])),
+    } for i in range(n)]
+
+    # Pairwise distances in row blocks - 10k x 10k at once would not fit comfortably
+    ylat, xlon = np.radians(lat), np.radians(lon)
+    predictions, conflict_pairs = [], 0
+    for block in range(0, n, 1000):
+        rows = slice(block, min(n, block + 1000))
+        dlat = ylat[rows, None] - ylat[None, :]
+        dlon = xlon[rows, None] - xlon[None, :]
+        a = np.sin(dlat / 2) ** 2 + np.cos(ylat[rows, None]) * np.cos(ylat[None, :]) * np.sin(dlon / 2) ** 2
+        dist = 2 * 6371000 * np.arcsin(np.sqrt(np.minimum(1, a)))
+        for local, i in enumerate(range(rows.start, rows.stop)):
+            d = dist[local]
+            d[i] = np.inf
+            hits = np.flatnonzero(d < np.maximum(reach[i], reach))
+            hits = hits[np.argsort(d[hits])][:MAX_CONFLICTS_PER_BURN]
+            if hits.size:
+                conflict_pairs += hits.size
+                share = d[hits] / np.maximum(reach[i], reach[hits])
+                predictions.append({'burnRequestId': int(ids[i]), 'conflicts': [
+                    {'type': 'spatial', 'burnRequestId': int(ids[j]),
+                     'severity': 'high' if s < 0.3 else 'medium' if s < 0.7 else 'low'}
+                    for j, s in zip(hits, share)
+                ]})
+
+    return {
+        'date': burn_date or (date.today() + timedelta(days=1)).isoformat(),
+        'burnRequests': requests,
+        'weatherData': WEATHER,
+        'predictionData': predictions,
+        'stats': {'clusters': clusters, 'conflict_pairs': conflict_pairs,
+                  'conflicts_per_burn': round(conflict_pairs / n, 2),
+                  'morning_share': round(float(np.mean(starts < 12)), 2)},
+    }
+
+
+def loglog_slope(sizes: List[int], values: List[float]) -> Optional[float]:
+    """Exponent k of value ~ n^k; 1 = linear"""
+    pairs = [(n, v) for n, v in zip(sizes, values) if v and v > 0]
+    if len(pairs) < 3:
+        return None
+    x, y = np.log([p[0] for p in pairs]), np.log([p[1] for p in pairs])
+    return float(np.polyfit(x, y, 1)[0])
+
+
+class OptimizerBenchmark:
+    """Runtime curve of runSimulatedAnnealing over synthetic days"""
+
+    def __init__(self, sizes=SIZES, repeats: int = 1, timeout_s: float = 600, seed: int = 0,
+                 superlinear_exponent: float = 1.3):
+        self.sizes = sizes
+        self.repeats = repeats
+        self.timeout_s = timeout_s
+        self.seed = seed
+        self.superlinear_exponent = superlinear_exponent
+        self.results: Dict[int, Dict] = {}
+
+    def run_node(self, scenario: Dict) -> Dict:
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump(scenario, f)
+            path = f.name
+        try:
+            start = time.perf_counter()
+            proc = subprocess.run(
+                ['node', BENCH_SCRIPT, path], cwd=BACKEND_DIR, capture_output=True, text=True,
+                timeout=self.timeout_s, env={**os.environ, 'LOG_LEVEL': 'error'},
+            )
+            wall_ms = (time.perf_counter() - start) * 1000
+        finally:
+            os.unlink(path)
+        if proc.returncode != 0:
+            if 'heap out of memory' in proc.stderr:
+                raise RuntimeError('JavaScript heap out of memory')
+            lines = [line for line in proc.stderr.splitlines() if line.strip()]
+            raise RuntimeError(lines[0] if lines else f'exit {proc.returncode}')
+        # The logger may share stdout - the result is the last JSON line
+        line = next(line for line in reversed(proc.stdout.splitlines()) if line.startswith('{'))
+        return {**json.loads(line), 'process_ms': wall_ms}
+
+    def run_size(self, n: int) -> Dict:
+        scenario = generate_scenario(n, self.seed)
+        runs = []
+        for _ in range(self.repeats):
+            try:
+                runs.append(self.run_node(scenario))
+            except subprocess.TimeoutExpired:
+                return {'requests': n, 'failed': f'no result within {self.timeout_s:.0f}s', **scenario['stats']}
+            except RuntimeError as e:
+                return {'requests': n, 'failed': str(e), **scenario['stats']}
+        # Annealing is unseeded in JS - keep the median run
+        run = sorted(runs, key=lambda r: r['anneal_ms'])[len(runs) // 2]
+        run['optimizer_ms'] = sum(run[k] for k in ('preprocess_ms', 'problem_ms', 'anneal_ms',
+                                                    'postprocess_ms', 'metrics_ms'))
+        run['anneal_us_per_iteration'] = run['anneal_ms'] * 1000 / max(1, run['iterations'])
+        return {**run, **scenario['stats'], 'failed': None}
+
+    def run(self) -> Dict:
+        print("📅 BURNWISE SCHEDULE OPTIMIZER SCALING BENCHMARK")
+        print(f"   Sizes {list(self.sizes)}, {self.repeats} run(s) each, {self.timeout_s:.0f}s budget per run")
+        for n in self.sizes:
+            self.results[n] = result = self.run_size(n)
+            if result['failed']:
+                # Bigger days will only fail harder
+                print(f"   ❌ n={n:>6}: {result['failed']} - stopping the sweep here")
+                break
+            print(f"   n={n:>6}: {result['optimizer_ms']:>10.0f}ms total, anneal {result['anneal_ms']:>10.0f}ms, "
+                  f"{result['iterations']:>5} it, {result['reheats']} reheats, score {result['score']:.4f}, "
+                  f"{result['conflicts_per_burn']:.1f} conflicts/burn")
+        self.print_report()
+        self.save()
+        return self.results
+
+    def curve(self) -> Dict:
+        done = [n for n, r in self.results.items() if not r['failed']]
+        return {
+            'optimizer_exponent': loglog_slope(done, [self.results[n]['optimizer_ms'] for n in done]),
+            'problem_exponent': loglog_slope(done, [self.results[n]['problem_ms'] for n in done]),
+            'per_iteration_exponent': loglog_slope(done, [self.results[n]['anneal_us_per_iteration'] for n in done]),
+        }
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        curve = self.curve()
+        for label, key in (('Whole optimizer', 'optimizer_exponent'), ('Problem setup (matrices)', 'problem_exponent'),
+                           ('One annealing iteration', 'per_iteration_exponent')):
+            k = curve[key]
+            if k is None:
+                continue
+            flag = '⚠️' if k > self.superlinear_exponent else '✅'
+            print(f"{flag} {label:26} ~ n^{k:.2f}")
+        done = [r for r in self.results.values() if not r['failed']]
+        if len({r['iterations'] for r in done}) == 1 and done:
+            print(f"   Every size ran exactly {done[0]['iterations']} iterations - the cooling schedule, "
+                  f"not convergence, ends the search")
+        if done:
+            last = done[-1]
+            print(f"   Largest completed day: {last['requests']} requests in {last['optimizer_ms'] / 1000:.1f}s, "
+                  f"{last['heapUsedMb']:.0f}MB heap")
+
+    def save(self):
+        curve = self.curve()
+        for n, result in self.results.items():
+            metrics = {k: v for k, v in result.items() if isinstance(v, (int, float)) and not isinstance(v, bool)}
+            critical = [f"❌ {n} requests: {result['failed']}"] if result['failed'] else []
+            record_report('optimizer-scaling', metrics, critical=critical, route='optimizer', profile=f'n{n}')
+        warnings = [f"⚠️ {key} n^{k:.2f} exceeds n^{self.superlinear_exponent}"
+                    for key, k in curve.items() if k is not None and k > self.superlinear_exponent]
+        record_report('optimizer-scaling', {k: v for k, v in curve.items() if v is not None},
+                      warnings=warnings, route='optimizer', profile='curve')
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'seed': self.seed,
+            'timeout_s': self.timeout_s,
+            'curve': curve,
+            'sizes': self.results,
+        }
+        with open('optimizer-scaling-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to optimizer-scaling-report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Simulated-annealing optimizer scaling benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--repeats', type=int, default=1)
+    parser.add_argument('--timeout', type=float, default=600, help='Seconds per optimizer run')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--scenario-only', metavar='N', type=int,
+                        help='Print the scenario for N requests as JSON and exit')
+    args = parser.parse_args(argv)
+
+    if args.scenario_only:
+        json.dump(generate_scenario(args.scenario_only, args.seed), sys.stdout)
+        return 0
+    OptimizerBenchmark(sorted(args.sizes), args.repeats, args.timeout, args.seed).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Burn Request Pipeline Throughput Benchmark
+Bursts of POST /api/burn-requests across synthetic farms/fields, then polls workflow-status
+Per-stage latency (coordinator -> weather -> predictor -> optimizer -> alerts), queueing
+before the handler runs, and completed requests per minute as the burst size grows
+
+Run the backend with RATE_LIMIT_MAX raised, or the limiter's 429s become the result
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from bench_common import percentile
+from local_http import Request, fetch
+from results_store import record_report
+
+DEFAULT_BACKEND = 'http://localhost:5001'
+STAGES = ('coordinator', 'weather', 'predictor', 'optimizer', 'alerts')
+CROPS = ('wheat', 'rice', 'barley', 'corn', 'cotton', 'soybeans')
+
+
+@dataclass
+class Submission:
+    burst: int
+    farm_id: int
+    started: float
+    status: int = 0
+    request_id: Optional[int] = None
+    client_ms: float = 0.0
+    server_ms: Optional[float] = None
+    stage_ms: Dict[str, float] = field(default_factory=dict)
+    visible_ms: Optional[float] = None
+    final_percentage: Optional[int] = None
+    poll_status: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def queue_ms(self) -> Optional[float]:
+        """Time the request spent outside the handler: accept, middleware, event-loop backlog"""
+        return None if self.server_ms is None else max(0.0, self.client_ms - self.server_ms)
+
+
+def synthetic_request(farm_id: int, n: int, rng: random.Random, days_ahead: int) -> Dict:
+    """Plausible field near the demo area; a different polygon and window every time"""
+    lon, lat = -98.5 + rng.uniform(-0.4, 0.4), 30.2 + rng.uniform(-0.4, 0.4)
+    size = rng.uniform(0.005, 0.02)
+    start_hour = rng.choice((7, 8, 9, 10))
+    return {
+        'farm_id': farm_id,
+        'field_name': f'Bench Field {farm_id}-{n}',
+        'field_boundary': {
+            'type': 'Polygon',
+            'coordinates': [[[lon, lat], [lon, lat + size], [lon + size, lat + size],
+                             [lon + size, lat], [lon, lat]]],
+        },
+        'acres': rng.randint(20, 400),
+        'crop_type': rng.choice(CROPS),
+        'burn_date': (date.today() + timedelta(days=days_ahead)).isoformat(),
+        'time_window_start': f'{start_hour:02d}:00',
+        'time_window_end': f'{start_hour + 4:02d}:00',
+        'reason': 'Pipeline throughput benchmark',
+    }
+
+
+class PipelineBenchmark:
+    """Throughput curve of the 5-agent burn request pipeline on one backend node"""
+
+    def __init__(self, backend: str = DEFAULT_BACKEND, burst_sizes=(1, 5, 10, 20), bursts: int = 3,
+                 farm_ids=(1, 2, 3), interval_s: float = 5, days_ahead: int = 3,
+                 poll_interval_s: float = 0.5, poll_timeout_s: float = 30, timeout: float = 180, seed: int = 0):
+        self.backend = backend
+        self.burst_sizes = burst_sizes
+        self.bursts = bursts
+        self.farm_ids = list(farm_ids)
+        self.interval_s = interval_s
+        self.days_ahead = days_ahead
+        self.poll_interval_s = poll_interval_s
+        self.poll_timeout_s = poll_timeout_s
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.submissions: Dict[int, List[Submission]] = {}
+        self.results = {}
+
+    async def _call(self, method: str, path: str, payload: Optional[Dict] = None):
+        body = json.dumps(payload).encode() if payload is not None else b''
+        request = Request(method, path, [('Content-Type', 'application/json')], body)
+        response = await fetch(self.backend, request, self.timeout)
+        try:
+            return response.status, json.loads(response.body or b'{}')
+        except ValueError:
+            return response.status, {}
+
+    async def submit(self, sub: Submission, payload: Dict):
+        try:
+            sub.status, body = await self._call('POST', '/api/burn-requests', payload)
+        except (OSError, asyncio.TimeoutError) as e:
+            sub.error = f'{type(e).__name__}: {e}'
+            return
+        finally:
+            sub.client_ms = (time.time() - sub.started) * 1000
+        if sub.status != 201:
+            sub.error = str(body.get('error') or body.get('message') or f'HTTP {sub.status}')
+            return
+        perf = body.get('workflow_performance') or {}
+        sub.server_ms = perf.get('total_duration_ms')
+        sub.stage_ms = perf.get('stage_ms') or {}
+        sub.request_id = (body.get('data') or {}).get('burn_request_id')
+        await self.poll(sub)
+
+    async def poll(self, sub: Submission):
+        """Until workflow-status stops moving - what a dashboard polling the request would see"""
+        if sub.request_id is None:
+            return
+        deadline = time.monotonic() + self.poll_timeout_s
+        last = None
+        while time.monotonic() < deadline:
+            try:
+                sub.poll_status, body = await self._call('GET', f'/api/burn-requests/{sub.request_id}/workflow-status')
+            except (OSError, asyncio.TimeoutError):
+                sub.poll_status = 0
+                return
+            if sub.poll_status != 200:
+                return
+            pct = (body.get('data') or {}).get('completion_percentage')
+            if pct != last:
+                sub.final_percentage = pct
+                sub.visible_ms = (time.time() - sub.started) * 1000
+            if pct == 100 or pct == last:
+                return
+            last = pct
+            await asyncio.sleep(self.poll_interval_s)
+
+    async def run_size(self, size: int) -> Dict:
+        subs = []
+        for burst in range(self.bursts):
+            batch = []
+            for n in range(size):
+                farm_id = self.farm_ids[(burst * size + n) % len(self.farm_ids)]
+                payload = synthetic_request(farm_id, burst * size + n, self.rng, self.days_ahead)
+                sub = Submission(burst, farm_id, time.time())
+                batch.append((sub, payload))
+            # A burst lands at once - nothing spaces the requests out for the backend
+            await asyncio.gather(*(self.submit(sub, payload) for sub, payload in batch))
+            subs += [sub for sub, _ in batch]
+            if burst < self.bursts - 1:
+                await asyncio.sleep(self.interval_s)
+        self.submissions[size] = subs
+        return self.summarize(subs)
+
+    def summarize(self, subs: List[Submission]) -> Dict:
+        ok = [s for s in subs if s.status == 201]
+        client = [s.client_ms for s in ok]
+        queue = [s.queue_ms for s in ok if s.queue_ms is not None]
+        # Time the node was actually loaded: first submit to last response of each burst
+        busy_s = 0.0
+        for burst in {s.burst for s in subs}:
+            batch = [s for s in subs if s.burst == burst]
+            busy_s += max(s.started + s.client_ms / 1000 for s in batch) - min(s.started for s in batch)
+        errors: Dict[str, int] = {}
+        for s in subs:
+            if s.status != 201:
+                key = str(s.status or 'connection')
+                errors[key] = errors.get(key, 0) + 1
+        summary = {
+            'submitted': len(subs),
+            'completed': len(ok),
+            'errors': errors,
+            'e2e_ms_p50': round(percentile(client, 50), 1),
+            'e2e_ms_p95': round(percentile(client, 95), 1),
+            'e2e_ms_max': round(max(client), 1) if client else 0.0,
+            'queue_ms_p50': round(percentile(queue, 50), 1),
+            'queue_ms_p95': round(percentile(queue, 95), 1),
+            'requests_per_min': round(len(ok) / busy_s * 60, 2) if busy_s > 0 else 0.0,
+            'status_visible_ms_p50': round(percentile([s.visible_ms for s in ok if s.visible_ms], 50), 1),
+            'status_poll_failures': sum(1 for s in ok if s.poll_status not in (None, 200)),
+            'stages': {},
+        }
+        for stage in STAGES:
+            values = [s.stage_ms[stage] for s in ok if stage in s.stage_ms]
+            if values:
+                summary['stages'][stage] = {
+                    'p50': round(percentile(values, 50), 1),
+                    'p95': round(percentile(values, 95), 1),
+                    'max': round(max(values), 1),
+                }
+        return summary
+
+    async def run(self) -> Dict:
+        print("🔥 BURNWISE BURN REQUEST PIPELINE BENCHMARK")
+        print(f"   {self.backend}: bursts of {list(self.burst_sizes)} x{self.bursts}, farms {self.farm_ids}")
+        for size in self.burst_sizes:
+            print(f"\n📦 Burst size {size}")
+            self.results[size] = result = await self.run_size(size)
+            print(f"   {result['completed']}/{result['submitted']} completed, "
+                  f"e2e p50 {result['e2e_ms_p50']:.0f}ms p95 {result['e2e_ms_p95']:.0f}ms, "
+                  f"queue p95 {result['queue_ms_p95']:.0f}ms, {result['requests_per_min']:.1f} req/min")
+            if result['errors']:
+                print(f"   ❌ errors by status: {result['errors']}")
+        self.print_report()
+        self.save()
+        return self.results
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        print("📊 PER-STAGE LATENCY p50 / p95 (ms)")
+        print(f"   {'burst':>5} " + ''.join(f"{stage:>18}" for stage in STAGES))
+        for size, result in self.results.items():
+            cells = ''.join(
+                f"{result['stages'][stage]['p50']:>8.0f} / {result['stages'][stage]['p95']:<7.0f}"
+                if stage in result['stages'] else f"{'-':>18}" for stage in STAGES
+            )
+            print(f"   {size:>5} {cells}")
+
+        best = max(self.results.items(), key=lambda item: item[1]['requests_per_min'], default=None)
+        if best and best[1]['requests_per_min']:
+            size, result = best
+            print(f"\n🏁 Peak throughput {result['requests_per_min']:.1f} req/min at burst size {size}")
+            # The stage whose p95 grows most from the smallest burst is the one that queues
+            first = self.results[self.burst_sizes[0]]['stages']
+            growth = {stage: result['stages'][stage]['p95'] / max(first[stage]['p95'], 1)
+                      for stage in result['stages'] if stage in first}
+            worst = max(growth, key=growth.get) if growth else None
+            if worst and growth[worst] > 1.2:
+                print(f"   Saturating stage: {worst} (p95 x{growth[worst]:.1f} vs burst size {self.burst_sizes[0]})")
+
+        if any(r['errors'].get('429') for r in self.results.values()):
+            print("\n⚠️ Rate limiter rejected requests - restart the backend with RATE_LIMIT_MAX raised")
+
+    def save(self):
+        for size, result in self.results.items():
+            metrics = {k: v for k, v in result.items() if isinstance(v, (int, float))}
+            for stage, values in result['stages'].items():
+                metrics[f'{stage}_ms_p50'] = values['p50']
+                metrics[f'{stage}_ms_p95'] = values['p95']
+            warnings = [f"⚠️ burst {size}: {count} request(s) failed with {status}"
+                        for status, count in result['errors'].items()]
+            record_report('pipeline-bench', metrics, warnings=warnings, route='/api/burn-requests',
+                          profile=f'burst{size}')
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'backend': self.backend,
+            'bursts': self.bursts,
+            'interval_s': self.interval_s,
+            'farm_ids': self.farm_ids,
+            'results': self.results,
+            'submissions': {size: [{**asdict(s), 'queue_ms': s.queue_ms} for s in subs]
+                            for size, subs in self.submissions.items()},
+        }
+        with open('pipeline-bench-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to pipeline-bench-report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Burn request pipeline throughput benchmark')
+    parser.add_argument('--backend', default=DEFAULT_BACKEND)
+    parser.add_argument('--burst-size', type=int, nargs='+', default=[1, 5, 10, 20])
+    parser.add_argument('--bursts', type=int, default=3, help='Bursts per size')
+    parser.add_argument('--interval', type=float, default=5, help='Seconds between bursts')
+    parser.add_argument('--farm-ids', type=int, nargs='+', default=[1, 2, 3],
+                        help='Existing farms to spread requests over')
+    parser.add_argument('--days-ahead', type=int, default=3,
+                        help='Burn date offset; <= 7 days also runs the optimizer stage')
+    parser.add_argument('--poll-timeout', type=float, default=30)
+    parser.add_argument('--timeout', type=float, default=180, help='Per request, seconds')
+    args = parser.parse_args(argv)
+
+    bench = PipelineBenchmark(args.backend, args.burst_size, args.bursts, args.farm_ids, args.interval,
+                              args.days_ahead, poll_timeout_s=args.poll_timeout, timeout=args.timeout)
+    asyncio.run(bench.run())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
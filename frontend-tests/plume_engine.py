@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Gaussian Plume Reference Engine
+Vectorized NumPy mirror of backend/agents/predictor.js - same emission model, stability
+classification, Pasquill-Gifford parameterization and ground-reflected plume equation,
+but over a full concentration grid instead of seven centerline points
+
+Deliberately reproduces the JS as written (sigma = a * x_km^0.894 from the first coefficient
+only) so any divergence means the predictor changed, not that the physics differ
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+# predictor.js stabilityClasses - only the first coefficient of each triple is used
+STABILITY_CLASSES = {
+    'A': {'sigmay': (213, 440.8, 1998), 'sigmaz': (440.8, 96.6, -1.7)},
+    'B': {'sigmay': (156, 106.6, 1.35), 'sigmaz': (106.6, 60.0, -1.3)},
+    'C': {'sigmay': (104, 61.0, 1.26), 'sigmaz': (61.0, 34.3, -1.1)},
+    'D': {'sigmay': (68, 44.5, 1.08), 'sigmaz': (44.5, 24.4, -0.96)},
+    'E': {'sigmay': (50.5, 55.4, 1.01), 'sigmaz': (55.4, 15.0, -0.76)},
+    'F': {'sigmay': (34, 62.6, 1.26), 'sigmaz': (62.6, 12.0, -0.54)},
+}
+PG_EXPONENT = 0.894
+
+PM25_STANDARDS = {'daily': 35, 'annual': 12, 'unhealthy': 55, 'hazardous': 250}
+
+# kg PM2.5 per ton burned / tons of biomass per acre
+EMISSION_FACTORS = {
+    'rice': 3.2, 'wheat': 2.8, 'corn': 2.1, 'barley': 2.6, 'oats': 2.4, 'cotton': 4.1,
+    'soybeans': 1.8, 'sunflower': 2.3, 'sorghum': 2.5, 'other': 2.5,
+}
+BIOMASS_PER_ACRE = {
+    'rice': 2.5, 'wheat': 2.0, 'corn': 3.0, 'barley': 1.8, 'oats': 1.6, 'cotton': 1.2,
+    'soybeans': 1.4, 'sunflower': 1.5, 'sorghum': 2.2, 'other': 2.0,
+}
+
+# runGaussianPlumeModel's centerline sample distances (m)
+CENTERLINE_DISTANCES = (100, 250, 500, 1000, 2000, 5000, 10000)
+
+MPH_TO_MS = 0.44704
+STACK_HEIGHT_M = 2
+
+
+def emission_rate(acres: float, crop_type: str) -> Dict[str, float]:
+    """calculateEmissionRate: g/s of PM2.5 over a 2-8 hour burn"""
+    if not acres or acres <= 0:
+        raise ValueError('Invalid acreage value')
+    biomass = acres * BIOMASS_PER_ACRE.get(crop_type, 2.0)
+    total = biomass * EMISSION_FACTORS.get(crop_type, 2.5)
+    duration = max(2, min(8, acres / 50))
+    return {
+        'totalEmissions': total,
+        'emissionRate': total * 1000 / (duration * 3600),
+        'burnDuration': duration,
+        'biomassPerAcre': BIOMASS_PER_ACRE.get(crop_type, 2.0),
+    }
+
+
+def stability_class(wind_mph: float, cloud_cover: float = 50, hour: int = 12) -> str:
+    """determineStabilityClass: Pasquill-Gifford from wind, cloud cover and time of day"""
+    wind = wind_mph * MPH_TO_MS
+    if 6 <= hour <= 18:
+        solar = 'strong' if cloud_cover < 25 else 'moderate' if cloud_cover < 50 else 'slight'
+    else:
+        solar = 'none'
+    if wind < 2:
+        return {'strong': 'A', 'moderate': 'B', 'slight': 'C'}.get(solar, 'F')
+    if wind < 3:
+        return {'strong': 'B', 'moderate': 'C', 'slight': 'D'}.get(solar, 'E')
+    if wind < 5:
+        return 'C' if solar == 'strong' else 'D'
+    return 'D'
+
+
+def buoyancy_rise(emission_g_s: float, temperature_f: float, wind_mph: float) -> float:
+    """calculateBuoyancyRise: simplified Holland rise, capped at 100 m"""
+    ambient = (temperature_f - 32) * 5 / 9 + 273.15
+    diameter = np.sqrt(emission_g_s / 1000)
+    flux = 9.81 * 400 / ambient * emission_g_s * 0.001
+    denominator = np.pi * diameter * wind_mph * MPH_TO_MS
+    # Calm wind divides by zero in JS too: Infinity, then the cap
+    rise = 100.0 if denominator == 0 else min(100.0, flux / denominator)
+    return float(max(0.0, rise))
+
+
+def sigmas(distance_m, stability: str):
+    """(sigma_y, sigma_z) in m for any array of downwind distances"""
+    x_km = np.maximum(0.1, np.asarray(distance_m, dtype=float) / 1000)
+    scale = x_km ** PG_EXPONENT
+    params = STABILITY_CLASSES[stability]
+    return np.maximum(1, params['sigmay'][0] * scale), np.maximum(1, params['sigmaz'][0] * scale)
+
+
+def concentration(q_g_s: float, wind_ms: float, stability: str, height_m: float,
+                  downwind_m, crosswind_m=0.0, receptor_m: float = 0.0) -> np.ndarray:
+    """Ground-reflected Gaussian plume, µg/m³; zero upwind of the source"""
+    x = np.asarray(downwind_m, dtype=float)
+    y = np.asarray(crosswind_m, dtype=float)
+    sy, sz = sigmas(x, stability)
+    q = q_g_s * 1e6
+    vertical = (np.exp(-0.5 * ((receptor_m - height_m) / sz) ** 2)
+                + np.exp(-0.5 * ((receptor_m + height_m) / sz) ** 2))
+    c = q / (2 * np.pi * wind_ms * sy * sz) * np.exp(-0.5 * (y / sy) ** 2) * vertical
+    return np.where(x > 0, c, 0.0)
+
+
+@dataclass
+class PlumeGrid:
+    """Ground-level concentration on an east/north grid centred on the burn"""
+    east: np.ndarray
+    north: np.ndarray
+    values: np.ndarray
+    resolution_m: float
+
+    @property
+    def max_concentration(self) -> float:
+        return float(self.values.max())
+
+    def exceedance_area(self, threshold: float) -> float:
+        """m² of cells above a threshold"""
+        return float(np.count_nonzero(self.values > threshold)) * self.resolution_m ** 2
+
+    def max_exceedance_distance(self, threshold: float) -> float:
+        """Furthest cell above a threshold, m from the source"""
+        mask = self.values > threshold
+        if not mask.any():
+            return 0.0
+        return float(np.hypot(self.east[mask], self.north[mask]).max())
+
+
+@dataclass
+class PlumeInputs:
+    acres: float
+    crop_type: str
+    wind_mph: float
+    wind_direction_deg: float = 0.0
+    temperature_f: float = 75.0
+    cloud_cover: float = 50.0
+    hour: int = 12
+    stability: Optional[str] = None
+
+    @property
+    def wind_ms(self) -> float:
+        # runGaussianPlumeModel clamps to 1 m/s; stability uses the raw value
+        return max(1.0, self.wind_mph * MPH_TO_MS)
+
+
+class PlumeEngine:
+    """predictSmokeDispersion without the DB, vector and AI steps"""
+
+    def __init__(self, inputs: PlumeInputs):
+        self.inputs = inputs
+        self.emission = emission_rate(inputs.acres, inputs.crop_type)
+        self.stability = inputs.stability or stability_class(inputs.wind_mph, inputs.cloud_cover, inputs.hour)
+        self.effective_height = STACK_HEIGHT_M + buoyancy_rise(
+            self.emission['emissionRate'], inputs.temperature_f, inputs.wind_mph
+        )
+
+    def centerline(self, distances: Sequence[float] = CENTERLINE_DISTANCES) -> np.ndarray:
+        return concentration(self.emission['emissionRate'], self.inputs.wind_ms, self.stability,
+                             self.effective_height, distances)
+
+    def max_dispersion_radius(self) -> float:
+        """calculateMaxDispersionRadius over the JS sample distances"""
+        c = self.centerline()
+        distances = np.asarray(CENTERLINE_DISTANCES, dtype=float)
+        over = distances[c > PM25_STANDARDS['daily']]
+        if over.size:
+            return float(over.max())
+        over = distances[c > c.max() * 0.1]
+        return float(over.max()) if over.size else 0.0
+
+    def grid(self, extent_m: float = 10000, resolution_m: float = 50) -> PlumeGrid:
+        """Full grid; the plume travels toward wind_direction_deg as the JS polygon does"""
+        axis = np.arange(-extent_m, extent_m + resolution_m / 2, resolution_m)
+        east, north = np.meshgrid(axis, axis)
+        theta = np.radians(self.inputs.wind_direction_deg)
+        # The JS polygon measures angles from east, counter-clockwise
+        downwind = east * np.cos(theta) + north * np.sin(theta)
+        crosswind = -east * np.sin(theta) + north * np.cos(theta)
+        values = concentration(self.emission['emissionRate'], self.inputs.wind_ms, self.stability,
+                               self.effective_height, downwind, crosswind)
+        return PlumeGrid(east, north, values, resolution_m)
+
+    def summary(self) -> Dict:
+        """Same fields /api/predictor/smoke-dispersion returns"""
+        peak = float(self.centerline().max())
+        return {
+            'stabilityClass': self.stability,
+            'emissionRate': self.emission['emissionRate'],
+            'maxRadius': self.max_dispersion_radius(),
+            'maxConcentration': round(peak, 2),
+            'exceedsDaily': peak > PM25_STANDARDS['daily'],
+            'exceedsUnhealthy': peak > PM25_STANDARDS['unhealthy'],
+        }
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Predictor Cross-Check + Plume Grid Benchmark
+Sweeps /api/predictor against the NumPy reference in plume_engine.py, flags every output
+that drifts, and prices full-grid resolutions against what one API call costs
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from bench_common import percentile
+from local_http import Request, fetch
+from plume_engine import (
+    PM25_STANDARDS, STABILITY_CLASSES, PlumeEngine, PlumeInputs, concentration,
+)
+from results_store import record_report
+
+DEFAULT_BACKEND = 'http://localhost:5001'
+
+# Small enough to run against a live backend (smoke-dispersion includes the AI safety step)
+SWEEP = {
+    'acres': (20, 200),
+    'crop_type': ('wheat', 'rice', 'cotton'),
+    'wind_mph': (2, 6, 15),
+    'cloud_cover': (10, 80),
+    'hour': (12, 22),
+}
+FULL_SWEEP = {
+    'acres': (10, 50, 200, 600),
+    'crop_type': ('wheat', 'rice', 'cotton', 'corn', 'sorghum'),
+    'wind_mph': (1, 3, 6, 10, 20),
+    'cloud_cover': (10, 40, 80),
+    'hour': (8, 14, 22),
+}
+GAUSSIAN_SWEEP = {
+    'stabilityClass': tuple(STABILITY_CLASSES),
+    'receptorDistance': (100, 1000, 5000),
+    'windSpeed': (1.0, 5.0, 12.0),
+    'emissionRate': (1.0, 50.0),
+}
+RESOLUTIONS_M = (200, 100, 50, 25, 10)
+
+REL_TOL = 1e-6
+
+
+def close(expected: float, actual: float, abs_tol: float = 0.0) -> bool:
+    return abs(expected - actual) <= max(abs_tol, REL_TOL * abs(expected))
+
+
+def sweep_points(grid: Dict) -> List[Dict]:
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+
+
+class PredictorCheck:
+    """Cross-check the predictor API against the reference, then benchmark grid cost"""
+
+    def __init__(self, backend: str = DEFAULT_BACKEND, sweep: Optional[Dict] = None,
+                 resolutions=RESOLUTIONS_M, extent_m: float = 10000, offline: bool = False,
+                 timeout: float = 60):
+        self.backend = backend
+        self.sweep = sweep or SWEEP
+        self.resolutions = resolutions
+        self.extent_m = extent_m
+        self.offline = offline
+        self.timeout = timeout
+        self.mismatches: List[str] = []
+        self.latency_ms: Dict[str, List[float]] = {'smoke-dispersion': [], 'gaussian-plume': []}
+        self.results = {}
+
+    async def _post(self, path: str, payload: Dict) -> Tuple[int, Dict, float]:
+        request = Request('POST', path, [('Content-Type', 'application/json')], json.dumps(payload).encode())
+        start = time.perf_counter()
+        response = await fetch(self.backend, request, self.timeout)
+        elapsed = (time.perf_counter() - start) * 1000
+        try:
+            return response.status, json.loads(response.body or b'{}'), elapsed
+        except ValueError:
+            return response.status, {}, elapsed
+
+    async def check_dispersion(self, point: Dict) -> int:
+        inputs = PlumeInputs(point['acres'], point['crop_type'], point['wind_mph'], 90.0,
+                             cloud_cover=point['cloud_cover'], hour=point['hour'])
+        expected = PlumeEngine(inputs).summary()
+        weather = {
+            # The route validates snake_case, the agent reads camelCase - send both
+            'wind_speed': inputs.wind_mph, 'wind_direction': inputs.wind_direction_deg,
+            'windSpeed': inputs.wind_mph, 'windDirection': inputs.wind_direction_deg,
+            'temperature': inputs.temperature_f, 'cloud_cover': inputs.cloud_cover,
+            # No zone suffix - the backend reads the hour in its own local time
+            'timestamp': f'2025-06-01T{inputs.hour:02d}:00:00',
+        }
+        status, body, elapsed = await self._post('/api/predictor/smoke-dispersion', {
+            'burnData': {'acres': inputs.acres, 'crop_type': inputs.crop_type}, 'weatherData': weather,
+        })
+        label = f"smoke-dispersion {point}"
+        if status != 200:
+            self.mismatches.append(f"{label}: HTTP {status} {body.get('details') or body.get('error')}")
+            return 1
+        self.latency_ms['smoke-dispersion'].append(elapsed)
+
+        dispersion, meta = body.get('dispersion') or {}, body.get('metadata') or {}
+        actual = {
+            'stabilityClass': meta.get('stabilityClass'),
+            'emissionRate': (meta.get('emissionRate') or {}).get('emissionRate'),
+            'maxRadius': dispersion.get('maxRadius'),
+            'maxConcentration': (dispersion.get('concentrationMap') or {}).get('maxConcentration'),
+            'exceedsDaily': (dispersion.get('concentrationMap') or {}).get('exceedsDaily'),
+        }
+        wrong = []
+        for key, value in actual.items():
+            want = expected[key]
+            if isinstance(want, float) and isinstance(value, (int, float)):
+                ok = close(want, value, abs_tol=0.01 if key == 'maxConcentration' else 0.0)
+            else:
+                ok = want == value
+            if not ok:
+                wrong.append(f"{key} {value!r} != {want!r}")
+        if wrong:
+            self.mismatches.append(f"{label}: {', '.join(wrong)}")
+        return len(wrong)
+
+    async def check_gaussian(self, point: Dict) -> int:
+        status, body, elapsed = await self._post('/api/predictor/gaussian-plume', {**point, 'sourceHeight': 2.0})
+        label = f"gaussian-plume {point}"
+        if status != 200:
+            self.mismatches.append(f"{label}: HTTP {status} {body.get('details') or body.get('error')}")
+            return 1
+        self.latency_ms['gaussian-plume'].append(elapsed)
+        # The route takes m/s and uses sourceHeight as the effective height - no clamp, no rise
+        want = float(concentration(point['emissionRate'], point['windSpeed'], point['stabilityClass'],
+                                   2.0, point['receptorDistance']))
+        if not close(want, body.get('concentration', float('nan'))):
+            self.mismatches.append(f"{label}: concentration {body.get('concentration')!r} != {want!r}")
+            return 1
+        return 0
+
+    async def cross_check(self) -> Dict:
+        dispersion = sweep_points(self.sweep)
+        gaussian = sweep_points(GAUSSIAN_SWEEP)
+        print(f"🔬 Cross-checking {len(dispersion)} smoke-dispersion + {len(gaussian)} gaussian-plume calls")
+        # Sequential on purpose: these latencies are the per-call cost, not a load test
+        bad = 0
+        for point in dispersion:
+            bad += await self.check_dispersion(point)
+        for point in gaussian:
+            bad += await self.check_gaussian(point)
+        return {
+            'calls': len(dispersion) + len(gaussian),
+            'mismatched_fields': bad,
+            'smoke_dispersion_ms_p50': round(percentile(self.latency_ms['smoke-dispersion'], 50), 1),
+            'smoke_dispersion_ms_p95': round(percentile(self.latency_ms['smoke-dispersion'], 95), 1),
+            'gaussian_plume_ms_p50': round(percentile(self.latency_ms['gaussian-plume'], 50), 1),
+            'gaussian_plume_ms_p95': round(percentile(self.latency_ms['gaussian-plume'], 95), 1),
+        }
+
+    def grid_benchmark(self, repeats: int = 5) -> Dict:
+        """Cost and answer of the full grid per resolution for one representative burn"""
+        engine = PlumeEngine(PlumeInputs(200, 'rice', 6, 90.0, cloud_cover=40))
+        rows = {}
+        for resolution in self.resolutions:
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                grid = engine.grid(self.extent_m, resolution)
+                timings.append((time.perf_counter() - start) * 1000)
+            rows[resolution] = {
+                'cells': int(grid.values.size),
+                'grid_ms_p50': round(percentile(timings, 50), 2),
+                'mcells_per_s': round(grid.values.size / (percentile(timings, 50) / 1000) / 1e6, 1),
+                'max_concentration': round(grid.max_concentration, 2),
+                'daily_exceedance_km2': round(grid.exceedance_area(PM25_STANDARDS['daily']) / 1e6, 3),
+                'daily_exceedance_reach_m': round(grid.max_exceedance_distance(PM25_STANDARDS['daily']), 1),
+            }
+        rows['api_max_radius_m'] = engine.max_dispersion_radius()
+        return rows
+
+    async def run(self) -> Dict:
+        print("🌫️  BURNWISE PREDICTOR CROSS-CHECK")
+        if not self.offline:
+            self.results['cross_check'] = await self.cross_check()
+        self.results['grid'] = self.grid_benchmark()
+        self.print_report()
+        self.save()
+        return self.results
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        check = self.results.get('cross_check')
+        if check:
+            status = '✅' if not self.mismatches else '❌'
+            print(f"{status} {check['calls']} API calls, {check['mismatched_fields']} mismatched field(s)")
+            for line in self.mismatches[:10]:
+                print(f"   {line}")
+            if len(self.mismatches) > 10:
+                print(f"   ... {len(self.mismatches) - 10} more in predictor-check-report.json")
+            print(f"   smoke-dispersion p50 {check['smoke_dispersion_ms_p50']:.1f}ms, "
+                  f"gaussian-plume p50 {check['gaussian_plume_ms_p50']:.1f}ms")
+
+        grid = self.results['grid']
+        print(f"\n📐 FULL GRID ({self.extent_m / 1000:.0f} km each way) vs the API's 7-point centerline")
+        for resolution in self.resolutions:
+            row = grid[resolution]
+            print(f"   {resolution:>4}m {row['cells']:>9,} cells {row['grid_ms_p50']:>9.2f}ms "
+                  f"{row['mcells_per_s']:>6.1f} Mcell/s  >35µg/m³ reach {row['daily_exceedance_reach_m']:>7.0f}m "
+                  f"area {row['daily_exceedance_km2']:.2f}km²")
+        finest = grid[min(self.resolutions)]
+        print(f"   API maxRadius {grid['api_max_radius_m']:.0f}m vs grid reach {finest['daily_exceedance_reach_m']:.0f}m "
+              f"- the difference is the cost of sampling seven distances")
+        check_ms = (check or {}).get('smoke_dispersion_ms_p50')
+        if check_ms:
+            affordable = [r for r in self.resolutions if grid[r]['grid_ms_p50'] <= check_ms]
+            if affordable:
+                print(f"   A {min(affordable)}m grid costs less than one smoke-dispersion call ({check_ms:.0f}ms)")
+
+    def save(self):
+        metrics = dict(self.results.get('cross_check', {}))
+        for resolution in self.resolutions:
+            metrics[f'grid_ms_{resolution}m'] = self.results['grid'][resolution]['grid_ms_p50']
+        record_report('predictor-check', metrics, critical=[f"❌ {m}" for m in self.mismatches],
+                      route='/api/predictor')
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'backend': None if self.offline else self.backend,
+            'sweep': self.sweep,
+            **self.results,
+            'mismatches': self.mismatches,
+        }
+        with open('predictor-check-report.json', 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        print("\n📄 Report saved to predictor-check-report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cross-check /api/predictor against the NumPy plume engine')
+    parser.add_argument('--backend', default=DEFAULT_BACKEND)
+    parser.add_argument('--full', action='store_true', help='Large parameter sweep (slow: one AI call each)')
+    parser.add_argument('--offline', action='store_true', help='Grid benchmark only, no backend')
+    parser.add_argument('--resolution', type=int, nargs='+', default=list(RESOLUTIONS_M), help='Grid cell sizes (m)')
+    parser.add_argument('--extent', type=float, default=10000, help='Grid half-width (m)')
+    args = parser.parse_args(argv)
+
+    check = PredictorCheck(args.backend, FULL_SWEEP if args.full else SWEEP, sorted(args.resolution, reverse=True),
+                           args.extent, args.offline)
+    asyncio.run(check.run())
+    return 1 if check.mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Statistical Regression Gate
+N samples per metric (warm-up discarded) vs. the STORED baseline distribution
+Mann-Whitney U + effect size - fails ONLY on significant, meaningful regressions
+"""
+
+import argparse
+import asyncio
+import contextlib
+import math
+import sys
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from bench_common import FRAME_SAMPLE_JS
+from interactions import BACKEND_URL, FRONTEND_URL, login
+from results_store import ResultsStore, current_commit
+
+GATE_SUITE = 'gate'
+
+API_ENDPOINTS = (
+    '/api/farms',
+    '/api/burn-requests',
+    '/api/weather/current',
+    '/api/schedule/timeline/2025-08-18',
+    '/api/analytics/dashboard',
+)
+
+# Metrics where a bigger number is the better one; everything else is a cost
+HIGHER_IS_BETTER = {'fps'}
+
+
+def mann_whitney_u(baseline, candidate):
+    """U statistic of candidate vs. baseline and the normal-approximation z (tie corrected)"""
+    x = np.asarray(baseline, dtype=np.float64)
+    y = np.asarray(candidate, dtype=np.float64)
+    n1, n2 = len(x), len(y)
+    combined = np.concatenate([x, y])
+
+    # Average ranks for ties
+    order = np.argsort(combined, kind='mergesort')
+    ranks = np.empty(len(combined))
+    ranks[order] = np.arange(1, len(combined) + 1)
+    _, inverse, counts = np.unique(combined, return_inverse=True, return_counts=True)
+    ranks = (np.bincount(inverse, weights=ranks) / counts)[inverse]
+
+    u_candidate = float(ranks[n1:].sum() - n2 * (n2 + 1) / 2)
+    n = n1 + n2
+    tie_term = float((counts ** 3 - counts).sum()) / (n * (n - 1)) if n > 1 else 0.0
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term))
+    if sigma == 0:
+        return u_candidate, 0.0
+    # Continuity correction towards the mean
+    mu = n1 * n2 / 2
+    delta = u_candidate - mu
+    z = (delta - math.copysign(0.5, delta)) / sigma if delta else 0.0
+    return u_candidate, z
+
+
+def one_sided_p(z: float) -> float:
+    """P(Z >= z) for a standard normal"""
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclass
+class GateResult:
+    metric: str
+    baseline_n: int
+    candidate_n: int
+    baseline_median: float
+    candidate_median: float
+    change_pct: float
+    cliffs_delta: float
+    p_value: float
+    regressed: bool
+
+    @property
+    def status(self) -> str:
+        return '❌ REGRESSED' if self.regressed else '✅ ok'
+
+
+def compare(metric: str, baseline: List[float], candidate: List[float], alpha: float = 0.01,
+            min_change_pct: float = 3.0, min_cliffs_delta: float = 0.33) -> GateResult:
+    """One-sided test in the 'worse' direction; significance AND effect size must both hold"""
+    worse_is_higher = metric not in HIGHER_IS_BETTER
+    u, z = mann_whitney_u(baseline, candidate)
+    if not worse_is_higher:
+        z = -z
+        u = len(baseline) * len(candidate) - u
+    p_value = one_sided_p(z)
+    # Cliff's delta: P(candidate worse) - P(candidate better)
+    cliffs_delta = 2 * u / (len(baseline) * len(candidate)) - 1
+
+    base_median = float(np.median(baseline))
+    cand_median = float(np.median(candidate))
+    change_pct = (cand_median - base_median) / abs(base_median) * 100 if base_median else 0.0
+    worse_pct = change_pct if worse_is_higher else -change_pct
+
+    return GateResult(
+        metric=metric,
+        baseline_n=len(baseline),
+        candidate_n=len(candidate),
+        baseline_median=round(base_median, 3),
+        candidate_median=round(cand_median, 3),
+        change_pct=round(change_pct, 2),
+        cliffs_delta=round(cliffs_delta, 3),
+        p_value=p_value,
+        regressed=bool(p_value < alpha and worse_pct >= min_change_pct and cliffs_delta >= min_cliffs_delta),
+    )
+
+
+class RegressionGate:
+    """Collect repeated samples, store them, compare with a baseline commit"""
+
+    def __init__(self, samples: int = 15, warmup: int = 3, route: str = '/spatial',
+                 viewport=(1920, 1080), profile: str = 'default', headless: bool = True,
+                 replay: Optional[str] = None, latency: Optional[str] = None):
+        self.samples = samples
+        self.warmup = warmup
+        self.route = route
+        self.viewport = viewport
+        self.profile = profile
+        self.headless = headless
+        self.replay = replay
+        self.latency = latency
+        # Replayed-backend samples are never compared with live-backend ones
+        self.run_key = {'route': route, 'viewport': f'{viewport[0]}x{viewport[1]}',
+                        'profile': f'{profile}+replay' if replay else profile}
+
+    def sample_api(self) -> Dict[str, float]:
+        sample = {}
+        for endpoint in API_ENDPOINTS:
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(f'{BACKEND_URL}{endpoint}', timeout=10) as response:
+                    response.read()
+            except urllib.error.HTTPError:
+                # Error responses are still timed; the audits report the status separately
+                pass
+            except (urllib.error.URLError, OSError) as e:
+                print(f"   ⚠️ {endpoint}: {str(e)}")
+                continue
+            sample[f'api_ms:{endpoint}'] = (time.perf_counter() - start) * 1000
+        return sample
+
+    async def collect(self) -> List[Dict[str, float]]:
+        """samples + warmup page loads; the warm-up ones never leave this method"""
+        from playwright.async_api import async_playwright
+
+        collected = []
+        async with contextlib.AsyncExitStack() as stack:
+            if self.replay:
+                # Recorded backend on :5001 - samples measure the frontend, not TiDB
+                from backend_standin import replay_standin
+                await stack.enter_async_context(replay_standin(self.replay, self.latency))
+            p = await stack.enter_async_context(async_playwright())
+            browser = await p.chromium.launch(headless=self.headless)
+            context = await browser.new_context(
+                viewport={'width': self.viewport[0], 'height': self.viewport[1]}
+            )
+            page = await context.new_page()
+            await login(page)
+
+            for i in range(self.warmup + self.samples):
+                label = 'warm-up' if i < self.warmup else f'sample {i - self.warmup + 1}/{self.samples}'
+                print(f"⏱️  {label}...")
+                await page.goto(f'{FRONTEND_URL}{self.route}')
+                await page.wait_for_load_state('networkidle')
+                sample = await page.evaluate(FRAME_SAMPLE_JS, 60)
+                # Off the loop thread - a replay stand-in may be serving on this loop
+                sample.update(await asyncio.to_thread(self.sample_api))
+                if i >= self.warmup:
+                    collected.append(sample)
+
+            await browser.close()
+        return collected
+
+    def baseline_sha(self, store: ResultsStore, metric: str, current: str) -> Optional[str]:
+        """Most recent recorded commit before the current one in history order"""
+        by_commit = store.values_by_commit(metric, suite=GATE_SUITE, **self.run_key)
+        order = store.commit_order(by_commit)
+        if current not in order:
+            return None
+        earlier = order[:order.index(current)]
+        return earlier[-1] if earlier else None
+
+    def evaluate(self, store: ResultsStore, candidate_sha: str, baseline_sha: Optional[str] = None,
+                 metrics: Optional[List[str]] = None, **thresholds) -> List[GateResult]:
+        results = []
+        for metric in metrics or store.metric_names(GATE_SUITE):
+            by_commit = store.values_by_commit(metric, suite=GATE_SUITE, **self.run_key)
+            candidate = by_commit.get(candidate_sha, [])
+            base_sha = baseline_sha or self.baseline_sha(store, metric, candidate_sha)
+            baseline = by_commit.get(base_sha, []) if base_sha else []
+            if len(candidate) < 5 or len(baseline) < 5:
+                print(f"   ⚪ {metric}: not enough samples (baseline {len(baseline)}, candidate {len(candidate)})")
+                continue
+            results.append(compare(metric, baseline, candidate, **thresholds))
+        return results
+
+    async def run(self, baseline_sha: Optional[str] = None, **thresholds) -> bool:
+        samples = await self.collect()
+        candidate_sha, _ = current_commit()
+
+        with ResultsStore() as store:
+            for sample in samples:
+                store.record_run(GATE_SUITE, sample, **self.run_key)
+            results = self.evaluate(store, candidate_sha, baseline_sha,
+                                    metrics=sorted({name for s in samples for name in s}), **thresholds)
+        return self.print_report(results)
+
+    def print_report(self, results: List[GateResult]) -> bool:
+        print("\n" + "=" * 100)
+        print("🚦 STATISTICAL REGRESSION GATE")
+        print("=" * 100)
+        print(f"{'metric':<42} {'baseline':>10} {'candidate':>10} {'change':>8} {'delta':>7} {'p':>9}  status")
+        for r in results:
+            print(f"{r.metric:<42} {r.baseline_median:>10.2f} {r.candidate_median:>10.2f} "
+                  f"{r.change_pct:>+7.1f}% {r.cliffs_delta:>7.2f} {r.p_value:>9.2e}  {r.status}")
+
+        regressions = [r for r in results if r.regressed]
+        if regressions:
+            print(f"\n❌ {len(regressions)} SIGNIFICANT REGRESSION(S)")
+        elif results:
+            print("\n✅ NO SIGNIFICANT REGRESSIONS")
+        else:
+            print("\n⚪ No baseline yet - these samples become the baseline")
+        return not regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Gate on statistically significant regressions')
+    parser.add_argument('--samples', type=int, default=15)
+    parser.add_argument('--warmup', type=int, default=3)
+    parser.add_argument('--route', default='/spatial')
+    parser.add_argument('--profile', default='default')
+    parser.add_argument('--baseline', help='Baseline git SHA (default: latest earlier recorded commit)')
+    parser.add_argument('--alpha', type=float, default=0.01)
+    parser.add_argument('--min-change-pct', type=float, default=3.0)
+    parser.add_argument('--min-cliffs-delta', type=float, default=0.33)
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument('--replay', help='Serve the backend from this recorded cassette')
+    parser.add_argument('--latency', help='Latency model JSON for --replay')
+    args = parser.parse_args(argv)
+
+    gate = RegressionGate(args.samples, args.warmup, args.route, profile=args.profile,
+                          headless=not args.headed, replay=args.replay, latency=args.latency)
+    passed = asyncio.run(gate.run(
+        args.baseline, alpha=args.alpha, min_change_pct=args.min_change_pct,
+        min_cliffs_delta=args.min_cliffs_delta,
+    ))
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
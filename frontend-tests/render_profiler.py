@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+BURNWISE React Render Profiler
+Installs a stand-in React DevTools global hook before the bundle loads and walks every
+committed fiber tree: commits, renders and self render time per component, and renders
+whose props, state and context were all unchanged (wasted)
+Runs the scripted interactions plus Dashboard vs DashboardOptimized for a direct comparison
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime
+from typing import Dict, List
+
+from interactions import FRONTEND_URL, INTERACTIONS, login
+from results_store import record_report
+
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+# Development-only routes in App.js; neither dashboard is reachable otherwise
+DASHBOARD_VARIANTS = {
+    'dashboard': '/perf/dashboard',
+    'dashboard-optimized': '/perf/dashboard-optimized',
+}
+
+# A component is worth flagging once this many of its renders per run were wasted...
+WASTED_RENDERS_MIN = 10
+# ...and they were at least this share of everything it rendered
+WASTED_SHARE_MIN = 0.5
+
+# React reads the hook once when react-dom loads, so this has to run before any script.
+# Durations only exist in development/profiling builds; production reports counts only.
+RENDER_HOOK_JS = '''
+(() => {
+  const PERFORMED_WORK = 1;
+  // FunctionComponent, ClassComponent, ForwardRef, SimpleMemoComponent (MemoComponent renders via its child)
+  const COMPONENT_TAGS = new Set([0, 1, 11, 15]);
+  const stats = window.__burnwiseRenders = { commits: 0, commitMs: 0, components: {} };
+
+  const nameOf = fiber => {
+    const type = fiber.type;
+    if (!type) return 'Anonymous';
+    if (fiber.tag === 11) {
+      return type.displayName || (type.render && (type.render.displayName || type.render.name)) || 'ForwardRef';
+    }
+    return type.displayName || type.name || 'Anonymous';
+  };
+
+  const shallowEqual = (a, b) => {
+    if (Object.is(a, b)) return true;
+    if (!a || !b || typeof a !== 'object' || typeof b !== 'object') return false;
+    const keys = Object.keys(a);
+    return keys.length === Object.keys(b).length &&
+      keys.every(key => Object.prototype.hasOwnProperty.call(b, key) && Object.is(a[key], b[key]));
+  };
+
+  // Effect hooks get a fresh object every render, so they never count as a state change
+  const isEffect = value => value && typeof value === 'object' && 'create' in value && 'deps' in value;
+
+  const stateEqual = (fiber, prev) => {
+    if (fiber.tag === 1) return shallowEqual(fiber.memoizedState, prev.memoizedState);
+    let a = fiber.memoizedState, b = prev.memoizedState;
+    while (a && b) {
+      if (!isEffect(a.memoizedState) && !Object.is(a.memoizedState, b.memoizedState)) return false;
+      a = a.next;
+      b = b.next;
+    }
+    return !a && !b;
+  };
+
+  const contextEqual = (fiber, prev) => {
+    let a = fiber.dependencies && fiber.dependencies.firstContext;
+    let b = prev.dependencies && prev.dependencies.firstContext;
+    while (a && b) {
+      if (!Object.is(a.memoizedValue, b.memoizedValue)) return false;
+      a = a.next;
+      b = b.next;
+    }
+    return !a && !b;
+  };
+
+  const record = (fiber, prev) => {
+    const name = nameOf(fiber);
+    const entry = stats.components[name] || (stats.components[name] = { renders: 0, mounts: 0, wasted: 0, selfMs: 0 });
+    if (!prev) {
+      entry.mounts++;
+    } else {
+      entry.renders++;
+      if (shallowEqual(fiber.memoizedProps, prev.memoizedProps) && stateEqual(fiber, prev) && contextEqual(fiber, prev)) {
+        entry.wasted++;
+      }
+    }
+    if (typeof fiber.actualDuration === 'number') {
+      let self = fiber.actualDuration;
+      for (let child = fiber.child; child; child = child.sibling) self -= child.actualDuration || 0;
+      entry.selfMs += Math.max(0, self);
+    }
+  };
+
+  // A subtree whose child pointer is unchanged bailed out this commit; its flags are stale
+  const walk = fiber => {
+    for (let node = fiber; node; node = node.sibling) {
+      const prev = node.alternate;
+      if (COMPONENT_TAGS.has(node.tag) && (!prev || (node.flags & PERFORMED_WORK))) record(node, prev);
+      if (node.child && (!prev || node.child !== prev.child)) walk(node.child);
+    }
+  };
+
+  const onCommit = (rendererID, root) => {
+    stats.commits++;
+    if (typeof root.current.actualDuration === 'number') stats.commitMs += root.current.actualDuration;
+    try { walk(root.current); } catch (e) {}
+  };
+
+  const existing = window.__REACT_DEVTOOLS_GLOBAL_HOOK__;
+  if (existing) {
+    const original = existing.onCommitFiberRoot;
+    existing.onCommitFiberRoot = function (...args) {
+      onCommit(...args);
+      return original && original.apply(this, args);
+    };
+    return;
+  }
+  let nextID = 0;
+  window.__REACT_DEVTOOLS_GLOBAL_HOOK__ = {
+    renderers: new Map(),
+    supportsFiber: true,
+    inject(renderer) {
+      const id = ++nextID;
+      this.renderers.set(id, renderer);
+      return id;
+    },
+    checkDCE() {},
+    onScheduleFiberRoot() {},
+    onCommitFiberRoot: onCommit,
+    onCommitFiberUnmount() {},
+    onPostCommitFiberRoot() {},
+  };
+})();
+'''
+
+RESET_RENDERS_JS = '''() => {
+    const stats = window.__burnwiseRenders;
+    stats.commits = 0;
+    stats.commitMs = 0;
+    stats.components = {};
+}'''
+
+READ_RENDERS_JS = '() => window.__burnwiseRenders'
+
+
+class RenderAggregate:
+    """Render counts for one scenario summed over its runs"""
+
+    def __init__(self, name: str, route: str):
+        self.name = name
+        self.route = route
+        self.runs = 0
+        self.commits = 0
+        self.commit_ms = 0.0
+        self.components: Dict[str, Dict[str, float]] = {}
+
+    def add(self, stats: Dict):
+        self.runs += 1
+        self.commits += stats['commits']
+        self.commit_ms += stats['commitMs']
+        for name, entry in stats['components'].items():
+            total = self.components.setdefault(name, {'renders': 0, 'mounts': 0, 'wasted': 0, 'selfMs': 0.0})
+            for key in total:
+                total[key] += entry[key]
+
+    def per_run(self, value: float) -> float:
+        return round(value / self.runs, 2)
+
+    def summary(self) -> Dict:
+        renders = sum(c['renders'] for c in self.components.values())
+        wasted = sum(c['wasted'] for c in self.components.values())
+        return {
+            'runs': self.runs,
+            'commits_per_run': self.per_run(self.commits),
+            'commit_ms_per_run': self.per_run(self.commit_ms),
+            'renders_per_run': self.per_run(renders),
+            'mounts_per_run': self.per_run(sum(c['mounts'] for c in self.components.values())),
+            'wasted_per_run': self.per_run(wasted),
+            'wasted_pct': round(100 * wasted / renders, 1) if renders else 0.0,
+        }
+
+    def top_components(self, limit: int = 20) -> List[Dict]:
+        ranked = sorted(self.components.items(), key=lambda kv: (kv[1]['renders'], kv[1]['selfMs']), reverse=True)
+        return [
+            {
+                'component': name,
+                'renders_per_run': self.per_run(c['renders']),
+                'mounts_per_run': self.per_run(c['mounts']),
+                'wasted_per_run': self.per_run(c['wasted']),
+                'self_ms_per_run': self.per_run(c['selfMs']),
+            }
+            for name, c in ranked[:limit]
+        ]
+
+
+class RenderProfiler:
+    """Count React commits and renders per scripted interaction and dashboard variant"""
+
+    def __init__(self, interactions: List[str], variants: List[str], runs: int = 3, settle_ms: int = 2000,
+                 frontend: str = FRONTEND_URL):
+        self.interactions = [INTERACTIONS[name] for name in interactions]
+        self.variants = variants
+        self.runs = runs
+        self.settle_ms = settle_ms
+        self.frontend = frontend
+        self.aggregates: Dict[str, RenderAggregate] = {}
+        self.failures: List[str] = []
+        self.warnings: List[str] = []
+
+    async def run(self, headless: bool = False) -> Dict:
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            context = await browser.new_context(viewport=VIEWPORT)
+            await context.add_init_script(RENDER_HOOK_JS)
+            page = await context.new_page()
+            await login(page, self.frontend)
+
+            for interaction in self.interactions:
+                print(f"\n⚛️ COUNTING RENDERS {interaction.name} x{self.runs}...")
+                aggregate = self.aggregates[interaction.name] = RenderAggregate(interaction.name, interaction.route)
+                for run in range(self.runs):
+                    try:
+                        await interaction.prepare(page, self.frontend)
+                        await page.evaluate(RESET_RENDERS_JS)
+                        await interaction.run(page)
+                        await page.wait_for_timeout(500)  # Trailing commits from the last input
+                        aggregate.add(await page.evaluate(READ_RENDERS_JS))
+                    except Exception as e:
+                        self.failures.append(f"❌ {interaction.name} run {run}: {str(e)}")
+
+            # Navigation reinstalls the hook, so a variant's counts cover mount, first fetch and settle
+            for variant in self.variants:
+                route = DASHBOARD_VARIANTS[variant]
+                print(f"\n⚛️ COUNTING RENDERS {variant} ({route}) x{self.runs}...")
+                aggregate = self.aggregates[variant] = RenderAggregate(variant, route)
+                for run in range(self.runs):
+                    try:
+                        await page.goto(f'{self.frontend}{route}')
+                        await page.wait_for_load_state('networkidle')
+                        await page.wait_for_timeout(self.settle_ms)
+                        aggregate.add(await page.evaluate(READ_RENDERS_JS))
+                    except Exception as e:
+                        self.failures.append(f"❌ {variant} run {run}: {str(e)}")
+
+            await browser.close()
+
+        return self.generate_report()
+
+    def generate_report(self) -> Dict:
+        report = {'timestamp': datetime.now().isoformat(), 'scenarios': {}, 'failures': self.failures}
+
+        print("\n" + "=" * 80)
+        print("⚛️ REACT RENDER REPORT")
+        print("=" * 80)
+
+        for name, aggregate in self.aggregates.items():
+            if not aggregate.runs:
+                continue
+            summary = aggregate.summary()
+            components = aggregate.top_components()
+            report['scenarios'][name] = {'route': aggregate.route, **summary, 'top_components': components}
+
+            warnings = []
+            for entry in components:
+                share = entry['wasted_per_run'] / entry['renders_per_run'] if entry['renders_per_run'] else 0
+                if entry['wasted_per_run'] >= WASTED_RENDERS_MIN and share >= WASTED_SHARE_MIN:
+                    warnings.append(f"⚠️ {name}: {entry['component']} {entry['wasted_per_run']:.0f} wasted renders "
+                                    f"per run ({share:.0%} of its renders)")
+            self.warnings.extend(warnings)
+
+            print(f"\n📊 {name} ({aggregate.runs} runs): {summary['commits_per_run']:.0f} commits, "
+                  f"{summary['renders_per_run']:.0f} renders ({summary['wasted_pct']:.0f}% wasted), "
+                  f"{summary['commit_ms_per_run']:.1f}ms rendering per run")
+            for entry in components[:10]:
+                print(f"   {entry['renders_per_run']:7.1f} renders {entry['wasted_per_run']:7.1f} wasted "
+                      f"{entry['self_ms_per_run']:8.2f}ms  {entry['component']}")
+
+            record_report(
+                'react-renders',
+                {
+                    **{k: v for k, v in summary.items() if k != 'runs'},
+                    **{f"renders:{entry['component']}": entry['renders_per_run'] for entry in components},
+                },
+                warnings=warnings,
+                route=aggregate.route,
+                viewport=f"{VIEWPORT['width']}x{VIEWPORT['height']}",
+                profile=name,
+            )
+
+        variants = [report['scenarios'][v] for v in DASHBOARD_VARIANTS if v in report['scenarios']]
+        if len(variants) == 2:
+            base, optimized = variants
+            report['comparison'] = {
+                key: {'dashboard': base[key], 'dashboard-optimized': optimized[key]}
+                for key in ('commits_per_run', 'renders_per_run', 'wasted_per_run', 'commit_ms_per_run')
+            }
+            print("\n📊 Dashboard vs DashboardOptimized")
+            for key, values in report['comparison'].items():
+                print(f"   {key:<20} {values['dashboard']:>10.1f} {values['dashboard-optimized']:>10.1f}")
+
+        for line in self.warnings + self.failures:
+            print(f"   {line}")
+
+        report['warnings'] = self.warnings
+        with open('react-render-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to react-render-report.json")
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Count React renders per interaction')
+    parser.add_argument('--interaction', action='append', choices=sorted(INTERACTIONS),
+                        help='Interaction to count (repeatable, default: all)')
+    parser.add_argument('--variant', action='append', choices=sorted(DASHBOARD_VARIANTS),
+                        help='Dashboard variant to mount (repeatable, default: both)')
+    parser.add_argument('--no-variants', action='store_true', help='Only run the scripted interactions')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--settle-ms', type=int, default=2000, help='Idle time counted after a variant loads')
+    parser.add_argument('--frontend', default=FRONTEND_URL)
+    parser.add_argument('--headless', action='store_true')
+    args = parser.parse_args(argv)
+
+    variants = [] if args.no_variants else (args.variant or list(DASHBOARD_VARIANTS))
+    profiler = RenderProfiler(args.interaction or list(INTERACTIONS), variants, args.runs, args.settle_ms,
+                              args.frontend)
+    asyncio.run(profiler.run(headless=args.headless))
+    return 1 if profiler.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Audit Results Store
+EVERY run's metrics and findings in one local SQLite database
+Keyed by git SHA, route, viewport and profile - trend queries + first bad commit
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_DB = os.environ.get(
+    'BURNWISE_RESULTS_DB',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'audit-results.db'),
+)
+
+# Critical findings record_report saw in this process, so in-process callers (audit_cli) can fail on them
+REPORTED_CRITICAL: List[str] = []
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    suite TEXT NOT NULL,
+    git_sha TEXT NOT NULL,
+    commit_time INTEGER,
+    route TEXT NOT NULL DEFAULT '',
+    viewport TEXT NOT NULL DEFAULT '',
+    profile TEXT NOT NULL DEFAULT 'default',
+    started_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    severity TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_key_time ON runs(suite, route, viewport, profile, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_sha ON runs(git_sha);
+CREATE INDEX IF NOT EXISTS idx_metrics_name_run ON metrics(name, run_id, value);
+CREATE INDEX IF NOT EXISTS idx_findings_run ON findings(run_id, severity);
+'''
+
+
+def _git(*args) -> str:
+    try:
+        result = subprocess.run(['git', *args], capture_output=True, text=True, timeout=10)
+        return result.stdout.strip() if result.returncode == 0 else ''
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def current_commit() -> Tuple[str, Optional[int]]:
+    """(sha, commit unix time) of HEAD; a dirty tree gets a '-dirty' suffix"""
+    sha = os.environ.get('BURNWISE_GIT_SHA') or _git('rev-parse', 'HEAD') or 'unknown'
+    commit_time = _git('show', '-s', '--format=%ct', sha) if sha != 'unknown' else ''
+    if 'BURNWISE_GIT_SHA' not in os.environ and _git('status', '--porcelain', '--untracked-files=no'):
+        sha += '-dirty'
+    return sha, int(commit_time) if commit_time.isdigit() else None
+
+
+class ResultsStore:
+    """Thin wrapper around the SQLite file - one connection per store"""
+
+    def __init__(self, path: str = DEFAULT_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record_run(self, suite: str, metrics: Dict[str, float],
+                   findings: Iterable[Tuple[str, str]] = (), route: str = '',
+                   viewport: str = '', profile: str = 'default',
+                   git_sha: Optional[str] = None) -> int:
+        """Store one run; findings are (severity, message) pairs"""
+        commit_time = None
+        if git_sha is None:
+            git_sha, commit_time = current_commit()
+
+        with self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO runs (suite, git_sha, commit_time, route, viewport, profile, started_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (suite, git_sha, commit_time, route, viewport, profile, datetime.now().isoformat()),
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                'INSERT INTO metrics (run_id, name, value) VALUES (?, ?, ?)',
+                [(run_id, name, float(value)) for name, value in metrics.items()
+                 if isinstance(value, (int, float)) and not isinstance(value, bool)],
+            )
+            self.conn.executemany(
+                'INSERT INTO findings (run_id, severity, message) VALUES (?, ?, ?)',
+                [(run_id, severity, message) for severity, message in findings],
+            )
+        return run_id
+
+    def _filters(self, suite, route, viewport, profile) -> Tuple[str, List]:
+        clauses, params = [], []
+        for column, value in (('suite', suite), ('route', route), ('viewport', viewport), ('profile', profile)):
+            if value is not None:
+                clauses.append(f'r.{column} = ?')
+                params.append(value)
+        return (' AND ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def trend(self, metric: str, suite: str = None, route: str = None, viewport: str = None,
+              profile: str = None, limit: int = 50) -> List[Dict]:
+        """Latest `limit` values of one metric, oldest first"""
+        where, params = self._filters(suite, route, viewport, profile)
+        rows = self.conn.execute(
+            'SELECT r.started_at, r.git_sha, r.suite, r.route, r.viewport, r.profile, m.value '
+            'FROM metrics m JOIN runs r ON r.id = m.run_id '
+            f'WHERE m.name = ?{where} ORDER BY r.started_at DESC LIMIT ?',
+            [metric, *params, limit],
+        ).fetchall()
+        keys = ('started_at', 'git_sha', 'suite', 'route', 'viewport', 'profile', 'value')
+        return [dict(zip(keys, row)) for row in reversed(rows)]
+
+    def latest_runs(self, suite: str = None, limit: int = 20) -> List[Dict]:
+        """Most recent runs with their finding counts, newest first"""
+        where, params = self._filters(suite, None, None, None)
+        rows = self.conn.execute(
+            'SELECT r.id, r.suite, r.git_sha, r.route, r.viewport, r.profile, r.started_at, '
+            "(SELECT COUNT(*) FROM findings f WHERE f.run_id = r.id AND f.severity = 'critical'), "
+            "(SELECT COUNT(*) FROM findings f WHERE f.run_id = r.id AND f.severity = 'warning') "
+            f'FROM runs r WHERE 1 = 1{where} ORDER BY r.started_at DESC LIMIT ?',
+            [*params, limit],
+        ).fetchall()
+        keys = ('id', 'suite', 'git_sha', 'route', 'viewport', 'profile', 'started_at', 'critical', 'warnings')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def values_by_commit(self, metric: str, suite: str = None, route: str = None,
+                         viewport: str = None, profile: str = None) -> Dict[str, List[float]]:
+        where, params = self._filters(suite, route, viewport, profile)
+        by_commit: Dict[str, List[float]] = {}
+        for sha, value in self.conn.execute(
+            'SELECT r.git_sha, m.value FROM metrics m JOIN runs r ON r.id = m.run_id '
+            f'WHERE m.name = ?{where} ORDER BY r.started_at',
+            [metric, *params],
+        ):
+            by_commit.setdefault(sha, []).append(value)
+        return by_commit
+
+    def metric_names(self, suite: str = None) -> List[str]:
+        query = 'SELECT DISTINCT m.name FROM metrics m'
+        params = []
+        if suite:
+            query += ' JOIN runs r ON r.id = m.run_id WHERE r.suite = ?'
+            params.append(suite)
+        return [row[0] for row in self.conn.execute(query + ' ORDER BY m.name', params)]
+
+    def commit_order(self, shas: Iterable[str]) -> List[str]:
+        """Order recorded SHAs by first-parent history, unknown ones by commit time"""
+        shas = set(shas)
+        history = _git('rev-list', '--first-parent', '--reverse', 'HEAD').split()
+        base = {sha.replace('-dirty', '') for sha in shas}
+        ordered = [sha for sha in history if sha in base]
+
+        position = {sha: i for i, sha in enumerate(ordered)}
+        commit_times = dict(self.conn.execute(
+            'SELECT git_sha, MIN(commit_time) FROM runs GROUP BY git_sha'
+        ).fetchall())
+
+        def key(sha):
+            clean = sha.replace('-dirty', '')
+            # Dirty runs sort right after their base commit
+            return (position.get(clean, len(position)), commit_times.get(sha) or 0, sha.endswith('-dirty'))
+
+        return sorted(shas, key=key)
+
+    def first_bad_commit(self, metric: str, threshold: float = None, regression_pct: float = 10.0,
+                         lower_is_worse: bool = False, **filters) -> Optional[Dict]:
+        """First commit whose median crosses `threshold`, or regresses vs. all earlier commits"""
+        by_commit = self.values_by_commit(metric, **filters)
+        history = []
+        for sha in self.commit_order(by_commit):
+            median = statistics.median(by_commit[sha])
+            if threshold is not None:
+                bad = median < threshold if lower_is_worse else median > threshold
+                reference = threshold
+            elif history:
+                reference = statistics.median(history)
+                change = (median - reference) / abs(reference) * 100 if reference else 0.0
+                bad = change < -regression_pct if lower_is_worse else change > regression_pct
+            else:
+                bad, reference = False, None
+            if bad:
+                return {
+                    'git_sha': sha,
+                    'median': median,
+                    'samples': len(by_commit[sha]),
+                    'reference': reference,
+                    'good_commits_before': len(history) if threshold is None else None,
+                }
+            history.append(median)
+        return None
+
+
+def record_report(suite: str, metrics: Dict[str, float], critical: Iterable[str] = (),
+                  warnings: Iterable[str] = (), **run_key):
+    """Convenience for the auditors: never let the store break an audit run"""
+    critical = list(critical)
+    REPORTED_CRITICAL.extend(critical)
+    try:
+        with ResultsStore() as store:
+            findings = [('critical', m) for m in critical] + [('warning', m) for m in warnings]
+            run_id = store.record_run(suite, metrics, findings, **run_key)
+        print(f"🗄️  Run #{run_id} recorded in {DEFAULT_DB}")
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not record run in results store: {str(e)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Query the audit results store')
+    parser.add_argument('--db', default=DEFAULT_DB)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def add_key_args(p):
+        p.add_argument('--suite')
+        p.add_argument('--route')
+        p.add_argument('--viewport')
+        p.add_argument('--profile')
+
+    p_runs = sub.add_parser('runs', help='List the latest recorded runs')
+    p_runs.add_argument('--suite')
+    p_runs.add_argument('--limit', type=int, default=20)
+
+    p_metrics = sub.add_parser('metrics', help='List recorded metric names')
+    p_metrics.add_argument('--suite')
+
+    p_trend = sub.add_parser('trend', help='Show a metric over time')
+    p_trend.add_argument('metric')
+    p_trend.add_argument('--limit', type=int, default=30)
+    add_key_args(p_trend)
+
+    p_bad = sub.add_parser('first-bad', help='Find the first commit that regressed a metric')
+    p_bad.add_argument('metric')
+    p_bad.add_argument('--threshold', type=float)
+    p_bad.add_argument('--regression-pct', type=float, default=10.0)
+    p_bad.add_argument('--lower-is-worse', action='store_true', help='e.g. fps')
+    add_key_args(p_bad)
+
+    args = parser.parse_args(argv)
+    filters = {k: getattr(args, k, None) for k in ('suite', 'route', 'viewport', 'profile')}
+
+    with ResultsStore(args.db) as store:
+        if args.command == 'runs':
+            for run in store.latest_runs(args.suite, args.limit):
+                print(f"#{run['id']:<5} {run['started_at'][:19]}  {run['suite']:<16} {run['git_sha'][:10]:<16} "
+                      f"{run['route'] or '-':<20} {run['viewport'] or '-':<10} {run['profile']:<12} "
+                      f"🔴 {run['critical']:<4} 🟡 {run['warnings']}")
+
+        elif args.command == 'metrics':
+            for name in store.metric_names(args.suite):
+                print(name)
+
+        elif args.command == 'trend':
+            rows = store.trend(args.metric, limit=args.limit, **filters)
+            if not rows:
+                print(f"No values recorded for {args.metric}")
+                return 1
+            values = [row['value'] for row in rows]
+            low, high = min(values), max(values)
+            for row in rows:
+                bar = '█' * (1 + int(29 * (row['value'] - low) / (high - low))) if high > low else '█'
+                print(f"{row['started_at'][:19]}  {row['git_sha'][:10]:<16} {row['value']:>12.2f}  {bar}")
+
+        elif args.command == 'first-bad':
+            result = store.first_bad_commit(
+                args.metric, args.threshold, args.regression_pct, args.lower_is_worse, **filters
+            )
+            if not result:
+                print(f"✅ No regression found for {args.metric}")
+                return 0
+            print(f"❌ First bad commit for {args.metric}: {result['git_sha']}")
+            print(f"   median {result['median']:.2f} over {result['samples']} samples "
+                  f"(reference {result['reference']})")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Timeline Scrub Smoothness Benchmark
+Drags .timeline-current across the whole track and back at several speeds with raw CDP
+mouse events, then reports dropped frames, input-to-paint lag, backend calls per step
+and forced layouts - flagging uncached /api/schedule/timeline fetches and layout thrash
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List
+from urllib.parse import urlparse
+
+from bench_common import percentile
+from interactions import BACKEND_URL, FRONTEND_URL, login
+from results_store import record_report
+from trace_events import REFLOW_CATEGORIES, Trace
+
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+# Mouse moves per direction and delay between them
+SPEEDS = {
+    'slow': (120, 16),
+    'medium': (60, 8),
+    'fast': (20, 0),
+}
+
+FRAME_MS = 1000 / 60
+TIMELINE_API = '/api/schedule/timeline'
+
+DROPPED_FRAMES_PCT_MAX = 10
+# More synchronous layouts than this per frame is layout thrash
+FORCED_LAYOUTS_PER_FRAME_MAX = 1
+
+# rAF loop for frames; each pointermove's lag is taken at the first task after the next frame
+START_SCRUB_JS = '''() => {
+    const state = window.__burnwiseScrub = { frames: [], lags: [], running: true, pending: false };
+    const tick = now => { state.frames.push(now); if (state.running) requestAnimationFrame(tick); };
+    requestAnimationFrame(tick);
+    state.onMove = event => {
+        if (state.pending) return;
+        state.pending = true;
+        const stamp = event.timeStamp;
+        requestAnimationFrame(() => setTimeout(() => {
+            state.lags.push(performance.now() - stamp);
+            state.pending = false;
+        }, 0));
+    };
+    window.addEventListener('pointermove', state.onMove, true);
+}'''
+
+STOP_SCRUB_JS = '''async () => {
+    const state = window.__burnwiseScrub;
+    await new Promise(resolve => setTimeout(resolve, 100));
+    state.running = false;
+    window.removeEventListener('pointermove', state.onMove, true);
+    return { frames: state.frames, lags: state.lags };
+}'''
+
+
+def dropped_frames(frames: List[float]) -> int:
+    """Frames a 60Hz display should have shown between consecutive rAF callbacks but didn't"""
+    return sum(max(0, round((b - a) / FRAME_MS) - 1) for a, b in zip(frames, frames[1:]))
+
+
+class NetworkWatch:
+    """Backend requests seen over CDP while a scrub runs, with browser-cache hits marked"""
+
+    def __init__(self, client, backend: str):
+        self.backend = backend
+        self.requests: Dict[str, Dict] = {}
+        self.active = False
+        client.on('Network.requestWillBeSent', self._sent)
+        client.on('Network.requestServedFromCache', self._served_from_cache)
+        client.on('Network.responseReceived', self._response)
+
+    def _sent(self, event):
+        if self.active and event['request']['url'].startswith(self.backend):
+            self.requests[event['requestId']] = {'path': urlparse(event['request']['url']).path, 'cached': False}
+
+    def _served_from_cache(self, event):
+        if event['requestId'] in self.requests:
+            self.requests[event['requestId']]['cached'] = True
+
+    def _response(self, event):
+        request = self.requests.get(event['requestId'])
+        if request is None:
+            return
+        response = event['response']
+        request['status'] = response['status']
+        request['cache_control'] = {k.lower(): v for k, v in response.get('headers', {}).items()}.get('cache-control')
+        if response.get('fromDiskCache') or response.get('fromServiceWorker') or response.get('fromPrefetchCache'):
+            request['cached'] = True
+
+    def start(self):
+        self.requests = {}
+        self.active = True
+
+    def stop(self) -> List[Dict]:
+        self.active = False
+        return list(self.requests.values())
+
+
+class ScrubBenchmark:
+    """Scrub the timeline at each speed and measure what it costs"""
+
+    def __init__(self, speeds=tuple(SPEEDS), runs: int = 3, frontend: str = FRONTEND_URL,
+                 backend: str = BACKEND_URL):
+        self.speeds = speeds
+        self.runs = runs
+        self.frontend = frontend
+        self.backend = backend
+        self.samples: Dict[str, List[Dict]] = {speed: [] for speed in speeds}
+        self.results: Dict[str, Dict] = {}
+        self.critical: List[str] = []
+        self.warnings: List[str] = []
+
+    async def drag(self, client, page, steps: int, delay_ms: int):
+        track = await page.locator('.timeline-track').bounding_box()
+        handle = await page.locator('.timeline-current').bounding_box()
+        y = handle['y'] + handle['height'] / 2
+        left, right = track['x'] + 1, track['x'] + track['width'] - 1
+        path = [handle['x'] + handle['width'] / 2 + (right - handle['x'] - handle['width'] / 2) * i / steps
+                for i in range(1, steps + 1)]
+        path += [right + (left - right) * i / steps for i in range(1, steps + 1)]
+
+        async def mouse(kind, x, **extra):
+            await client.send('Input.dispatchMouseEvent', {'type': kind, 'x': x, 'y': y, 'button': 'left', **extra})
+
+        await mouse('mouseMoved', handle['x'] + handle['width'] / 2, buttons=0)
+        await mouse('mousePressed', handle['x'] + handle['width'] / 2, buttons=1, clickCount=1)
+        for x in path:
+            await mouse('mouseMoved', x, buttons=1)
+            if delay_ms:
+                await asyncio.sleep(delay_ms / 1000)
+        await mouse('mouseReleased', path[-1], buttons=0, clickCount=1)
+        return len(path)
+
+    async def sample(self, browser, client, page, network: NetworkWatch, speed: str) -> Dict:
+        steps, delay_ms = SPEEDS[speed]
+        await page.evaluate(START_SCRUB_JS)
+        network.start()
+        await browser.start_tracing(page=page, categories=REFLOW_CATEGORIES)
+        try:
+            moves = await self.drag(client, page, steps, delay_ms)
+            scrub = await page.evaluate(STOP_SCRUB_JS)
+        finally:
+            trace = Trace.from_bytes(await browser.stop_tracing())
+            requests = network.stop()
+
+        frames, lags = scrub['frames'], scrub['lags']
+        frame_count = max(1, len(frames) - 1)
+        dropped = dropped_frames(frames)
+        layouts = trace.complete_events({'Layout'}, threads=trace.renderer_main())
+        forced = trace.forced_layouts()
+        timeline = [r for r in requests if r['path'].startswith(TIMELINE_API)]
+        return {
+            'moves': moves,
+            'frames': frame_count,
+            'dropped_frames': dropped,
+            'dropped_pct': round(100 * dropped / (frame_count + dropped), 1),
+            'lag_ms_p50': round(percentile(lags, 50), 1) if lags else None,
+            'lag_ms_p95': round(percentile(lags, 95), 1) if lags else None,
+            'lag_ms_max': round(max(lags), 1) if lags else None,
+            'api_calls': len(requests),
+            'api_calls_per_step': round(len(requests) / moves, 3),
+            'api_paths': dict(Counter(r['path'] for r in requests)),
+            'timeline_requests': len(timeline),
+            'uncached_timeline_requests': sum(not r['cached'] for r in timeline),
+            'timeline_cache_control': sorted({r.get('cache_control') or 'none' for r in timeline}),
+            'layouts': len(layouts),
+            'forced_layouts': len(forced),
+            'forced_layouts_per_frame': round(len(forced) / frame_count, 2),
+            'phases_ms': trace.phase_ms(),
+        }
+
+    async def run(self, headless: bool = False) -> Dict:
+        from playwright.async_api import async_playwright
+
+        print("🎞️ BURNWISE TIMELINE SCRUB BENCHMARK")
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            context = await browser.new_context(viewport=VIEWPORT)
+            page = await context.new_page()
+            await login(page, self.frontend)
+            await page.wait_for_selector('.timeline-current', timeout=15000)
+
+            client = await context.new_cdp_session(page)
+            await client.send('Network.enable')
+            network = NetworkWatch(client, self.backend)
+
+            for speed in self.speeds:
+                steps, delay_ms = SPEEDS[speed]
+                print(f"   {speed}: {steps} moves each way, {delay_ms}ms apart, x{self.runs}")
+                for run in range(self.runs):
+                    try:
+                        self.samples[speed].append(await self.sample(browser, client, page, network, speed))
+                    except Exception as e:
+                        self.warnings.append(f"⚠️ {speed}: run {run} failed - {str(e).splitlines()[0]}")
+                    await page.wait_for_timeout(500)
+                if self.samples[speed]:
+                    self.results[speed] = self.aggregate(speed, self.samples[speed])
+
+            await client.detach()
+            await browser.close()
+
+        self.print_report()
+        self.save()
+        return self.results
+
+    def aggregate(self, speed: str, samples: List[Dict]) -> Dict:
+        def mean(key):
+            values = [s[key] for s in samples if s[key] is not None]
+            return round(sum(values) / len(values), 2) if values else None
+
+        result = {key: mean(key) for key in (
+            'frames', 'dropped_frames', 'dropped_pct', 'lag_ms_p50', 'lag_ms_p95', 'lag_ms_max', 'api_calls',
+            'api_calls_per_step', 'timeline_requests', 'uncached_timeline_requests', 'layouts',
+            'forced_layouts', 'forced_layouts_per_frame',
+        )}
+        result['runs'] = len(samples)
+        result['phases_ms'] = {
+            phase: round(sum(s['phases_ms'][phase] for s in samples) / len(samples), 2)
+            for phase in samples[0]['phases_ms']
+        }
+
+        uncached = sum(s['uncached_timeline_requests'] for s in samples)
+        if uncached:
+            policies = sorted({c for s in samples for c in s['timeline_cache_control']})
+            self.critical.append(f"❌ {speed}: {uncached} uncached {TIMELINE_API} requests while scrubbing "
+                                 f"(Cache-Control: {', '.join(policies)})")
+        if result['forced_layouts_per_frame'] > FORCED_LAYOUTS_PER_FRAME_MAX:
+            self.warnings.append(f"⚠️ {speed}: layout thrash - {result['forced_layouts_per_frame']:.1f} "
+                                 f"forced layouts per frame")
+        if result['dropped_pct'] > DROPPED_FRAMES_PCT_MAX:
+            self.warnings.append(f"⚠️ {speed}: {result['dropped_pct']:.0f}% of frames dropped")
+        return result
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        print(f"{'speed':<8} {'dropped':>8} {'lag p95':>8} {'api/step':>9} {'timeline':>9} {'forced/frame':>13}")
+        for speed, r in self.results.items():
+            lag = f"{r['lag_ms_p95']:.0f}ms" if r['lag_ms_p95'] is not None else '-'
+            print(f"{speed:<8} {r['dropped_pct']:>7.1f}% {lag:>8} {r['api_calls_per_step']:>9.2f} "
+                  f"{r['timeline_requests']:>9.1f} {r['forced_layouts_per_frame']:>13.2f}")
+        for line in self.critical + self.warnings:
+            print(f"   {line}")
+
+    def save(self):
+        for speed, result in self.results.items():
+            metrics = {k: v for k, v in result.items() if isinstance(v, (int, float))}
+            metrics.update({f'{phase}_ms': v for phase, v in result['phases_ms'].items()})
+            prefix = f"{speed}:"
+            record_report('timeline-scrub', metrics,
+                          critical=[m for m in self.critical if prefix in m],
+                          warnings=[m for m in self.warnings if prefix in m],
+                          route='/spatial', viewport=f"{VIEWPORT['width']}x{VIEWPORT['height']}", profile=speed)
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'speeds': {speed: {'moves_per_direction': SPEEDS[speed][0], 'delay_ms': SPEEDS[speed][1]}
+                       for speed in self.speeds},
+            'results': self.results,
+            'samples': self.samples,
+            'critical': self.critical,
+            'warnings': self.warnings,
+        }
+        with open('timeline-scrub-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to timeline-scrub-report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Timeline scrubber drag smoothness')
+    parser.add_argument('--speed', action='append', choices=sorted(SPEEDS), help='Drag speed (repeatable, default: all)')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--frontend', default=FRONTEND_URL)
+    parser.add_argument('--backend', default=BACKEND_URL)
+    parser.add_argument('--headless', action='store_true')
+    args = parser.parse_args(argv)
+
+    bench = ScrubBenchmark(tuple(args.speed or SPEEDS), args.runs, args.frontend, args.backend)
+    asyncio.run(bench.run(args.headless))
+    return 1 if bench.critical else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
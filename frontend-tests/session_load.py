@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Multi-User Session Load
+Many headless browser contexts at once, each a farm planner: log in, open /spatial,
+scrub the timeline, submit a burn request, chat with the agent
+Ramps through concurrency levels and reports client time-to-interactive next to the
+backend throughput those same browsers saw, so the degradation curve has both sides
+
+Every persona signs in with the test account - run the backend with RATE_LIMIT_MAX raised,
+or the limiter keys all of them to one user and the 429s become the result
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from agent_bench import CHAT_PROMPTS
+from bench_common import SWIFTSHADER_ARGS, percentile
+from interactions import BACKEND_URL, FRONTEND_URL, chat_with_agent, login, timeline_scrub
+from pipeline_bench import synthetic_request
+from results_store import record_report
+
+LEVELS = (1, 5, 10, 20)
+STEPS = ('scrub', 'burn-request', 'chat')
+VIEWPORT = {'width': 1440, 'height': 900}
+
+# Long tasks from the first byte, so TTI can be read back after the page settles
+LONG_TASK_OBSERVER_JS = '''
+window.__burnwiseLongTasks = [];
+try {
+  new PerformanceObserver(list => {
+    for (const entry of list.getEntries()) {
+      window.__burnwiseLongTasks.push([entry.startTime, entry.startTime + entry.duration]);
+    }
+  }).observe({ type: 'longtask', buffered: true });
+} catch (e) {}
+'''
+
+# TTI: the ready selector is visible and the main thread has had a quiet window since the last long task
+TIME_TO_INTERACTIVE_JS = '''async ([quietMs, timeoutMs]) => {
+    const ready = performance.now();
+    const tasks = window.__burnwiseLongTasks || [];
+    const lastEnd = () => tasks.length ? tasks[tasks.length - 1][1] : 0;
+    while (performance.now() - Math.max(ready, lastEnd()) < quietMs && performance.now() - ready < timeoutMs) {
+        await new Promise(resolve => setTimeout(resolve, 100));
+    }
+    const paint = performance.getEntriesByName('first-contentful-paint')[0];
+    return {
+        ready_ms: ready,
+        tti_ms: Math.max(ready, lastEnd()),
+        fcp_ms: paint ? paint.startTime : null,
+        long_tasks: tasks.length,
+        blocking_ms: tasks.reduce((sum, [start, end]) => sum + Math.max(0, end - start - 50), 0),
+    };
+}'''
+
+
+@dataclass
+class PersonaRun:
+    user: int
+    level: int
+    started: float
+    login_ms: Optional[float] = None
+    tti_ms: Optional[float] = None
+    fcp_ms: Optional[float] = None
+    blocking_ms: Optional[float] = None
+    scrub_ms: Optional[float] = None
+    burn_request_ms: Optional[float] = None
+    burn_request_status: Optional[int] = None
+    chat_ms: Optional[float] = None
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def completed(self) -> bool:
+        return not self.errors
+
+
+class NetworkLog:
+    """Backend responses every context in a level saw"""
+
+    def __init__(self, backend: str):
+        self.backend = backend
+        self.latency_ms: List[float] = []
+        self.statuses: Dict[int, int] = defaultdict(int)
+
+    def attach(self, context):
+        context.on('response', self._response)
+        context.on('requestfinished', self._finished)
+
+    def _response(self, response):
+        if response.url.startswith(self.backend):
+            self.statuses[response.status] += 1
+
+    def _finished(self, request):
+        if request.url.startswith(self.backend) and request.timing.get('responseEnd', -1) >= 0:
+            self.latency_ms.append(request.timing['responseEnd'])
+
+
+class SessionLoad:
+    """Ramp concurrent persona sessions and measure both ends"""
+
+    def __init__(self, levels=LEVELS, steps=STEPS, ramp_s: float = 10, quiet_ms: float = 1000,
+                 chat_timeout_s: float = 60, frontend: str = FRONTEND_URL, backend: str = BACKEND_URL,
+                 degrade_factor: float = 2.0, seed: int = 0):
+        self.levels = levels
+        self.steps = steps
+        self.ramp_s = ramp_s
+        self.quiet_ms = quiet_ms
+        self.chat_timeout_s = chat_timeout_s
+        self.frontend = frontend
+        self.backend = backend
+        self.degrade_factor = degrade_factor
+        self.rng = random.Random(seed)
+        self.runs: List[PersonaRun] = []
+        self.results: Dict[int, Dict] = {}
+        self.critical: List[str] = []
+        self.warnings: List[str] = []
+
+    async def persona(self, browser, run: PersonaRun, network: NetworkLog, delay_s: float):
+        await asyncio.sleep(delay_s)
+        context = await browser.new_context(viewport=VIEWPORT)
+        network.attach(context)
+        await context.add_init_script(LONG_TASK_OBSERVER_JS)
+        page = await context.new_page()
+        step = 'login'
+        try:
+            start = time.perf_counter()
+            await login(page, self.frontend)
+            run.login_ms = (time.perf_counter() - start) * 1000
+
+            step = 'spatial'
+            await page.goto(f'{self.frontend}/spatial')
+            await page.wait_for_selector('.dock-icon', timeout=30000)
+            tti = await page.evaluate(TIME_TO_INTERACTIVE_JS, [self.quiet_ms, 30000])
+            run.tti_ms, run.fcp_ms, run.blocking_ms = tti['tti_ms'], tti['fcp_ms'], tti['blocking_ms']
+
+            if 'scrub' in self.steps:
+                step = 'scrub'
+                await page.wait_for_selector('.timeline-current', timeout=15000)
+                start = time.perf_counter()
+                await timeline_scrub(page)
+                run.scrub_ms = (time.perf_counter() - start) * 1000
+
+            if 'burn-request' in self.steps:
+                # /spatial has no request form - the UI submits through the agent or this endpoint
+                step = 'burn-request'
+                payload = synthetic_request(self.rng.randint(1, 3), run.user, self.rng, days_ahead=3)
+                start = time.perf_counter()
+                response = await page.request.post(f'{self.backend}/api/burn-requests', data=payload,
+                                                   timeout=120000)
+                run.burn_request_ms = (time.perf_counter() - start) * 1000
+                run.burn_request_status = response.status
+                if response.status >= 400:
+                    run.errors.append(f'burn-request: HTTP {response.status}')
+
+            if 'chat' in self.steps:
+                step = 'chat'
+                start = time.perf_counter()
+                await chat_with_agent(page, self.rng.choice(CHAT_PROMPTS), int(self.chat_timeout_s * 1000))
+                run.chat_ms = (time.perf_counter() - start) * 1000
+        except Exception as e:
+            run.errors.append(f'{step}: {str(e).splitlines()[0]}')
+        finally:
+            await context.close()
+
+    async def run_level(self, browser, users: int) -> Dict:
+        network = NetworkLog(self.backend)
+        start = time.perf_counter()
+        runs = [PersonaRun(len(self.runs) + i, users, start) for i in range(users)]
+        self.runs.extend(runs)
+        # Stagger arrivals across the ramp so a level is a crowd, not a single instant
+        await asyncio.gather(*[
+            self.persona(browser, run, network, self.ramp_s * i / users) for i, run in enumerate(runs)
+        ])
+        elapsed = time.perf_counter() - start
+
+        def dist(values: List[Optional[float]], name: str) -> Dict[str, float]:
+            values = [v for v in values if v is not None]
+            if not values:
+                return {}
+            return {f'{name}_p50': round(percentile(values, 50), 1), f'{name}_p95': round(percentile(values, 95), 1)}
+
+        finished = sum(network.statuses.values())
+        return {
+            'users': users,
+            'completed': sum(r.completed for r in runs),
+            'elapsed_s': round(elapsed, 1),
+            **dist([r.tti_ms for r in runs], 'tti_ms'),
+            **dist([r.fcp_ms for r in runs], 'fcp_ms'),
+            **dist([r.blocking_ms for r in runs], 'blocking_ms'),
+            **dist([r.login_ms for r in runs], 'login_ms'),
+            **dist([r.scrub_ms for r in runs], 'scrub_ms'),
+            **dist([r.burn_request_ms for r in runs], 'burn_request_ms'),
+            **dist([r.chat_ms for r in runs], 'chat_ms'),
+            'api_responses': finished,
+            'api_rps': round(finished / elapsed, 2),
+            **dist(network.latency_ms, 'api_ms'),
+            'api_server_errors': sum(n for status, n in network.statuses.items() if status >= 500),
+            'api_rate_limited': network.statuses.get(429, 0),
+            'errors': [f'user {r.user}: {e}' for r in runs for e in r.errors],
+        }
+
+    async def run(self, headed: bool = False) -> Dict:
+        from playwright.async_api import async_playwright
+
+        print("👥 BURNWISE MULTI-USER SESSION LOAD")
+        print(f"   Levels {list(self.levels)} users, steps {list(self.steps)}, {self.ramp_s:.0f}s ramp per level")
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=not headed, args=SWIFTSHADER_ARGS)
+            for users in self.levels:
+                self.results[users] = result = await self.run_level(browser, users)
+                print(f"   {users:>4} users: {result['completed']}/{users} completed, "
+                      f"TTI p50 {result.get('tti_ms_p50', 0):>7.0f}ms p95 {result.get('tti_ms_p95', 0):>7.0f}ms, "
+                      f"API {result['api_rps']:>6.1f} req/s p95 {result.get('api_ms_p95', 0):>6.0f}ms, "
+                      f"{result['api_rate_limited']} rate-limited")
+                if not result['completed']:
+                    self.critical.append(f"❌ {users} users: no persona completed")
+                    break
+            await browser.close()
+        self.assess()
+        self.print_report()
+        self.save()
+        return self.results
+
+    def assess(self):
+        base = self.results.get(min(self.results)) if self.results else None
+        for users, result in self.results.items():
+            if result['api_rate_limited']:
+                self.warnings.append(f"⚠️ {users} users: {result['api_rate_limited']} responses rate-limited "
+                                     f"- raise RATE_LIMIT_MAX")
+            if result['api_server_errors']:
+                self.warnings.append(f"⚠️ {users} users: {result['api_server_errors']} backend 5xx responses")
+            failed = users - result['completed']
+            if failed and result['completed']:
+                self.warnings.append(f"⚠️ {users} users: {failed} persona(s) failed")
+            if base and users != base['users'] and base.get('tti_ms_p95') and result.get('tti_ms_p95'):
+                factor = result['tti_ms_p95'] / base['tti_ms_p95']
+                result['tti_degradation'] = round(factor, 2)
+                if factor > self.degrade_factor:
+                    self.warnings.append(f"⚠️ {users} users: TTI p95 {factor:.1f}x the {base['users']}-user level")
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        for users, result in self.results.items():
+            steps = ', '.join(f"{name} {result[f'{key}_p95']:.0f}ms" for name, key in
+                              (('login', 'login_ms'), ('scrub', 'scrub_ms'), ('burn request', 'burn_request_ms'),
+                               ('chat', 'chat_ms')) if f'{key}_p95' in result)
+            print(f"{users:>4} users p95: {steps}")
+        for line in self.critical + self.warnings:
+            print(f"   {line}")
+
+    def save(self):
+        for users, result in self.results.items():
+            metrics = {k: v for k, v in result.items() if isinstance(v, (int, float)) and not isinstance(v, bool)}
+            prefix = f"{users} users:"
+            record_report('multi-user', metrics,
+                          critical=[m for m in self.critical if prefix in m],
+                          warnings=[m for m in self.warnings if prefix in m],
+                          route='/spatial', viewport=f"{VIEWPORT['width']}x{VIEWPORT['height']}",
+                          profile=f'u{users}')
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'frontend': self.frontend,
+            'backend': self.backend,
+            'steps': list(self.steps),
+            'ramp_s': self.ramp_s,
+            'levels': self.results,
+            'personas': [asdict(r) for r in self.runs],
+            'critical': self.critical,
+            'warnings': self.warnings,
+        }
+        with open('multi-user-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to multi-user-report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Concurrent persona sessions in browser contexts')
+    parser.add_argument('--levels', type=int, nargs='+', default=list(LEVELS), help='Concurrent users per stage')
+    parser.add_argument('--steps', nargs='+', choices=STEPS, default=list(STEPS),
+                        help='Persona steps after login and /spatial')
+    parser.add_argument('--ramp', type=float, default=10, help='Seconds over which a level\'s users arrive')
+    parser.add_argument('--quiet-ms', type=float, default=1000, help='Long-task-free window that marks TTI')
+    parser.add_argument('--chat-timeout', type=float, default=60)
+    parser.add_argument('--frontend', default=FRONTEND_URL)
+    parser.add_argument('--backend', default=BACKEND_URL)
+    parser.add_argument('--degrade-factor', type=float, default=2.0, help='TTI p95 growth that gets flagged')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--headed', action='store_true')
+    args = parser.parse_args(argv)
+
+    load = SessionLoad(sorted(args.levels), args.steps, args.ramp, args.quiet_ms, args.chat_timeout,
+                       args.frontend, args.backend, args.degrade_factor, args.seed)
+    asyncio.run(load.run(args.headed))
+    return 1 if load.critical else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
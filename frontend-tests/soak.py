@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Soak Sampler
+Keeps one /spatial session open for as long as asked while it replays scripted interactions,
+streaming heap, DOM nodes, listeners, open sockets and frame rate every few seconds to JSONL
+Then fits every series: slope per hour plus a Kendall trend score, flagging steady growth
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from interactions import FRONTEND_URL, INTERACTIONS, login
+from results_store import record_report
+
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+# /spatial flows only - anything that navigates away restarts the page being soaked
+# (dock-navigation clicks Settings, and the next prepare() reloads /spatial)
+DEFAULT_ACTIONS = ('dock-panels', 'timeline-scrub', 'floating-ai')
+
+# Series that should stay flat; fps is checked for decline instead
+GROWTH_SERIES = ('heap_used_mb', 'dom_nodes', 'renderer_nodes', 'js_listeners', 'open_sockets', 'documents')
+
+# Kendall tau at or above this means most later samples sit above earlier ones
+MONOTONIC_TAU = 0.6
+MIN_GROWTH_PCT = 5
+MIN_SAMPLES = 10
+
+FPS_COUNTER_JS = '''
+(() => {
+  const state = window.__burnwiseFps = { count: 0, lastCount: 0, lastTime: performance.now() };
+  const tick = () => { state.count++; requestAnimationFrame(tick); };
+  requestAnimationFrame(tick);
+})();
+'''
+
+READ_PAGE_JS = '''() => {
+    const state = window.__burnwiseFps;
+    let fps = null;
+    if (state) {
+        const now = performance.now();
+        fps = 1000 * (state.count - state.lastCount) / Math.max(1, now - state.lastTime);
+        state.lastCount = state.count;
+        state.lastTime = now;
+    }
+    return { fps, domNodes: document.getElementsByTagName('*').length };
+}'''
+
+
+def kendall_tau(values: List[float]) -> float:
+    """Mann-Kendall trend score in [-1, 1] against sample order; O(n) memory for long soaks"""
+    x = np.asarray(values, dtype=np.float64)
+    n = len(x)
+    if n < 2:
+        return 0.0
+    s = sum(float(np.sign(x[i + 1:] - x[i]).sum()) for i in range(n - 1))
+    return s / (n * (n - 1) / 2)
+
+
+def trend(times_s: List[float], values: List[float]) -> Optional[Dict[str, float]]:
+    """Least-squares slope per hour, Kendall tau and growth from the first to the last tenth"""
+    pairs = [(t, v) for t, v in zip(times_s, values) if v is not None]
+    if len(pairs) < MIN_SAMPLES:
+        return None
+    t = np.array([p[0] for p in pairs]) / 3600
+    y = np.array([p[1] for p in pairs], dtype=np.float64)
+    edge = max(1, len(y) // 10)
+    head, tail = float(np.median(y[:edge])), float(np.median(y[-edge:]))
+    return {
+        'first': round(float(y[0]), 2),
+        'last': round(float(y[-1]), 2),
+        'min': round(float(y.min()), 2),
+        'max': round(float(y.max()), 2),
+        'slope_per_hour': round(float(np.polyfit(t, y, 1)[0]), 3) if np.ptp(t) > 0 else 0.0,
+        'tau': round(kendall_tau(y), 3),
+        'growth_pct': round(100 * (tail - head) / head, 1) if head else 0.0,
+    }
+
+
+class SoakSampler:
+    """One long-lived page, an actor replaying interactions and a sampler streaming metrics"""
+
+    def __init__(self, duration_min: float = 60, interval_s: float = 5, actions=DEFAULT_ACTIONS,
+                 pause_s: float = 20, warmup_min: float = 2, gc: bool = True,
+                 output: str = 'soak-timeseries.jsonl', frontend: str = FRONTEND_URL):
+        self.duration_min = duration_min
+        self.interval_s = interval_s
+        self.actions = [INTERACTIONS[name] for name in actions]
+        self.pause_s = pause_s
+        self.warmup_min = warmup_min
+        self.gc = gc
+        self.output = output
+        self.frontend = frontend
+        self.samples: List[Dict] = []
+        self.action_counts: Dict[str, int] = {name: 0 for name in actions}
+        self.sockets = set()
+        # Main-frame navigations after the soak started: route changes and full reloads
+        self.navigations: List[Dict] = []
+        self.soak_start: Optional[float] = None
+        self.analysis: Dict[str, Dict] = {}
+        self.critical: List[str] = []
+        self.warnings: List[str] = []
+
+    async def act(self, page, deadline: float):
+        """Cycle through the interactions until the soak ends"""
+        i = 0
+        while time.monotonic() < deadline:
+            interaction = self.actions[i % len(self.actions)]
+            try:
+                await interaction.prepare(page, self.frontend)
+                await interaction.run(page)
+                self.action_counts[interaction.name] += 1
+            except Exception as e:
+                print(f"   ⚠️ {interaction.name} failed: {str(e).splitlines()[0]}")
+            i += 1
+            await asyncio.sleep(min(self.pause_s, max(0, deadline - time.monotonic())))
+
+    def on_navigation(self, page, frame):
+        if frame is not page.main_frame or self.soak_start is None:
+            return
+        navigation = {'t': round(time.monotonic() - self.soak_start, 1), 'url': frame.url}
+        self.navigations.append(navigation)
+        print(f"   ⚠️ Main frame navigated at {navigation['t'] / 60:.1f}m: {frame.url}")
+
+    async def sample(self, client, page, elapsed_s: float) -> Dict:
+        if self.gc:
+            # Growth that survives a full collection is retained, not just unswept
+            await client.send('HeapProfiler.collectGarbage')
+        metrics = {m['name']: m['value'] for m in (await client.send('Performance.getMetrics'))['metrics']}
+        in_page = await page.evaluate(READ_PAGE_JS)
+        return {
+            't': round(elapsed_s, 1),
+            'timestamp': datetime.now().isoformat(),
+            'heap_used_mb': round(metrics.get('JSHeapUsedSize', 0) / 1024 / 1024, 2),
+            'heap_total_mb': round(metrics.get('JSHeapTotalSize', 0) / 1024 / 1024, 2),
+            'dom_nodes': in_page['domNodes'],
+            # Renderer-wide count includes detached nodes still reachable from JS
+            'renderer_nodes': metrics.get('Nodes'),
+            'js_listeners': metrics.get('JSEventListeners'),
+            'documents': metrics.get('Documents'),
+            'open_sockets': len(self.sockets),
+            'navigations': len(self.navigations),
+            'fps': round(in_page['fps'], 1) if in_page['fps'] is not None else None,
+        }
+
+    async def run(self, headless: bool = False) -> Dict:
+        from playwright.async_api import async_playwright
+
+        print(f"🕰️ BURNWISE SOAK: {self.duration_min:g} min on /spatial, sampling every {self.interval_s:g}s")
+        print(f"   Streaming to {self.output}")
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            context = await browser.new_context(viewport=VIEWPORT)
+            await context.add_init_script(FPS_COUNTER_JS)
+            page = await context.new_page()
+
+            client = await context.new_cdp_session(page)
+            await client.send('Performance.enable')
+            await client.send('Network.enable')
+            client.on('Network.webSocketCreated', lambda e: self.sockets.add(e['requestId']))
+            client.on('Network.webSocketClosed', lambda e: self.sockets.discard(e['requestId']))
+
+            await login(page, self.frontend)
+            await page.wait_for_selector('.dock-icon', timeout=15000)
+            page.on('framenavigated', lambda frame: self.on_navigation(page, frame))
+
+            start = self.soak_start = time.monotonic()
+            deadline = start + self.duration_min * 60
+            actor = asyncio.create_task(self.act(page, deadline))
+            with open(self.output, 'w') as stream:
+                while time.monotonic() < deadline:
+                    try:
+                        sample = await self.sample(client, page, time.monotonic() - start)
+                    except Exception as e:
+                        print(f"   ⚠️ Sample skipped: {str(e).splitlines()[0]}")
+                    else:
+                        self.samples.append(sample)
+                        stream.write(json.dumps(sample) + '\n')
+                        stream.flush()
+                        if len(self.samples) % 12 == 1:
+                            print(f"   {sample['t'] / 60:6.1f}m heap {sample['heap_used_mb']:7.1f}MB "
+                                  f"nodes {sample['dom_nodes']:>6} listeners {sample['js_listeners']:>6.0f} "
+                                  f"sockets {sample['open_sockets']} fps {sample['fps']}")
+                    await asyncio.sleep(self.interval_s)
+            await actor
+
+            await client.detach()
+            await browser.close()
+
+        self.analyze()
+        self.print_report()
+        self.save()
+        return self.analysis
+
+    def analyze(self):
+        if self.navigations:
+            # Every reload starts a fresh heap and DOM - the series is a sawtooth, not one session
+            self.critical.append(f"❌ main frame navigated {len(self.navigations)} times during the soak "
+                                 f"(first at {self.navigations[0]['t'] / 60:.1f}m, {self.navigations[0]['url']}) "
+                                 f"- growth trends only cover the samples before it")
+        steady = [s for s in self.samples if s['t'] >= self.warmup_min * 60 and not s['navigations']]
+        times = [s['t'] for s in steady]
+        for name in GROWTH_SERIES + ('fps',):
+            result = trend(times, [s[name] for s in steady])
+            if result is None:
+                continue
+            self.analysis[name] = result
+            if name == 'fps':
+                if result['tau'] <= -MONOTONIC_TAU and result['growth_pct'] <= -MIN_GROWTH_PCT:
+                    self.warnings.append(f"⚠️ fps declines steadily: {result['growth_pct']:.0f}% over the soak "
+                                         f"(tau {result['tau']:.2f})")
+            elif result['tau'] >= MONOTONIC_TAU and result['growth_pct'] >= MIN_GROWTH_PCT:
+                result['flagged'] = True
+                self.critical.append(f"❌ {name} grows monotonically: {result['slope_per_hour']:+.1f}/h, "
+                                     f"{result['growth_pct']:+.0f}% (tau {result['tau']:.2f})")
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        print(f"{len(self.samples)} samples, actions {self.action_counts}")
+        print(f"{'series':<16} {'first':>10} {'last':>10} {'slope/h':>10} {'tau':>6} {'growth':>8}")
+        for name, r in self.analysis.items():
+            print(f"{name:<16} {r['first']:>10.1f} {r['last']:>10.1f} {r['slope_per_hour']:>10.2f} "
+                  f"{r['tau']:>6.2f} {r['growth_pct']:>7.1f}%")
+        for line in self.critical + self.warnings:
+            print(f"   {line}")
+
+    def save(self):
+        metrics = {'samples': len(self.samples), 'duration_min': self.duration_min,
+                   'navigations': len(self.navigations)}
+        for name, r in self.analysis.items():
+            metrics.update({f'{name}_slope_per_hour': r['slope_per_hour'], f'{name}_tau': r['tau'],
+                            f'{name}_growth_pct': r['growth_pct']})
+        record_report('soak', metrics, critical=self.critical, warnings=self.warnings,
+                      route='/spatial', viewport=f"{VIEWPORT['width']}x{VIEWPORT['height']}",
+                      profile=f'{self.duration_min:g}m')
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'duration_min': self.duration_min,
+            'interval_s': self.interval_s,
+            'warmup_min': self.warmup_min,
+            'gc_before_sample': self.gc,
+            'actions': self.action_counts,
+            'navigations': self.navigations,
+            'timeseries': self.output,
+            'analysis': self.analysis,
+            'critical': self.critical,
+            'warnings': self.warnings,
+        }
+        with open('soak-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to soak-report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Long-running /spatial session with a streamed metric time series')
+    parser.add_argument('--duration', type=float, default=60, help='Soak length in minutes')
+    parser.add_argument('--interval', type=float, default=5, help='Seconds between samples')
+    parser.add_argument('--action', action='append', choices=sorted(INTERACTIONS),
+                        help=f"Interaction to replay (repeatable, default: {', '.join(DEFAULT_ACTIONS)})")
+    parser.add_argument('--pause', type=float, default=20, help='Idle seconds between interactions')
+    parser.add_argument('--warmup', type=float, default=2, help='Minutes excluded from the trend analysis')
+    parser.add_argument('--no-gc', action='store_true', help='Sample without forcing a collection first')
+    parser.add_argument('--output', default='soak-timeseries.jsonl')
+    parser.add_argument('--frontend', default=FRONTEND_URL)
+    parser.add_argument('--headless', action='store_true')
+    args = parser.parse_args(argv)
+
+    sampler = SoakSampler(args.duration, args.interval, args.action or DEFAULT_ACTIONS, args.pause, args.warmup,
+                          not args.no_gc, args.output, args.frontend)
+    asyncio.run(sampler.run(args.headless))
+    return 1 if sampler.critical else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Socket.io Fan-out Benchmark
+Hundreds to thousands of Socket.io connections spread over farm rooms, then farm events
+published into those rooms: publish-to-receive latency percentiles, missed deliveries,
+background broadcast volume and server memory per connection
+
+The published event is join-farm -> farm-member-joined, the same io.to(`farm-${id}`) path
+alerts.js uses for farm-alert, and the only room broadcast a client can trigger itself
+Speaks Engine.IO v4 / Socket.IO v5 over local_http's WebSocket frames - no client library
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bench_common import percentile
+from local_http import (
+    OP_CLOSE, OP_CONTINUATION, OP_PING, OP_PONG, OP_TEXT, Request, connect_websocket, encode_frame,
+    fetch, read_frame,
+)
+from results_store import record_report
+
+DEFAULT_BACKEND = 'http://localhost:5001'
+FRONTEND_ORIGIN = 'http://localhost:3000'
+SOCKET_PATH = '/socket.io/?EIO=4&transport=websocket'
+
+CONNECTION_COUNTS = (100, 500, 1000, 2000)
+PUBLISHED_EVENT = 'farm-member-joined'
+
+
+class SocketIOClient:
+    """One Socket.IO connection on the default namespace"""
+
+    def __init__(self, on_event: Callable[['SocketIOClient', str, object, float], None]):
+        self.on_event = on_event
+        self.sid: Optional[str] = None
+        self.connected = asyncio.Event()
+        self.closed = False
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def connect(self, backend: str, timeout: float = 10):
+        request = Request('GET', SOCKET_PATH, [('Origin', FRONTEND_ORIGIN)])
+        reader, self._writer = await asyncio.wait_for(connect_websocket(backend, request), timeout)
+        self._task = asyncio.create_task(self._read(reader))
+        await asyncio.wait_for(self.connected.wait(), timeout)
+
+    def _send(self, opcode: int, payload: bytes):
+        if not self.closed and self._writer:
+            self._writer.write(encode_frame(opcode, payload, masked=True))
+
+    def _send_text(self, text: str):
+        self._send(OP_TEXT, text.encode())
+
+    def emit(self, event: str, data):
+        self._send_text('42' + json.dumps([event, data]))
+
+    async def _read(self, reader: asyncio.StreamReader):
+        buffer = b''
+        try:
+            while True:
+                fin, opcode, payload = await read_frame(reader)
+                if opcode == OP_PING:
+                    self._send(OP_PONG, payload)
+                    continue
+                if opcode == OP_CLOSE:
+                    break
+                if opcode not in (OP_TEXT, OP_CONTINUATION):
+                    continue
+                buffer += payload
+                if fin:
+                    self._packet(buffer.decode(), time.perf_counter())
+                    buffer = b''
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.closed = True
+
+    def _packet(self, packet: str, received: float):
+        kind, body = packet[:1], packet[1:]
+        if kind == '0':                  # Engine.IO open -> Socket.IO connect
+            self._send_text('40')
+        elif kind == '2':                # Engine.IO ping
+            self._send_text('3')
+        elif kind == '4' and body[:1] == '0':
+            self.sid = json.loads(body[1:] or '{}').get('sid')
+            self.connected.set()
+        elif kind == '4' and body[:1] == '2':
+            event = json.loads(body[1:].lstrip('0123456789'))
+            self.on_event(self, event[0], event[1] if len(event) > 1 else None, received)
+
+    async def close(self):
+        if self._writer and not self.closed:
+            self._send_text('41')
+            self._send(OP_CLOSE, b'')
+            self.closed = True
+            try:
+                await self._writer.drain()
+            except ConnectionError:
+                pass
+            self._writer.close()
+        if self._task:
+            self._task.cancel()
+
+
+class FanoutRound:
+    """Everything one connection count produced"""
+
+    def __init__(self, connections: int):
+        self.connections = connections
+        self.connect_ms: List[float] = []
+        self.connect_failures = 0
+        # publisher sid -> perf_counter at each publish, in order
+        self.published: Dict[str, List[float]] = defaultdict(list)
+        # (receiver, publisher sid) -> receive times of PUBLISHED_EVENT, in order
+        self.received: Dict[Tuple[int, str], List[float]] = defaultdict(list)
+        self.background: Dict[str, int] = defaultdict(int)
+        self.measuring = False
+
+
+class SocketFanoutBenchmark:
+    """Delivery latency and fan-out cost of Socket.io farm rooms as connections grow"""
+
+    def __init__(self, backend: str = DEFAULT_BACKEND, counts=CONNECTION_COUNTS, rooms: int = 50,
+                 events: int = 100, rate: float = 20, connect_concurrency: int = 100,
+                 settle_s: float = 2, grace_s: float = 5, budget_ms: float = 250, timeout: float = 10):
+        self.backend = backend
+        self.counts = counts
+        self.rooms = rooms
+        self.events = events
+        self.rate = rate
+        self.connect_concurrency = connect_concurrency
+        self.settle_s = settle_s
+        self.grace_s = grace_s
+        self.budget_ms = budget_ms
+        self.timeout = timeout
+        self.results: Dict[int, Dict] = {}
+        self.critical: List[str] = []
+        self.warnings: List[str] = []
+
+    async def server_stats(self) -> Optional[Dict]:
+        try:
+            response = await fetch(self.backend, Request('GET', '/health/sockets', []), self.timeout)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        return json.loads(response.body) if response.status == 200 else None
+
+    async def open_clients(self, run: FanoutRound) -> List[SocketIOClient]:
+        index: Dict[int, int] = {}
+
+        def on_event(client: SocketIOClient, event: str, data, received: float):
+            if not run.measuring:
+                return
+            if event == PUBLISHED_EVENT and isinstance(data, dict):
+                key = (index[id(client)], data.get('socketId'))
+                run.received[key].append(received)
+            else:
+                run.background[event] += 1
+
+        clients = [SocketIOClient(on_event) for _ in range(run.connections)]
+        for i, client in enumerate(clients):
+            index[id(client)] = i
+        gate = asyncio.Semaphore(self.connect_concurrency)
+
+        async def connect(client: SocketIOClient, farm: int):
+            async with gate:
+                start = time.perf_counter()
+                try:
+                    await client.connect(self.backend, self.timeout)
+                except (OSError, ConnectionError, asyncio.TimeoutError):
+                    run.connect_failures += 1
+                    return
+                run.connect_ms.append((time.perf_counter() - start) * 1000)
+                client.emit('join-farm', farm)
+
+        await asyncio.gather(*[connect(c, i % self.rooms + 1) for i, c in enumerate(clients)])
+        return clients
+
+    async def publish(self, run: FanoutRound, clients: List[SocketIOClient]):
+        # First live client in each room publishes for it
+        publishers: Dict[int, SocketIOClient] = {}
+        for i, client in enumerate(clients):
+            if client.sid and not client.closed:
+                publishers.setdefault(i % self.rooms + 1, client)
+        farms = sorted(publishers)
+        run.measuring = True
+        start = time.perf_counter()
+        for n in range(self.events):
+            # Fixed schedule, so a slow server shows up as latency, not a lower event rate
+            await asyncio.sleep(max(0.0, start + n / self.rate - time.perf_counter()))
+            farm = farms[n % len(farms)]
+            publisher = publishers[farm]
+            run.published[publisher.sid].append(time.perf_counter())
+            publisher.emit('join-farm', farm)
+        await asyncio.sleep(self.grace_s)
+        run.measuring = False
+        return publishers, time.perf_counter() - start
+
+    @staticmethod
+    async def loop_lag(stop: asyncio.Event, samples: List[float]):
+        """How late this process wakes up - when it grows, the harness is the bottleneck"""
+        while not stop.is_set():
+            before = time.perf_counter()
+            await asyncio.sleep(0.05)
+            samples.append((time.perf_counter() - before - 0.05) * 1000)
+
+    def deliveries(self, run: FanoutRound, clients: List[SocketIOClient],
+                   publishers: Dict[int, SocketIOClient]) -> Dict:
+        farm_of = {c.sid: farm for farm, c in publishers.items()}
+        latency, server_to_client, expected, received = [], [], 0, 0
+        for i, client in enumerate(clients):
+            if not client.sid:
+                continue
+            farm = i % self.rooms + 1
+            publisher = publishers.get(farm)
+            if not publisher:
+                continue
+            sent = run.published[publisher.sid]
+            got = run.received.get((i, publisher.sid), [])
+            expected += len(sent)
+            received += min(len(sent), len(got))
+            # Per-connection order is preserved end to end, so the k-th receipt is the k-th publish
+            latency.extend((r - s) * 1000 for s, r in zip(sent, got))
+        # A publisher's event seen by a socket in another farm's room
+        stray = sum(len(v) for (i, sid), v in run.received.items()
+                    if sid in farm_of and farm_of[sid] != i % self.rooms + 1)
+        return {
+            'expected': expected,
+            'received': received,
+            'missed': expected - received,
+            'stray': stray,
+            'latency_ms_p50': round(percentile(latency, 50), 2),
+            'latency_ms_p95': round(percentile(latency, 95), 2),
+            'latency_ms_p99': round(percentile(latency, 99), 2),
+            'latency_ms_max': round(max(latency), 2) if latency else 0.0,
+        }
+
+    async def run_count(self, connections: int) -> Dict:
+        run = FanoutRound(connections)
+        baseline = await self.server_stats()
+        lag: List[float] = []
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(self.loop_lag(stop, lag))
+        start = time.perf_counter()
+        clients = await self.open_clients(run)
+        connect_s = time.perf_counter() - start
+        # Every join fans out to the room so far - let that storm drain before measuring
+        await asyncio.sleep(self.settle_s)
+        loaded = await self.server_stats()
+        lag.clear()
+        publishers, publish_s = await self.publish(run, clients)
+        stop.set()
+        await lag_task
+        for client in clients:
+            await client.close()
+
+        result = {
+            'connections': connections,
+            'connected': len(run.connect_ms),
+            'connect_failures': run.connect_failures,
+            'connect_s': round(connect_s, 2),
+            'connect_ms_p95': round(percentile(run.connect_ms, 95), 1),
+            'room_size': round(connections / self.rooms, 1),
+            'events': self.events,
+            **self.deliveries(run, clients, publishers),
+            'background_events_per_conn_s': {event: round(count / len(run.connect_ms) / publish_s, 3)
+                                             for event, count in run.background.items()} if run.connect_ms else {},
+            'client_loop_lag_ms_p95': round(percentile(lag, 95), 1),
+        }
+        if baseline and loaded and loaded['connections'] > baseline['connections']:
+            added = loaded['connections'] - baseline['connections']
+            result['server_connections'] = loaded['connections']
+            result['rss_kb_per_conn'] = round((loaded['memory']['rss'] - baseline['memory']['rss']) / 1024 / added, 1)
+            result['heap_kb_per_conn'] = round(
+                (loaded['memory']['heapUsed'] - baseline['memory']['heapUsed']) / 1024 / added, 1)
+        self.assess(result)
+        return result
+
+    def assess(self, result: Dict):
+        n = result['connections']
+        if result['connect_failures']:
+            self.critical.append(f"❌ {n} connections: {result['connect_failures']} failed to connect")
+        if result['missed']:
+            self.critical.append(f"❌ {n} connections: {result['missed']} of {result['expected']} "
+                                 f"room deliveries missed")
+        if result['latency_ms_p95'] > self.budget_ms:
+            self.warnings.append(f"⚠️ {n} connections: p95 delivery {result['latency_ms_p95']:.0f}ms "
+                                 f"> {self.budget_ms:.0f}ms")
+        if result['client_loop_lag_ms_p95'] > self.budget_ms / 5:
+            self.warnings.append(f"⚠️ {n} connections: harness event loop lagged "
+                                 f"{result['client_loop_lag_ms_p95']:.0f}ms p95 - latency includes the client")
+        if result['stray']:
+            self.warnings.append(f"⚠️ {n} connections: {result['stray']} {PUBLISHED_EVENT} events "
+                                 f"reached sockets outside the room")
+
+    async def run(self) -> Dict:
+        print("📡 BURNWISE SOCKET.IO FAN-OUT BENCHMARK")
+        print(f"   {list(self.counts)} connections over {self.rooms} farm rooms, "
+              f"{self.events} events at {self.rate:.0f}/s each")
+        if await self.server_stats() is None:
+            self.warnings.append("⚠️ GET /health/sockets unavailable (production backend?) - no server memory per connection")
+        for connections in self.counts:
+            self.results[connections] = result = await self.run_count(connections)
+            memory = (f", {result['rss_kb_per_conn']:.0f}KB RSS/conn" if 'rss_kb_per_conn' in result else '')
+            print(f"   {connections:>6} conns: p50 {result['latency_ms_p50']:>7.1f}ms p95 "
+                  f"{result['latency_ms_p95']:>7.1f}ms p99 {result['latency_ms_p99']:>7.1f}ms, "
+                  f"missed {result['missed']}/{result['expected']}{memory}, "
+                  f"connect {result['connect_s']:.1f}s")
+            if result['connected'] == 0:
+                break
+        self.print_report()
+        self.save()
+        return self.results
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        ok = [n for n, r in self.results.items() if r['latency_ms_p95'] <= self.budget_ms and not r['missed']]
+        if ok:
+            print(f"✅ Deliveries within {self.budget_ms:.0f}ms p95 and none missed up to {max(ok):,} connections")
+        else:
+            print(f"❌ No connection count kept deliveries within {self.budget_ms:.0f}ms p95 without misses")
+        background = defaultdict(float)
+        for result in self.results.values():
+            for event, rate in result['background_events_per_conn_s'].items():
+                background[event] = max(background[event], rate)
+        for event, rate in sorted(background.items(), key=lambda item: -item[1])[:5]:
+            print(f"   Background broadcast {event}: up to {rate:.3f}/s per connection")
+        for line in self.critical + self.warnings:
+            print(f"   {line}")
+
+    def save(self):
+        for connections, result in self.results.items():
+            metrics = {k: v for k, v in result.items() if isinstance(v, (int, float)) and not isinstance(v, bool)}
+            prefix = f"{connections} connections:"
+            record_report('socket-fanout', metrics,
+                          critical=[m for m in self.critical if prefix in m],
+                          warnings=[m for m in self.warnings if prefix in m],
+                          route='/socket.io', profile=f'c{connections}')
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'backend': self.backend,
+            'rooms': self.rooms,
+            'rate': self.rate,
+            'budget_ms': self.budget_ms,
+            'counts': self.results,
+            'critical': self.critical,
+            'warnings': self.warnings,
+        }
+        with open('socket-fanout-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to socket-fanout-report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Socket.io publish-to-receive latency and fan-out benchmark')
+    parser.add_argument('--backend', default=DEFAULT_BACKEND)
+    parser.add_argument('--connections', type=int, nargs='+', default=list(CONNECTION_COUNTS))
+    parser.add_argument('--rooms', type=int, default=50, help='Farm rooms the connections spread over')
+    parser.add_argument('--events', type=int, default=100, help='Room events published per connection count')
+    parser.add_argument('--rate', type=float, default=20, help='Events published per second')
+    parser.add_argument('--connect-concurrency', type=int, default=100)
+    parser.add_argument('--settle', type=float, default=2, help='Seconds for the join storm to drain')
+    parser.add_argument('--grace', type=float, default=5, help='Seconds to wait for late deliveries')
+    parser.add_argument('--budget-ms', type=float, default=250, help='p95 delivery latency budget')
+    args = parser.parse_args(argv)
+
+    bench = SocketFanoutBenchmark(args.backend, sorted(args.connections), args.rooms, args.events, args.rate,
+                                  args.connect_concurrency, args.settle, args.grace, args.budget_ms)
+    asyncio.run(bench.run())
+    return 1 if bench.critical else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
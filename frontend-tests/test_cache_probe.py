@@ -0,0 +1,33 @@
+"""QueryCacheModel against the counters backend/db/queryCache.js reports"""
+
+from cache_probe import QueryCacheModel, page_accesses
+
+# Same sequence and numbers as backend/tests/database/queryCache.test.js ('mixed sequence ...')
+SEQUENCE = [(0, 'a'), (10, 'b'), (20, 'c'), (30, 'a'), (40, 'd'), (50, 'b'), (1005, 'c'), (1100, 'a')]
+
+
+def test_model_matches_query_cache_counters():
+    model = QueryCacheModel(max_size=3)
+    for now, key in SEQUENCE:
+        model.access(key, now, 1000)
+    assert (model.hits, model.misses, model.evictions, model.expirations) == (1, 7, 2, 3)
+    assert list(model.entries) == ['c', 'a']
+
+
+def test_hit_refreshes_recency_not_ttl():
+    model = QueryCacheModel(max_size=2)
+    model.access('a', 0, 100)
+    model.access('b', 1, 100)
+    assert model.access('a', 2, 100)
+    model.access('c', 3, 100)
+    assert list(model.entries) == ['a', 'c']
+    # a's TTL still runs from its set at t=0
+    assert not model.access('a', 100, 100)
+    assert model.expirations == 1
+
+
+def test_page_accesses_working_set_past_max_size():
+    # The shared COUNT(*) key takes a slot; four pages cycling through the other three always miss
+    pages = list(range(4)) * 5
+    assert page_accesses(pages, [0.0] * len(pages), max_size=4, warmup=4) == 0.5
+    assert page_accesses(pages, [0.0] * len(pages), max_size=5, warmup=4) == 1.0
@@ -0,0 +1,46 @@
+"""parse_color / parse_colors on the forms getComputedStyle and the brand palette use, plus palette clustering"""
+
+import math
+
+import numpy as np
+import pytest
+
+from color_analysis import ColorPaletteAnalyzer, parse_color, parse_colors
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('rgb(255, 87, 34)', (255, 87, 34, 1.0)),
+    ('rgba(0, 0, 0, 0.5)', (0, 0, 0, 0.5)),
+    ('rgb(10 20 30 / 40%)', (10, 20, 30, 0.4)),
+    ('  rgba(1,2,3,0)  ', (1, 2, 3, 0.0)),
+    ('transparent', (0, 0, 0, 0)),
+    ('#ff5722', (255, 87, 34, 1.0)),
+    ('#FFF', (255, 255, 255, 1.0)),
+    ('#0008', (0, 0, 0, 136 / 255)),
+    ('#ff572280', (255, 87, 34, 128 / 255)),
+])
+def test_parse_color(value, expected):
+    assert parse_color(value) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('value', ['', 'red', 'hsl(0, 100%, 50%)', '#12345', '#ggg', 'var(--fire)'])
+def test_unparseable_is_nan(value):
+    assert all(math.isnan(channel) for channel in parse_color(value))
+
+
+def test_parse_colors_keeps_order_and_repeats():
+    colors = parse_colors(['#000', 'rgb(255, 255, 255)', '#000', 'nope'])
+    assert colors.shape == (4, 4)
+    assert colors[0].tolist() == colors[2].tolist() == [0, 0, 0, 1]
+    assert colors[1].tolist() == [255, 255, 255, 1]
+    assert math.isnan(colors[3, 0])
+
+
+def test_cluster_joins_nearest_center_that_outranks_it():
+    rgb = np.array([[0, 0, 0], [40, 0, 0], [25, 0, 0], [22, 0, 0], [200, 0, 0]], dtype=float)
+    counts = np.array([10, 5, 1, 8, 2])
+    labels, centers = ColorPaletteAnalyzer(cluster_distance=30.0)._cluster(rgb, counts)
+    assert centers.tolist() == [[0, 0, 0], [40, 0, 0], [200, 0, 0]]
+    # (25,0,0) is ranked after both centers and sits nearer (40,0,0); (22,0,0) is nearer (40,0,0)
+    # too, but outranks it, so only (0,0,0) existed when it was placed
+    assert labels.tolist() == [0, 1, 1, 0, 2]
@@ -0,0 +1,73 @@
+"""Mann-Whitney U, its normal tail and the gate's significance + effect-size rule"""
+
+import math
+
+import pytest
+
+from regression_gate import compare, mann_whitney_u, one_sided_p
+
+
+def test_u_without_ties():
+    # Complete separation, n1 = n2 = 5: U = 25, sigma = sqrt(25 * 11 / 12)
+    u, z = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+    assert u == 25
+    assert z == pytest.approx((12.5 - 0.5) / math.sqrt(25 * 11 / 12))
+    assert one_sided_p(z) == pytest.approx(0.006093, abs=1e-6)
+
+
+def test_u_with_ties():
+    # Ranks 1, 3, 3, 3, 5.5, 5.5, 7, 8 -> candidate rank sum 23.5, U = 23.5 - 10 = 13.5
+    # Tie groups of 3 and 2: sum(t^3 - t) = 30, sigma = sqrt(16 / 12 * (9 - 30 / 56))
+    u, z = mann_whitney_u([1, 2, 2, 3], [2, 3, 4, 5])
+    assert u == 13.5
+    assert z == pytest.approx((5.5 - 0.5) / math.sqrt(16 / 12 * (9 - 30 / 56)))
+    assert one_sided_p(z) == pytest.approx(0.068329, abs=1e-6)
+
+
+def test_u_is_symmetric():
+    baseline, candidate = [3, 1, 4, 1, 5], [9, 2, 6, 5]
+    u, z = mann_whitney_u(baseline, candidate)
+    u_swapped, z_swapped = mann_whitney_u(candidate, baseline)
+    assert u + u_swapped == len(baseline) * len(candidate)
+    assert z == pytest.approx(-z_swapped)
+
+
+def test_identical_samples_have_no_z():
+    assert mann_whitney_u([7, 7, 7], [7, 7, 7]) == (4.5, 0.0)
+    assert one_sided_p(0.0) == 0.5
+
+
+@pytest.mark.parametrize('metric,baseline,candidate,delta', [
+    ('frame_ms', [1, 2, 3], [4, 5, 6], 1.0),
+    ('frame_ms', [4, 5, 6], [1, 2, 3], -1.0),
+    ('frame_ms', [5, 5, 5], [5, 5, 5], 0.0),
+    # Higher fps is better, so a drop is the regression direction
+    ('fps', [58, 59, 60], [30, 31, 32], 1.0),
+    ('fps', [30, 31, 32], [58, 59, 60], -1.0),
+])
+def test_cliffs_delta_bounds(metric, baseline, candidate, delta):
+    assert compare(metric, baseline, candidate).cliffs_delta == delta
+
+
+def test_change_below_three_percent_passes():
+    baseline = [100 + 0.01 * i for i in range(20)]
+    near = compare('frame_ms', baseline, [v * 1.0299 for v in baseline])
+    assert near.p_value < 0.01 and near.cliffs_delta == 1.0
+    assert not near.regressed
+    assert compare('frame_ms', baseline, [v * 1.0301 for v in baseline]).regressed
+
+
+def test_effect_size_below_a_third_passes():
+    # Shifting 0..59 by k + 0.5 gives Cliff's delta 0.319 at k = 10 and 0.347 at k = 11, both significant
+    baseline = [float(i) for i in range(60)]
+    small = compare('frame_ms', baseline, [i + 10.5 for i in range(60)])
+    assert small.p_value < 0.01 and small.change_pct >= 3
+    assert small.cliffs_delta == pytest.approx(0.319, abs=1e-3)
+    assert not small.regressed
+    assert compare('frame_ms', baseline, [i + 11.5 for i in range(60)]).regressed
+
+
+def test_improvement_never_regresses():
+    baseline = [float(i) for i in range(30)]
+    assert not compare('frame_ms', baseline, [v / 2 for v in baseline]).regressed
+    assert not compare('fps', baseline, [v * 2 for v in baseline]).regressed
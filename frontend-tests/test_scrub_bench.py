@@ -0,0 +1,18 @@
+"""dropped_frames on rAF timestamps at 60Hz"""
+
+from scrub_bench import FRAME_MS, dropped_frames
+
+
+def test_steady_60hz_drops_nothing():
+    assert dropped_frames([i * FRAME_MS for i in range(30)]) == 0
+
+
+def test_gaps_count_the_missing_vsyncs():
+    frames = [0, FRAME_MS, 3 * FRAME_MS, 3 * FRAME_MS + 100]
+    # One frame missing in the second gap, 100ms is six vsyncs so five more
+    assert dropped_frames(frames) == 1 + 5
+
+
+def test_jitter_within_half_a_frame_is_not_a_drop():
+    assert dropped_frames([0, 20, 30, 52]) == 0
+    assert dropped_frames([]) == dropped_frames([5.0]) == 0
@@ -0,0 +1,33 @@
+"""kendall_tau and trend: the growth detector behind soak mode's verdicts"""
+
+import pytest
+
+from soak import MIN_SAMPLES, kendall_tau, trend
+
+
+@pytest.mark.parametrize('values,tau', [
+    ([1, 2, 3, 4, 5], 1.0),
+    ([5, 4, 3, 2, 1], -1.0),
+    ([3, 3, 3, 3], 0.0),
+    ([1, 3, 2, 4], 4 / 6),
+    ([7], 0.0),
+])
+def test_kendall_tau(values, tau):
+    assert kendall_tau(values) == pytest.approx(tau)
+
+
+def test_trend_of_steady_growth():
+    times = [i * 360.0 for i in range(20)]  # every 6 minutes
+    result = trend(times, [100 + 2 * i for i in range(20)])
+    assert result['slope_per_hour'] == pytest.approx(20)
+    assert result['tau'] == 1.0
+    assert (result['first'], result['last'], result['min'], result['max']) == (100, 138, 100, 138)
+    # First and last tenth are two samples each: medians 101 and 137
+    assert result['growth_pct'] == pytest.approx(35.6)
+
+
+def test_trend_skips_missing_and_short_series():
+    assert trend(list(range(MIN_SAMPLES - 1)), [1.0] * (MIN_SAMPLES - 1)) is None
+    values = [None if i % 2 else 50.0 for i in range(2 * MIN_SAMPLES)]
+    result = trend(list(range(2 * MIN_SAMPLES)), values)
+    assert result['slope_per_hour'] == 0 and result['tau'] == 0 and result['growth_pct'] == 0
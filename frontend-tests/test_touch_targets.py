@@ -0,0 +1,52 @@
+"""Pointer-jumping ancestor fold against a walk up the parent chain"""
+
+import random
+
+import numpy as np
+
+from touch_targets import TouchTargetAnalyzer
+
+
+def random_tree(n: int, seed: int) -> np.ndarray:
+    rng = random.Random(seed)
+    # Document order: every parent comes before its children
+    return np.array([-1] + [rng.randrange(i) if rng.random() > 0.05 else -1 for i in range(1, n)])
+
+
+def ancestors(parent: np.ndarray, i: int):
+    i = parent[i]
+    while i >= 0:
+        yield i
+        i = parent[i]
+
+
+def test_or_fold_matches_parent_walk():
+    for seed in range(5):
+        parent = random_tree(300, seed)
+        candidates = np.random.default_rng(seed).random(len(parent)) < 0.1
+        folded = TouchTargetAnalyzer._fold_ancestors(parent, candidates, np.logical_or, False)
+        expected = [any(candidates[a] for a in ancestors(parent, i)) for i in range(len(parent))]
+        assert folded.tolist() == expected
+
+
+def test_clip_fold_intersects_every_ancestor_box():
+    parent = random_tree(200, 7)
+    rng = np.random.default_rng(7)
+    corner = rng.uniform(0, 500, size=(len(parent), 2))
+    rects = np.column_stack([corner, corner + rng.uniform(50, 800, size=(len(parent), 2))])
+    unbounded = np.array([-np.inf, -np.inf, np.inf, np.inf])
+    clips = rng.random(len(parent)) < 0.3
+    own = np.where(clips[:, None], rects, unbounded)
+
+    folded = TouchTargetAnalyzer._fold_ancestors(parent, own, TouchTargetAnalyzer._intersect, unbounded)
+    for i in range(len(parent)):
+        expected = unbounded.copy()
+        for a in ancestors(parent, i):
+            expected = TouchTargetAnalyzer._intersect(expected[None], own[a][None])[0]
+        assert folded[i].tolist() == expected.tolist()
+
+
+def test_root_and_orphans_fold_to_empty():
+    parent = np.array([-1, 0, -1, 2])
+    folded = TouchTargetAnalyzer._fold_ancestors(parent, np.array([True, False, False, False]), np.logical_or, False)
+    assert folded.tolist() == [False, True, False, False]
@@ -0,0 +1,58 @@
+"""Trace.forced_layouts pairing and busy-time merging on hand-built trace events"""
+
+from trace_events import REFLOW_CATEGORIES, Trace
+
+MAIN = {'ph': 'M', 'name': 'thread_name', 'pid': 1, 'tid': 2, 'args': {'name': 'CrRendererMain'}}
+
+
+def stack(function: str, line: int = 3) -> dict:
+    return {'beginData': {'stackTrace': [
+        {'url': 'http://localhost:3000/static/js/main.js', 'functionName': function,
+         'lineNumber': line, 'columnNumber': 7},
+    ]}}
+
+
+def event(name: str, ts: float, dur: float, args=None, tid: int = 2) -> dict:
+    return {'ph': 'X', 'name': name, 'pid': 1, 'tid': tid, 'ts': ts, 'dur': dur, 'args': args or {}}
+
+
+def test_reflow_categories_capture_stacks():
+    assert 'disabled-by-default-devtools.timeline.stack' in REFLOW_CATEGORIES
+
+
+def test_offset_height_read_is_one_reflow():
+    trace = Trace([MAIN, event('UpdateLayoutTree', 10, 100, stack('measure')),
+                   event('Layout', 120, 300, stack('measure'))])
+    [reflow] = trace.forced_layouts()
+    assert reflow['name'] == 'Layout'
+    assert reflow['dur'] == 400
+    assert reflow['phases'] == ['UpdateLayoutTree', 'Layout']
+
+
+def test_unpaired_passes_count_on_their_own():
+    trace = Trace([
+        MAIN,
+        event('UpdateLayoutTree', 0, 50, stack('computedStyle')),
+        event('UpdateLayoutTree', 100, 40, stack('measure')),
+        event('Layout', 150, 60, stack('other')),
+        event('Layout', 300, 80, stack('layoutOnly')),
+    ])
+    assert [(r['name'], r['dur']) for r in trace.forced_layouts()] == [
+        ('UpdateLayoutTree', 50), ('UpdateLayoutTree', 40), ('Layout', 60), ('Layout', 80),
+    ]
+
+
+def test_lifecycle_passes_and_other_threads_are_not_forced():
+    trace = Trace([
+        MAIN,
+        event('UpdateLayoutTree', 0, 40),
+        event('Layout', 50, 90),
+        event('Layout', 200, 10, stack('worker'), tid=9),
+    ])
+    assert trace.forced_layouts() == []
+
+
+def test_busy_ms_counts_nested_events_once():
+    trace = Trace([MAIN])
+    events = [event('A', 0, 1000), event('B', 200, 300), event('C', 2000, 500)]
+    assert trace.busy_ms(events) == 1.5
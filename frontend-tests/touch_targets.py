@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Touch Target Analyzer
+EVERY interactive element on the page, straight from the DOMSnapshot
+Effective hit area after clipping AND occlusion - one vectorized pass, no clicking
+"""
+
+import sys
+from typing import Dict, List
+from dataclasses import dataclass, field
+
+import numpy as np
+
+MIN_TOUCH_TARGET = 44  # px, WCAG 2.5.5 / Apple HIG
+
+INTERACTIVE_TAGS = {'button', 'a', 'input', 'select', 'textarea', 'summary'}
+INTERACTIVE_ROLES = {
+    'button', 'link', 'tab', 'menuitem', 'checkbox', 'radio', 'switch',
+    'slider', 'option', 'combobox', 'textbox',
+}
+
+# Elements this big are delegation roots (React attaches its listeners to the
+# app container), not real click targets
+CONTAINER_VIEWPORT_SHARE = 0.9
+
+# Sample points per axis inside each target when testing occlusion
+SAMPLES_PER_AXIS = 5
+
+
+@dataclass
+class TouchTargetReport:
+    """Every interactive element with its effective hit area"""
+    target_count: int = 0
+    undersized: List[Dict] = field(default_factory=list)
+    blocked: List[Dict] = field(default_factory=list)
+    clipped: List[Dict] = field(default_factory=list)
+
+
+class TouchTargetAnalyzer:
+    """Find every interactive element and measure what a finger can actually hit"""
+
+    def __init__(self, min_size: float = MIN_TOUCH_TARGET, blocked_fraction: float = 0.5):
+        self.min_size = min_size
+        self.blocked_fraction = blocked_fraction
+
+    def _is_interactive(self, el, parent) -> bool:
+        if el.tag in INTERACTIVE_TAGS:
+            # <a> without href and hidden inputs are not targets
+            if el.tag == 'a' and 'href' not in el.attributes:
+                return False
+            if el.tag == 'input' and el.attributes.get('type') == 'hidden':
+                return False
+            return True
+        if el.attributes.get('role') in INTERACTIVE_ROLES:
+            return True
+        if 'onclick' in el.attributes:
+            return True
+        tabindex = el.attributes.get('tabindex')
+        if tabindex is not None and tabindex.lstrip('-').isdigit() and int(tabindex) >= 0:
+            return True
+        # cursor is inherited - only the element that *sets* pointer is the target
+        if el.styles.get('cursor') == 'pointer':
+            return parent is None or parent.styles.get('cursor') != 'pointer'
+        return el.is_clickable
+
+    def analyze(self, snapshot) -> TouchTargetReport:
+        elements = snapshot.elements
+        report = TouchTargetReport()
+        n = len(elements)
+        if n == 0:
+            return report
+
+        position = {el.node_index: i for i, el in enumerate(elements)}
+        parent = np.array([position.get(el.parent_index, -1) for el in elements], dtype=np.int64)
+        rects = np.array([(el.x, el.y, el.x + el.width, el.y + el.height) for el in elements], dtype=np.float64)
+        visible = np.array([el.visible for el in elements])
+        hittable = visible & np.array([el.styles.get('pointer-events') != 'none' for el in elements])
+        paint_order = np.array([el.paint_order for el in elements], dtype=np.int64)
+        viewport = np.array([0, 0, snapshot.viewport_width, snapshot.viewport_height], dtype=np.float64)
+
+        candidates = np.array([
+            visible[i] and self._is_interactive(el, elements[parent[i]] if parent[i] >= 0 else None)
+            for i, el in enumerate(elements)
+        ])
+        area = (rects[:, 2] - rects[:, 0]) * (rects[:, 3] - rects[:, 1])
+        candidates &= area < CONTAINER_VIEWPORT_SHARE * viewport[2] * viewport[3]
+
+        # Nested interactive elements (svg inside a button...) belong to the outer target
+        targets = candidates & ~self._has_candidate_ancestor(parent, candidates)
+        target_idx = np.flatnonzero(targets)
+        report.target_count = len(target_idx)
+        if len(target_idx) == 0:
+            return report
+
+        clip = self._ancestor_clips(elements, parent, rects)
+        effective = self._intersect(rects[target_idx], clip[target_idx])
+        eff_w = np.clip(effective[:, 2] - effective[:, 0], 0, None)
+        eff_h = np.clip(effective[:, 3] - effective[:, 1], 0, None)
+
+        clipped_out = (eff_w * eff_h == 0) & (area[target_idx] > 0)
+        undersized = ~clipped_out & ((eff_w < self.min_size) | (eff_h < self.min_size))
+
+        hidden = self._occluded_fraction(
+            target_idx, self._intersect(effective, viewport[None, :]),
+            rects, hittable, paint_order, self._subtree_end(parent),
+        )
+        blocked = ~clipped_out & (hidden >= self.blocked_fraction)
+
+        def describe(k):
+            el = elements[target_idx[k]]
+            return {
+                'element': el.name,
+                'width': round(float(eff_w[k]), 1),
+                'height': round(float(eff_h[k]), 1),
+                'rect_width': round(el.width, 1),
+                'rect_height': round(el.height, 1),
+                'hidden_fraction': round(float(hidden[k]), 2),
+            }
+
+        report.clipped = [describe(k) for k in np.flatnonzero(clipped_out)]
+        report.undersized = [describe(k) for k in np.flatnonzero(undersized)]
+        report.blocked = [describe(k) for k in np.flatnonzero(blocked)]
+        return report
+
+    @staticmethod
+    def _intersect(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return np.column_stack([
+            np.maximum(a[:, 0], b[:, 0]), np.maximum(a[:, 1], b[:, 1]),
+            np.minimum(a[:, 2], b[:, 2]), np.minimum(a[:, 3], b[:, 3]),
+        ])
+
+    @staticmethod
+    def _fold_ancestors(parent: np.ndarray, own: np.ndarray, combine, empty) -> np.ndarray:
+        """Pointer jumping: combine `own` over every strict ancestor in O(log depth) passes"""
+        def expand(mask):
+            return mask.reshape(-1, *([1] * (own.ndim - 1)))
+
+        jump = parent
+        has = jump >= 0
+        safe = np.where(has, jump, 0)
+        acc = np.where(expand(has), own[safe], empty)
+        while has.any():
+            acc = combine(acc, np.where(expand(has), acc[safe], empty))
+            jump = np.where(has, jump[safe], -1)
+            has = jump >= 0
+            safe = np.where(has, jump, 0)
+        return acc
+
+    def _has_candidate_ancestor(self, parent: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        return self._fold_ancestors(parent, candidates, np.logical_or, False)
+
+    def _ancestor_clips(self, elements, parent: np.ndarray, rects: np.ndarray) -> np.ndarray:
+        """Intersection of every overflow-clipping ancestor box"""
+        unbounded = np.array([-np.inf, -np.inf, np.inf, np.inf])
+        clips_children = np.array([
+            el.styles.get('overflow-x', 'visible') != 'visible' or
+            el.styles.get('overflow-y', 'visible') != 'visible'
+            for el in elements
+        ])
+        # A fixed element escapes the clipping of everything above it
+        escapes = np.array([el.styles.get('position') == 'fixed' for el in elements])
+        own = np.where(clips_children[:, None], rects, unbounded)
+        return self._fold_ancestors(np.where(escapes, -1, parent), own, self._intersect, unbounded)
+
+    @staticmethod
+    def _subtree_end(parent: np.ndarray) -> np.ndarray:
+        """Last descendant position of each element (elements come in document order)"""
+        end = np.arange(len(parent))
+        for i in range(len(parent) - 1, -1, -1):
+            if parent[i] >= 0 and end[i] > end[parent[i]]:
+                end[parent[i]] = end[i]
+        return end
+
+    def _occluded_fraction(self, target_idx, boxes, rects, hittable, paint_order, subtree_end) -> np.ndarray:
+        """Share of sample points inside each target won by an unrelated, later-painted element"""
+        m = len(target_idx)
+        steps = (np.arange(SAMPLES_PER_AXIS) + 0.5) / SAMPLES_PER_AXIS
+        width = np.clip(boxes[:, 2] - boxes[:, 0], 0, None)
+        height = np.clip(boxes[:, 3] - boxes[:, 1], 0, None)
+        px = boxes[:, 0, None, None] + width[:, None, None] * steps[None, None, :]
+        py = boxes[:, 1, None, None] + height[:, None, None] * steps[None, :, None]
+        px = np.broadcast_to(px, (m, SAMPLES_PER_AXIS, SAMPLES_PER_AXIS)).reshape(m, -1)
+        py = np.broadcast_to(py, (m, SAMPLES_PER_AXIS, SAMPLES_PER_AXIS)).reshape(m, -1)
+
+        occluders = np.flatnonzero(hittable)
+        o_rects = rects[occluders]
+        t = target_idx[:, None]
+        o = occluders[None, :]
+        related = ((o >= t) & (o <= subtree_end[t])) | ((t >= o) & (t <= subtree_end[o]))
+        above = (paint_order[o] > paint_order[t]) & ~related  # (m, k)
+
+        hidden = np.zeros(m)
+        sampled = (width > 0) & (height > 0)
+        for k in np.flatnonzero(sampled & above.any(axis=1)):
+            cand = o_rects[above[k]]
+            inside = (
+                (px[k][:, None] >= cand[None, :, 0]) & (px[k][:, None] < cand[None, :, 2]) &
+                (py[k][:, None] >= cand[None, :, 1]) & (py[k][:, None] < cand[None, :, 3])
+            )
+            hidden[k] = inside.any(axis=1).mean()
+        return hidden
+
+
+def print_report(report: TouchTargetReport):
+    print(f"\n👆 TOUCH TARGETS: {report.target_count} interactive elements")
+    for label, items in (('UNDERSIZED', report.undersized), ('BLOCKED', report.blocked), ('CLIPPED OUT', report.clipped)):
+        if items:
+            print(f"\n❌ {label} ({len(items)}):")
+            for item in items[:15]:
+                print(f"   {item['element'][:60]}: {item['width']}x{item['height']}px effective, "
+                      f"{item['hidden_fraction'] * 100:.0f}% covered")
+
+
+if __name__ == "__main__":
+    from dom_snapshot import PageSnapshot
+
+    if len(sys.argv) != 2:
+        print("Usage: touch_targets.py <capture.json>")
+        sys.exit(1)
+
+    print_report(TouchTargetAnalyzer().analyze(PageSnapshot.load(sys.argv[1])))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Chrome Trace Helpers
+Parses Tracing output into process/thread lookups and busy-time numbers
+Shared by every mode that records a Chromium trace
+"""
+
+import json
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Enough for renderer main thread, GPU process and compositor attribution
+DEFAULT_CATEGORIES = [
+    'toplevel',
+    'devtools.timeline',
+    'disabled-by-default-devtools.timeline',
+    'disabled-by-default-devtools.timeline.frame',
+    'v8.execute',
+    'blink.user_timing',
+    'gpu',
+    'viz',
+    'cc',
+]
+
+# Stack capture makes Chrome attach the requesting JS stack to forced style/layout passes;
+# it slows the traced page down, so only modes that call forced_layouts() pay for it
+REFLOW_CATEGORIES = DEFAULT_CATEGORIES + ['disabled-by-default-devtools.timeline.stack']
+
+# Renderer main-thread events that mean "JavaScript is running"
+SCRIPT_EVENTS = {
+    'FunctionCall', 'EvaluateScript', 'v8.compile', 'v8.callFunction',
+    'FireAnimationFrame', 'TimerFire', 'EventDispatch', 'v8.run',
+}
+
+# Renderer main-thread work by pipeline phase
+RENDERING_PHASES = {
+    'script': SCRIPT_EVENTS,
+    'style': {'UpdateLayoutTree', 'RecalculateStyles', 'ParseAuthorStyleSheet'},
+    'layout': {'Layout'},
+    'paint': {'PrePaint', 'Paint', 'PaintImage', 'UpdateLayerTree', 'Layerize', 'Commit'},
+    'gc': {'MinorGC', 'MajorGC', 'V8.GC_SCAVENGER', 'V8.GC_MARK_COMPACTOR'},
+}
+
+
+class Trace:
+    """A parsed trace with process and thread names resolved"""
+
+    def __init__(self, events: List[Dict]):
+        self.events = events
+        self.process_names: Dict[int, str] = {}
+        self.thread_names: Dict[Tuple[int, int], str] = {}
+        for event in events:
+            if event.get('ph') != 'M':
+                continue
+            if event.get('name') == 'process_name':
+                self.process_names[event['pid']] = event['args'].get('name', '')
+            elif event.get('name') == 'thread_name':
+                self.thread_names[(event['pid'], event['tid'])] = event['args'].get('name', '')
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Trace':
+        """Decode what Browser.stop_tracing / Tracing.end hands back"""
+        parsed = json.loads(data)
+        events = parsed['traceEvents'] if isinstance(parsed, dict) else parsed
+        return cls(events)
+
+    def pids(self, process_name: str) -> List[int]:
+        return [pid for pid, name in self.process_names.items() if name == process_name]
+
+    def threads(self, thread_name: str, pid: Optional[int] = None) -> List[Tuple[int, int]]:
+        return [
+            key for key, name in self.thread_names.items()
+            if name == thread_name and (pid is None or key[0] == pid)
+        ]
+
+    def renderer_main(self) -> List[Tuple[int, int]]:
+        return self.threads('CrRendererMain')
+
+    def complete_events(self, names: Optional[Iterable[str]] = None,
+                        threads: Optional[Iterable[Tuple[int, int]]] = None,
+                        pids: Optional[Iterable[int]] = None) -> List[Dict]:
+        """Duration ('X') events, optionally filtered by name, thread or process"""
+        names = set(names) if names is not None else None
+        threads = set(threads) if threads is not None else None
+        pids = set(pids) if pids is not None else None
+        selected = []
+        for event in self.events:
+            if event.get('ph') != 'X':
+                continue
+            if names is not None and event.get('name') not in names:
+                continue
+            if threads is not None and (event['pid'], event['tid']) not in threads:
+                continue
+            if pids is not None and event['pid'] not in pids:
+                continue
+            selected.append(event)
+        return selected
+
+    def busy_ms(self, events: List[Dict]) -> float:
+        """Wall time covered by the events per thread, nested events counted once"""
+        by_thread = defaultdict(list)
+        for event in events:
+            by_thread[(event['pid'], event['tid'])].append((event['ts'], event['ts'] + event.get('dur', 0)))
+
+        total_us = 0.0
+        for intervals in by_thread.values():
+            intervals.sort()
+            start, end = intervals[0]
+            for s, e in intervals[1:]:
+                if s > end:
+                    total_us += end - start
+                    start, end = s, e
+                else:
+                    end = max(end, e)
+            total_us += end - start
+        return total_us / 1000
+
+    def script_ms(self) -> float:
+        """JavaScript execution on the renderer main thread"""
+        return self.busy_ms(self.complete_events(SCRIPT_EVENTS, threads=self.renderer_main()))
+
+    def gpu_process_ms(self) -> float:
+        """Busy time of every thread in the GPU process"""
+        return self.busy_ms(self.complete_events(pids=self.pids('GPU Process')))
+
+    def phase_ms(self) -> Dict[str, float]:
+        """Renderer main-thread busy time per rendering phase"""
+        main = self.renderer_main()
+        return {
+            phase: round(self.busy_ms(self.complete_events(names, threads=main)), 3)
+            for phase, names in RENDERING_PHASES.items()
+        }
+
+    def forced_layouts(self) -> List[Dict]:
+        """One entry per synchronous reflow JavaScript forced; needs a REFLOW_CATEGORIES trace
+
+        Reading offsetHeight traces as a style recalc then a Layout, both carrying the requesting
+        stack - the pair becomes one entry, the Layout with 'dur' covering both and 'phases' naming
+        them. A forced recalc with no Layout after it (getComputedStyle) is an entry of its own.
+        """
+        style = RENDERING_PHASES['style']
+        stacked = sorted(
+            (event for event in self.complete_events(style | RENDERING_PHASES['layout'], threads=self.renderer_main())
+             if event.get('args', {}).get('beginData', {}).get('stackTrace')),
+            key=lambda event: event['ts'],
+        )
+
+        reflows: List[Dict] = []
+        pending: Optional[Dict] = None
+        for event in stacked:
+            entry = {**event, 'phases': [event['name']]}
+            if event['name'] in style:
+                if pending:
+                    reflows.append(pending)
+                pending = entry
+                continue
+            if pending and _origin(pending) == _origin(event):
+                entry['dur'] = pending.get('dur', 0) + event.get('dur', 0)
+                entry['phases'] = pending['phases'] + entry['phases']
+            elif pending:
+                reflows.append(pending)
+            reflows.append(entry)
+            pending = None
+        if pending:
+            reflows.append(pending)
+        return reflows
+
+
+def _origin(event: Dict) -> Tuple:
+    """Thread and innermost JS frame that asked for a forced style/layout pass"""
+    frame = event['args']['beginData']['stackTrace'][0]
+    return (event['pid'], event['tid'], frame.get('url'), frame.get('functionName'),
+            frame.get('lineNumber'), frame.get('columnNumber'))
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+BURNWISE Vector Similarity Search Benchmark
+Seeds 10k-1M synthetic weather, plume and burn-history vectors into a scratch database on a
+local TiDB, then times the exact statements backend/db/vectorOperations.js builds at several
+k and filter settings - recall against NumPy brute force, and EXPLAIN for vector index use
+
+Needs a TiDB with TiFlash for the vector index (e.g. `tiup playground --tiflash 1`) and PyMySQL;
+--offline prices the NumPy brute force alone
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from bench_common import percentile
+from results_store import record_report
+
+SIZES = (10_000, 100_000, 1_000_000)
+KS = (5, 10, 50)
+SHAPES = ('nearest', 'similar', 'filtered', 'threshold')
+
+# Weather regimes / plume shapes / burn outcomes - rows cluster, they are not uniform noise
+CLUSTERS = 256
+CLUSTER_SPREAD = 0.18   # total noise variance per unit vector: ~0.15 cosine distance inside a cluster
+QUERY_SPREAD = 0.05
+DISTANCE_THRESHOLD = 0.2
+
+SCRATCH_DATABASE = 'burnwise_vector_bench'
+
+
+@dataclass(frozen=True)
+class VectorTable:
+    """One schema.sql table with a VECTOR column, reduced to what the search touches"""
+    name: str
+    column: str
+    dims: int
+    filter_column: str
+    # Distinct filter values; None = a new value every 3 rows (predictions per burn request)
+    filter_cardinality: Optional[int]
+
+    def filter_ids(self, start: int, stop: int) -> np.ndarray:
+        rows = np.arange(start, stop)
+        if self.filter_cardinality is None:
+            return rows // 3 + 1
+        return rows * 7919 % self.filter_cardinality + 1
+
+
+TABLES = {
+    'weather_data': VectorTable('weather_data', 'weather_vector', 128, 'location_id', 200),
+    'smoke_predictions': VectorTable('smoke_predictions', 'plume_vector', 64, 'burn_request_id', None),
+    'burn_history': VectorTable('burn_history', 'history_vector', 32, 'farm_id', 500),
+}
+
+# The statements vectorOperations.js builds, its ? placeholders as %s
+SQL = {
+    # findNearestNeighbors(table, column, q, k, { selectColumns: 'id' })
+    'nearest': ("SELECT id, VEC_COSINE_DISTANCE({column}, %s) as distance FROM {table} "
+                "ORDER BY distance ASC LIMIT %s"),
+    # searchSimilarVectors(table, column, q, k)
+    'similar': ("SELECT *, 1 - VEC_COSINE_DISTANCE({column}, %s) as similarity FROM {table} "
+                "ORDER BY similarity DESC LIMIT %s"),
+    # searchSimilarVectors(table, column, q, k, { [filter_column]: value })
+    'filtered': ("SELECT *, 1 - VEC_COSINE_DISTANCE({column}, %s) as similarity FROM {table} "
+                 "WHERE {filter} = %s ORDER BY similarity DESC LIMIT %s"),
+    # findNearestNeighbors(table, column, q, k, { selectColumns: 'id', distanceThreshold })
+    'threshold': ("SELECT id, VEC_COSINE_DISTANCE({column}, %s) as distance FROM {table} "
+                  "WHERE VEC_COSINE_DISTANCE({column}, %s) < %s ORDER BY distance ASC LIMIT %s"),
+}
+
+
+def _unit(x: np.ndarray) -> np.ndarray:
+    return (x / np.linalg.norm(x, axis=-1, keepdims=True)).astype(np.float32)
+
+
+def vector_literal(v: np.ndarray) -> str:
+    """What JSON.stringify(vector) sends - TiDB casts the string to VECTOR"""
+    return '[' + ','.join(map(str, np.round(v.astype(float), 6).tolist())) + ']'
+
+
+class SyntheticVectors:
+    """Clustered unit vectors generated chunk by chunk - every prefix is reproducible from the seed"""
+
+    def __init__(self, table: VectorTable, capacity: int, seed: int = 0):
+        self.table = table
+        self.seed = seed
+        rng = np.random.default_rng([seed, table.dims])
+        self.centroids = _unit(rng.normal(size=(CLUSTERS, table.dims)))
+        self.vectors = np.empty((capacity, table.dims), dtype=np.float32)
+        self.filters = table.filter_ids(0, capacity)
+        self.size = 0
+
+    def grow(self, n: int) -> Tuple[int, int]:
+        """Generate rows [size, n); returns the new row range"""
+        start = self.size
+        rng = np.random.default_rng([self.seed, self.table.dims, start])
+        which = rng.integers(0, CLUSTERS, n - start)
+        noise = rng.normal(0, np.sqrt(CLUSTER_SPREAD / self.table.dims), (n - start, self.table.dims))
+        self.vectors[start:n] = _unit(self.centroids[which] + noise)
+        self.size = n
+        return start, n
+
+    def queries(self, count: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+        """'Find days like today': near-copies of stored rows, with the source row's filter value"""
+        rng = np.random.default_rng([self.seed, self.table.dims, seed, self.size])
+        rows = rng.integers(0, self.size, count)
+        noise = rng.normal(0, np.sqrt(QUERY_SPREAD / self.table.dims), (count, self.table.dims))
+        return _unit(self.vectors[rows] + noise), self.filters[rows]
+
+    def exact(self, query: np.ndarray, k: int, filter_value: Optional[int] = None,
+              threshold: Optional[float] = None) -> np.ndarray:
+        """Brute-force top-k ids (id = row + 1) by cosine distance"""
+        distance = 1 - self.vectors[:self.size] @ query
+        candidates = np.arange(self.size)
+        if filter_value is not None:
+            candidates = candidates[self.filters[:self.size] == filter_value]
+        if threshold is not None:
+            candidates = candidates[distance[candidates] < threshold]
+        if candidates.size > k:
+            candidates = candidates[np.argpartition(distance[candidates], k)[:k]]
+        return candidates[np.argsort(distance[candidates])] + 1
+
+
+def recall(returned: List[int], expected: np.ndarray) -> float:
+    if expected.size == 0:
+        return 1.0 if not returned else 0.0
+    return len(set(returned) & set(expected.tolist())) / expected.size
+
+
+class VectorDatabase:
+    """Scratch database on a MySQL-protocol server; never touches the app's own schema"""
+
+    def __init__(self, host: str, port: int, user: str, password: str, database: str):
+        try:
+            import pymysql
+        except ImportError:
+            raise SystemExit("❌ The database run needs PyMySQL (pip install pymysql) - or use --offline")
+        self.database = database
+        self.conn = pymysql.connect(host=host, port=port, user=user, password=password, autocommit=True)
+        self.execute(f'CREATE DATABASE IF NOT EXISTS {database}')
+        self.execute(f'USE {database}')
+
+    def execute(self, sql: str, params=None) -> List[Tuple]:
+        with self.conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return list(cursor.fetchall())
+
+    def supports_vectors(self) -> Optional[str]:
+        try:
+            self.execute("SELECT VEC_COSINE_DISTANCE('[1,0]', '[0,1]')")
+            return None
+        except Exception as e:
+            return str(e)
+
+    def create(self, table: VectorTable):
+        self.execute(f'DROP TABLE IF EXISTS {table.name}')
+        self.execute(f'''
+            CREATE TABLE {table.name} (
+                id INT PRIMARY KEY,
+                {table.filter_column} INT NOT NULL,
+                {table.column} VECTOR({table.dims}),
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                INDEX idx_{table.filter_column} ({table.filter_column})
+            )''')
+
+    def add_vector_index(self, table: VectorTable):
+        # Same DDL as critical-fixes.sql: the index lives on a TiFlash replica
+        self.execute(f'ALTER TABLE {table.name} ADD VECTOR INDEX idx_{table.column} '
+                     f'((VEC_COSINE_DISTANCE({table.column}))) ADD_COLUMNAR_REPLICA_ON_DEMAND')
+
+    def insert(self, table: VectorTable, data: SyntheticVectors, start: int, stop: int, batch: int):
+        """batchInsertWithVectors: one multi-row INSERT per batch"""
+        sql = f'INSERT INTO {table.name} (id, {table.filter_column}, {table.column}) VALUES (%s, %s, %s)'
+        with self.conn.cursor() as cursor:
+            for lo in range(start, stop, batch):
+                hi = min(stop, lo + batch)
+                cursor.executemany(sql, [(row + 1, int(data.filters[row]), vector_literal(data.vectors[row]))
+                                         for row in range(lo, hi)])
+
+    def wait_for_index(self, table: VectorTable, timeout_s: float) -> Optional[float]:
+        """Seconds until TiFlash has every row indexed; None if it never got there"""
+        start = time.perf_counter()
+        try:
+            self.execute(f'ALTER TABLE {table.name} COMPACT')
+        except Exception:
+            pass  # Compaction only speeds the index build up
+        while time.perf_counter() - start < timeout_s:
+            try:
+                available = self.execute(
+                    'SELECT AVAILABLE FROM information_schema.tiflash_replica WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s',
+                    (self.database, table.name))
+                pending = self.execute(
+                    'SELECT COALESCE(SUM(ROWS_STABLE_NOT_INDEXED + ROWS_DELTA_NOT_INDEXED), 0) '
+                    'FROM information_schema.tiflash_indexes WHERE TIDB_DATABASE = %s AND TIDB_TABLE = %s',
+                    (self.database, table.name))
+            except Exception:
+                return None
+            if available and available[0][0] and pending and int(pending[0][0]) == 0:
+                return time.perf_counter() - start
+            time.sleep(1)
+        return None
+
+    def plan(self, sql: str, params) -> Tuple[str, str]:
+        """('ann-index' | 'full-scan' | 'other', plan text)"""
+        rows = self.execute(f"EXPLAIN FORMAT='brief' {sql}", params)
+        text = '\n'.join(' '.join(str(c) for c in row) for row in rows)
+        if 'annindex' in text.lower():
+            return 'ann-index', text
+        return ('full-scan' if 'TableFullScan' in text else 'other'), text
+
+    def drop(self, table: VectorTable):
+        self.execute(f'DROP TABLE IF EXISTS {table.name}')
+
+    def close(self, keep: bool):
+        if not keep:
+            self.execute(f'DROP DATABASE IF EXISTS {self.database}')
+        self.conn.close()
+
+
+def shape_params(shape: str, query: str, k: int, filter_value: int) -> Tuple:
+    return {
+        'nearest': (query, k),
+        'similar': (query, k),
+        'filtered': (query, filter_value, k),
+        'threshold': (query, query, DISTANCE_THRESHOLD, k),
+    }[shape]
+
+
+def exact_for(data: SyntheticVectors, shape: str, query: np.ndarray, k: int, filter_value: int) -> np.ndarray:
+    if shape == 'filtered':
+        return data.exact(query, k, filter_value=filter_value)
+    if shape == 'threshold':
+        return data.exact(query, k, threshold=DISTANCE_THRESHOLD)
+    return data.exact(query, k)
+
+
+class VectorBenchmark:
+    """Latency, recall and index use of the backend's vector searches as history grows"""
+
+    def __init__(self, tables=tuple(TABLES), sizes=SIZES, ks=KS, shapes=SHAPES, queries: int = 20,
+                 batch: int = 1000, budget_ms: float = 100, recall_floor: float = 0.9, index: bool = True,
+                 index_timeout_s: float = 600, seed: int = 0, db: Optional[Dict] = None, keep: bool = False):
+        self.tables = [TABLES[name] for name in tables]
+        self.sizes = sizes
+        self.ks = ks
+        self.shapes = shapes
+        self.queries = queries
+        self.batch = batch
+        self.budget_ms = budget_ms
+        self.recall_floor = recall_floor
+        self.index = index
+        self.index_timeout_s = index_timeout_s
+        self.seed = seed
+        self.db_config = db
+        self.keep = keep
+        self.db: Optional[VectorDatabase] = None
+        self.results: Dict[str, Dict[int, Dict]] = {}
+        self.critical: List[str] = []
+        self.warnings: List[str] = []
+        self.breaking_points: Dict[str, Dict[str, Optional[int]]] = {}
+
+    def brute_force(self, data: SyntheticVectors, k: int) -> Dict:
+        """What the same search costs in-process - the floor any database number is compared to"""
+        queries, _ = data.queries(self.queries, seed=1)
+        timings = []
+        for q in queries:
+            start = time.perf_counter()
+            data.exact(q, k)
+            timings.append((time.perf_counter() - start) * 1000)
+        return {'numpy_ms_p50': round(percentile(timings, 50), 3), 'numpy_ms_p95': round(percentile(timings, 95), 3)}
+
+    def run_shape(self, table: VectorTable, data: SyntheticVectors, shape: str, k: int) -> Dict:
+        sql = SQL[shape].format(table=table.name, column=table.column, filter=table.filter_column)
+        queries, filters = data.queries(self.queries + 2, seed=k)
+        timings, recalls = [], []
+        for i, (q, f) in enumerate(zip(queries, filters)):
+            literal = vector_literal(q)
+            start = time.perf_counter()
+            rows = self.db.execute(sql, shape_params(shape, literal, k, int(f)))
+            elapsed = (time.perf_counter() - start) * 1000
+            if i < 2:
+                continue  # warm-up: plan cache, TiFlash segment load
+            timings.append(elapsed)
+            recalls.append(recall([row[0] for row in rows], exact_for(data, shape, q, k, int(f))))
+        access, plan = self.db.plan(sql, shape_params(shape, vector_literal(queries[0]), k, int(filters[0])))
+        return {
+            'p50_ms': round(percentile(timings, 50), 2),
+            'p95_ms': round(percentile(timings, 95), 2),
+            'recall': round(float(np.mean(recalls)), 4),
+            'min_recall': round(float(np.min(recalls)), 4),
+            'access': access,
+            'plan': plan,
+        }
+
+    def run_size(self, table: VectorTable, data: SyntheticVectors, n: int) -> Dict:
+        start, stop = data.grow(n)
+        result: Dict = {'rows': n}
+        if self.db:
+            begin = time.perf_counter()
+            self.db.insert(table, data, start, stop, self.batch)
+            result['seed_rows_per_s'] = round((stop - start) / (time.perf_counter() - begin))
+            if self.index:
+                waited = self.db.wait_for_index(table, self.index_timeout_s)
+                result['index_wait_s'] = None if waited is None else round(waited, 1)
+                if waited is None:
+                    self.warnings.append(f"⚠️ {table.name} n={n}: vector index not fully built within "
+                                         f"{self.index_timeout_s:.0f}s - ANN queries read unindexed rows")
+        result['numpy'] = self.brute_force(data, max(self.ks))
+        result['shapes'] = {}
+        if self.db:
+            for shape in self.shapes:
+                for k in self.ks:
+                    try:
+                        run = self.run_shape(table, data, shape, k)
+                    except Exception as e:
+                        self.critical.append(f"❌ {table.name} n={n}: {shape} k={k} failed - {str(e)}")
+                        continue
+                    result['shapes'][f'{shape}_k{k}'] = run
+                    print(f"   {table.name:18} n={n:>9,} {shape:9} k={k:<3} p50 {run['p50_ms']:>9.2f}ms "
+                          f"p95 {run['p95_ms']:>9.2f}ms recall {run['recall']:.3f} [{run['access']}]")
+        print(f"   {table.name:18} n={n:>9,} numpy brute force k={max(self.ks)}: "
+              f"p50 {result['numpy']['numpy_ms_p50']:.2f}ms")
+        return result
+
+    def run(self) -> Dict:
+        print("🧭 BURNWISE VECTOR SIMILARITY SEARCH BENCHMARK")
+        print(f"   Tables {[t.name for t in self.tables]}, sizes {list(self.sizes)}, k {list(self.ks)}, "
+              f"{self.queries} queries per setting")
+        if self.db_config:
+            self.db = VectorDatabase(**self.db_config)
+            problem = self.db.supports_vectors()
+            if problem:
+                self.db.close(self.keep)
+                raise SystemExit(f"❌ Server has no VEC_COSINE_DISTANCE ({problem}) - it needs TiDB 8.4+")
+        try:
+            for table in self.tables:
+                data = SyntheticVectors(table, max(self.sizes), self.seed)
+                if self.db:
+                    self.db.create(table)
+                    if self.index:
+                        self.db.add_vector_index(table)
+                self.results[table.name] = {}
+                for n in self.sizes:
+                    self.results[table.name][n] = self.run_size(table, data, n)
+                if self.db and not self.keep:
+                    self.db.drop(table)
+        finally:
+            if self.db:
+                self.db.close(self.keep)
+        self.assess()
+        self.print_report()
+        self.save()
+        return self.results
+
+    def assess(self):
+        """Where each search shape falls over, and which never touch the vector index"""
+        for table, sizes in self.results.items():
+            self.breaking_points[table] = {}
+            for shape in self.shapes:
+                runs = [(n, key, run) for n, r in sizes.items()
+                        for key, run in r['shapes'].items() if key.startswith(f'{shape}_k')]
+                if not runs:
+                    continue
+                slow = [n for n, _, run in runs if run['p95_ms'] > self.budget_ms]
+                self.breaking_points[table][shape] = min(slow) if slow else None
+                for n, key, run in runs:
+                    if run['recall'] < self.recall_floor:
+                        self.warnings.append(f"⚠️ {table} n={n}: {key} recall {run['recall']:.3f} "
+                                             f"< {self.recall_floor}")
+                if self.index and all(run['access'] != 'ann-index' for _, _, run in runs):
+                    self.warnings.append(f"⚠️ {table} n={max(sizes)}: {shape} never used the vector index "
+                                         f"({runs[-1][2]['access']})")
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        if not self.db_config:
+            print("Offline: NumPy brute force only")
+        for table, points in self.breaking_points.items():
+            for shape, n in points.items():
+                if n is None:
+                    print(f"✅ {table:18} {shape:9} within {self.budget_ms:.0f}ms p95 at every size")
+                else:
+                    print(f"⚠️ {table:18} {shape:9} over {self.budget_ms:.0f}ms p95 from {n:,} rows")
+        for line in self.critical + self.warnings:
+            print(f"   {line}")
+
+    def save(self):
+        for table, sizes in self.results.items():
+            for n, result in sizes.items():
+                metrics = {'numpy_ms_p50': result['numpy']['numpy_ms_p50']}
+                for key in ('seed_rows_per_s', 'index_wait_s'):
+                    if result.get(key) is not None:
+                        metrics[key] = result[key]
+                for key, run in result['shapes'].items():
+                    metrics[f'{key}_p50_ms'] = run['p50_ms']
+                    metrics[f'{key}_p95_ms'] = run['p95_ms']
+                    metrics[f'{key}_recall'] = run['recall']
+                prefix = f'{table} n={n}:'
+                record_report('vector-search', metrics,
+                              critical=[m for m in self.critical if prefix in m],
+                              warnings=[m for m in self.warnings if prefix in m],
+                              route=table, profile=f'n{n}')
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'offline': not self.db_config,
+            'vector_index': self.index,
+            'seed': self.seed,
+            'budget_ms': self.budget_ms,
+            'breaking_points': self.breaking_points,
+            'tables': self.results,
+            'critical': self.critical,
+            'warnings': self.warnings,
+        }
+        with open('vector-bench-report.json', 'w') as f:
+            json.dump(report, f, indent=2)
+        print("\n📄 Report saved to vector-bench-report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Vector similarity search benchmark at production scale')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=4000)
+    parser.add_argument('--user', default='root')
+    parser.add_argument('--password', default='')
+    parser.add_argument('--database', default=SCRATCH_DATABASE, help='Scratch database, dropped afterwards')
+    parser.add_argument('--tables', nargs='+', choices=list(TABLES), default=list(TABLES))
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--k', type=int, nargs='+', default=list(KS))
+    parser.add_argument('--shapes', nargs='+', choices=SHAPES, default=list(SHAPES))
+    parser.add_argument('--queries', type=int, default=20, help='Timed queries per shape and k')
+    parser.add_argument('--batch', type=int, default=1000, help='Rows per INSERT while seeding')
+    parser.add_argument('--budget-ms', type=float, default=100, help='p95 latency a search must stay under')
+    parser.add_argument('--recall-floor', type=float, default=0.9)
+    parser.add_argument('--no-index', action='store_true', help='Skip the vector index (exact scans only)')
+    parser.add_argument('--index-timeout', type=float, default=600, help='Seconds to wait for the index build')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--keep', action='store_true', help='Leave the scratch database in place')
+    parser.add_argument('--offline', action='store_true', help='NumPy brute force only, no database')
+    args = parser.parse_args(argv)
+
+    if args.database == os.environ.get('TIDB_DATABASE', 'burnwise'):
+        parser.error(f"refusing to seed and drop tables in the application database '{args.database}'")
+    db = None if args.offline else {'host': args.host, 'port': args.port, 'user': args.user,
+                                    'password': args.password, 'database': args.database}
+    bench = VectorBenchmark(args.tables, sorted(args.sizes), sorted(args.k), args.shapes, args.queries,
+                            args.batch, args.budget_ms, args.recall_floor, not args.no_index,
+                            args.index_timeout, args.seed, db, args.keep)
+    bench.run()
+    return 1 if bench.critical else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
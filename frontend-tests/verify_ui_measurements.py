@@ -11,6 +11,14 @@ from typing import Dict, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+# Brand palette every painted color should come from
+PRIMARY_COLORS = {
+    'orange': ['#FF6B35', '#FFA500', '#FF8C00'],
+    'blue': ['#4A90E2', '#5CA0F2', '#3B82F6'],
+    'dark': ['#1A1A1A', '#2D2D2D', '#333333'],
+    'light': ['#FFFFFF', '#F5F5F5', '#FAFAFA']
+}
+
 @dataclass
 class UIElement:
     """Represents a UI element with precise measurements"""
@@ -87,12 +95,7 @@ class UIVerifier:
     
     def verify_color_consistency(self, colors: Dict[str, List[str]]) -> bool:
         """Verify color palette consistency"""
-        primary_colors = {
-            'orange': ['#FF6B35', '#FFA500', '#FF8C00'],
-            'blue': ['#4A90E2', '#5CA0F2', '#3B82F6'],
-            'dark': ['#1A1A1A', '#2D2D2D', '#333333'],
-            'light': ['#FFFFFF', '#F5F5F5', '#FAFAFA']
-        }
+        primary_colors = PRIMARY_COLORS
         
         inconsistent = []
         for component, used_colors in colors.items():
@@ -113,6 +116,48 @@ class UIVerifier:
         self.successes.append(f"✅ Color palette consistent")
         return True
     
+    def verify_palette(self, snapshot) -> bool:
+        """Cluster every painted color on the page and flag near-duplicates/outliers"""
+        from color_analysis import ColorPaletteAnalyzer
+        
+        report = ColorPaletteAnalyzer().analyze_snapshot(snapshot)
+        
+        for dup in report.near_duplicates:
+            self.issues.append(
+                f"❌ Near-duplicate color: {dup['color']} ({dup['count']}x) "
+                f"vs {dup['similar_to']} ({dup['similar_count']}x), distance {dup['distance']}"
+            )
+        for outlier in report.outliers:
+            self.warnings.append(
+                f"⚠️  Off-palette color on {outlier['element']}: {outlier['color']} "
+                f"(nearest brand color: {outlier['nearest_brand']})"
+            )
+        
+        if report.near_duplicates:
+            return False
+        
+        self.successes.append(
+            f"✅ Palette consistent: {len(report.palette)} colors across {report.sample_count} samples"
+        )
+        return True
+    
+    def verify_glass_morphism_page(self, snapshot) -> bool:
+        """Check every blurred element on the page has a see-through background"""
+        from color_analysis import GlassMorphismAnalyzer
+        
+        broken = GlassMorphismAnalyzer().analyze_snapshot(snapshot)
+        for item in broken:
+            self.issues.append(
+                f"❌ Glass morphism broken on {item['element']}: "
+                f"{item['backdrop_filter']} behind opaque {item['background']}"
+            )
+        
+        if broken:
+            return False
+        
+        self.successes.append(f"✅ Glass morphism correct on every blurred element")
+        return True
+    
     def verify_z_index_hierarchy(self, elements: List[UIElement]) -> bool:
         """Verify z-index doesn't cause visual issues"""
         # Expected hierarchy
@@ -142,6 +187,21 @@ class UIVerifier:
         self.successes.append(f"✅ Z-index hierarchy correct")
         return True
     
+    def verify_occlusion(self, occlusion_map, min_fraction: float = 0.25) -> bool:
+        """Verify no interactive control is hidden behind another component's layer"""
+        hidden = occlusion_map.hidden_controls(min_fraction)
+        for item in hidden:
+            self.issues.append(
+                f"❌ {item['element']} ({item['component']}) hidden behind {item['covered_by']}: "
+                f"{item['hidden_fraction'] * 100:.0f}% of its hit area"
+            )
+        
+        if hidden:
+            return False
+        
+        self.successes.append(f"✅ No interactive controls occluded")
+        return True
+    
     def _get_element_type(self, name: str) -> str:
         """Determine element type from name"""
         name_lower = name.lower()
@@ -200,11 +260,29 @@ class UIVerifier:
         
         return "\n".join(report)
 
-if __name__ == "__main__":
-    # This will be populated by Playwright measurements
+def verify_capture(path: str, bulk: bool = True) -> UIVerifier:
+    """Run the snapshot-based checks against a saved DOMSnapshot capture
+
+    bulk adds the NumPy palette and glass morphism passes; without it nothing imports NumPy
+    """
+    # dom_snapshot imports UIElement from this module
+    from dom_snapshot import PageSnapshot
+
+    snapshot = PageSnapshot.load(path)
     verifier = UIVerifier()
-    
-    # Test data will come from Playwright
-    # For now, print structure
-    print("UI Verification Script Ready")
-    print("Waiting for Playwright measurements...")
\ No newline at end of file
+    verifier.verify_z_index_hierarchy([el for el in snapshot.to_ui_elements() if el.z_index])
+    if bulk:
+        verifier.verify_palette(snapshot)
+        verifier.verify_glass_morphism_page(snapshot)
+    return verifier
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: verify_ui_measurements.py <capture.json>")
+        print("   (record one with: audit_cli.py capture --output capture.json)")
+        sys.exit(1)
+
+    verifier = verify_capture(sys.argv[1])
+    print(verifier.generate_report())
+    sys.exit(1 if verifier.issues else 0)
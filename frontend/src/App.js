@@ -19,6 +19,11 @@ const HybridOnboarding = lazy(() => import('./components/HybridOnboarding'));
 const SpatialInterface = lazy(() => import('./components/SpatialInterface'));
 const Settings = lazy(() => import('./components/Settings'));
 
+// Unrouted dashboard variants, mounted side by side for render profiling in development only
+const Dashboard = lazy(() => import('./components/Dashboard'));
+const DashboardOptimized = lazy(() => import('./components/DashboardOptimized'));
+const showPerfRoutes = process.env.NODE_ENV !== 'production';
+
 function AppContent() {
   const location = useLocation();
   const { isAuthenticated } = useAuth();
@@ -69,6 +74,9 @@ function AppContent() {
                 {/* Settings still accessible */}
                 <Route path="/settings" element={<Settings />} />
                 
+                {showPerfRoutes && <Route path="/perf/dashboard" element={<Dashboard />} />}
+                {showPerfRoutes && <Route path="/perf/dashboard-optimized" element={<DashboardOptimized />} />}
+                
                 {/* Catch all - redirect to root */}
                 <Route path="*" element={<Navigate to="/" replace />} />
               </Routes>